@@ -0,0 +1,115 @@
+"""Synthesis output formats (`SpeechSynthesisOutputFormat`) by wire name.
+
+FR-011 fixes the default at RIFF 16 kHz 16-bit mono PCM, which is what
+playback and the combined-WAV tooling consume directly. Archival and delivery
+paths can ask for a compressed format instead (Opus in OGG, MP3), roughly a
+tenth of the bytes, or headerless PCM at another rate.
+
+Formats are named by their service wire names (`riff-24khz-16bit-mono-pcm`,
+`ogg-16khz-16bit-mono-opus`, `audio-24khz-48kbitrate-mono-mp3`, ...), the same
+strings the container receives in `synthesis.context` and that `tts_cache`
+keys on; the short aliases in `ALIASES` resolve to common picks.
+
+Environment override:
+  TTS_OUTPUT_FORMAT  default format name or alias (default riff-16khz-16bit-mono-pcm)
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .wav_utils import WAVE_FORMAT_PCM, WavInfo
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    name: str  # service wire name
+    sdk_name: str  # speechsdk.SpeechSynthesisOutputFormat member
+    container: str  # riff | raw | ogg | mp3
+    sample_rate: int
+    bitrate_kbps: Optional[int] = None  # compressed formats only
+    channels: int = 1
+    sampwidth: int = 2  # bytes per PCM sample (riff/raw)
+
+    @property
+    def is_pcm(self) -> bool:
+        """Uncompressed samples (RIFF WAV or headerless)."""
+        return self.container in ("riff", "raw")
+
+    @property
+    def extension(self) -> str:
+        return {"riff": ".wav", "raw": ".pcm", "ogg": ".ogg", "mp3": ".mp3"}[self.container]
+
+    @property
+    def mime_type(self) -> str:
+        return {"riff": "audio/wav", "raw": "audio/L16", "ogg": "audio/ogg", "mp3": "audio/mpeg"}[self.container]
+
+    def pcm_info(self, data_size: int) -> WavInfo:
+        """Layout of a headerless (raw) payload of `data_size` bytes."""
+        if self.container != "raw":
+            raise ValueError(f"{self.name} is not headerless PCM")
+        return WavInfo(self.channels, self.sampwidth, self.sample_rate, 0, data_size, WAVE_FORMAT_PCM)
+
+
+def _rate_token(rate: int) -> str:
+    return f"{rate // 1000}khz" if rate % 1000 == 0 else f"{rate}hz"
+
+
+def _rate_sdk(rate: int) -> str:
+    return f"{rate // 1000}Khz" if rate % 1000 == 0 else f"{rate}Hz"
+
+
+def _build() -> Dict[str, AudioFormat]:
+    table = []
+    for rate in (8000, 16000, 22050, 24000, 44100, 48000):
+        table.append(AudioFormat(f"riff-{_rate_token(rate)}-16bit-mono-pcm", f"Riff{_rate_sdk(rate)}16BitMonoPcm", "riff", rate))
+        table.append(AudioFormat(f"raw-{_rate_token(rate)}-16bit-mono-pcm", f"Raw{_rate_sdk(rate)}16BitMonoPcm", "raw", rate))
+    for rate in (16000, 24000, 48000):
+        table.append(AudioFormat(f"ogg-{_rate_token(rate)}-16bit-mono-opus", f"Ogg{_rate_sdk(rate)}16BitMonoOpus", "ogg", rate))
+    for rate, kbps in ((16000, 32), (16000, 64), (16000, 128), (24000, 48), (24000, 96), (24000, 160), (48000, 96), (48000, 192)):
+        table.append(AudioFormat(f"audio-{_rate_token(rate)}-{kbps}kbitrate-mono-mp3", f"Audio{_rate_sdk(rate)}{kbps}KBitRateMonoMp3", "mp3", rate, kbps))
+    return {f.name: f for f in table}
+
+
+FORMATS: Dict[str, AudioFormat] = _build()
+ALIASES = {
+    "wav": "riff-16khz-16bit-mono-pcm",
+    "pcm": "raw-16khz-16bit-mono-pcm",
+    "opus": "ogg-24khz-16bit-mono-opus",
+    "mp3": "audio-24khz-48kbitrate-mono-mp3",
+}
+DEFAULT_FORMAT_NAME = "riff-16khz-16bit-mono-pcm"  # FR-011
+
+
+def get_format(name: Optional[str] = None) -> AudioFormat:
+    """Resolve a wire name or alias; None means TTS_OUTPUT_FORMAT or the FR-011 default.
+
+    Raises:
+        ValueError: Unknown format name.
+    """
+    key = (name or os.getenv("TTS_OUTPUT_FORMAT") or DEFAULT_FORMAT_NAME).strip().lower()
+    fmt = FORMATS.get(ALIASES.get(key, key))
+    if fmt is None:
+        raise ValueError(f"Unknown output format '{name}' (aliases: {', '.join(ALIASES)}; or a wire name such as {DEFAULT_FORMAT_NAME})")
+    return fmt
+
+
+def format_for_extension(extension: str) -> Optional[AudioFormat]:
+    """Best guess for a stored file: WAV/MP3/OGG by suffix (raw PCM needs its format name)."""
+    alias = {".wav": "wav", ".mp3": "mp3", ".ogg": "opus", ".opus": "opus"}.get(extension.lower())
+    return FORMATS[ALIASES[alias]] if alias else None
+
+
+def wav_header(fmt: AudioFormat, data_size: int) -> bytes:
+    """44-byte RIFF header that turns a raw PCM payload of `fmt` into a WAV."""
+    block = fmt.channels * fmt.sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + data_size, b"WAVE", b"fmt ", 16, WAVE_FORMAT_PCM, fmt.channels,
+        fmt.sample_rate, fmt.sample_rate * block, block, fmt.sampwidth * 8, b"data", data_size,
+    )
+
+
+__all__ = ["ALIASES", "AudioFormat", "DEFAULT_FORMAT_NAME", "FORMATS", "format_for_extension", "get_format", "wav_header"]
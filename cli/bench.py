@@ -0,0 +1,475 @@
+"""Benchmark suite for TTS and STT workloads (`python -m cli.bench`).
+
+Supersedes the single fixed run of `scripts/measure_latency.sh` for performance
+work: a phrase (or audio file) corpus is replayed `--warmup` times unrecorded,
+then `--trials` times per concurrency level of a `--concurrency` sweep.
+
+Per request it records:
+  queue_delay_ms  submission -> synthesis/recognition start
+  ttfa_ms         submission -> first audio chunk (TTS) / first final segment (STT)
+  total_ms        start -> completion
+  rtf             processing time / audio duration (real-time factor)
+and reports count, errors, mean, p50/p95/p99 and max per metric, plus
+throughput, for every concurrency level. Results go to a JSON report
+(`assets/output/bench_<workload>_<UTC_TIMESTAMP>.json` by default); pass an
+earlier report as `--baseline` to print p50/p95 deltas.
+
+`--stub` swaps the Speech SDK for an in-process backend with configurable
+first-audio latency and jitter, so the suite (and our own queueing/scheduling
+overhead) can be measured offline with no container. `--mock` keeps the real
+SDK path but serves it from a local `cli.mock_container` (latency distribution,
+error rate and session cap via the `--mock-*` options), so SDK and connection
+overhead are included while the backend stays controlled.
+
+The audio cache is disabled for the run unless `--cache` is given, otherwise
+every trial after the first would measure cache hits.
+
+`--trace` (TTS) enables the `cli.tracing` tracer and adds a per-stage
+breakdown (`stages`: queue wait, synthesizer creation, first/last byte, ...)
+to each run, so a regression can be pinned to the stage that moved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import mock_container, tracing, wav_utils
+from .wav_assembly import wav_duration_seconds
+from .tts_synth import OUTPUT_DIR, REPO_ROOT, SynthesisResult
+
+DEFAULT_PHRASES = [
+    "This is a test of multi phrase latency",
+    "Here is another quick test following on",
+    "Phrase number 3",
+    "And here is the fourth phrase",
+    "And a fifth, as in fifth column",
+    "Sixth",
+    "Finally 7th",
+]
+DEFAULT_STT_CORPUS = REPO_ROOT / "assets" / "voice-sample16.wav"
+AUDIO_SUFFIXES = {".wav", ".mp3", ".flac"}
+PERCENTILES = (50, 95, 99)
+METRICS = ("queue_delay_ms", "ttfa_ms", "total_ms", "rtf")
+
+
+@dataclass
+class Sample:
+    success: bool
+    reason: str
+    queue_delay_ms: Optional[float]
+    ttfa_ms: Optional[float]
+    total_ms: Optional[float]
+    rtf: Optional[float]
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile (same definition as numpy's default)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lo = int(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def summarize(values: Sequence[float]) -> dict:
+    summary = {"count": len(values), "mean": round(sum(values) / len(values), 3) if values else None}
+    for pct in PERCENTILES:
+        p = percentile(values, pct)
+        summary[f"p{pct}"] = round(p, 3) if p is not None else None
+    summary["max"] = round(max(values), 3) if values else None
+    return summary
+
+
+def load_corpus(path: Optional[str]) -> List[str]:
+    """Phrases, one per line (blank lines and `#` comments skipped); built-in list when None."""
+    if path is None:
+        return list(DEFAULT_PHRASES)
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    phrases = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    if not phrases:
+        raise ValueError(f"Corpus {path} has no phrases")
+    return phrases
+
+
+def load_audio_corpus(source: Optional[str]) -> List[Path]:
+    """A single audio file, or a directory/glob/manifest resolved like `--batch`."""
+    if source is None:
+        return [DEFAULT_STT_CORPUS]
+    path = Path(source)
+    if path.is_file() and path.suffix.lower() in AUDIO_SUFFIXES:
+        return [path]
+    from .s2t_batch import collect_inputs  # imports the Speech SDK
+
+    files = collect_inputs(source)
+    if not files:
+        raise ValueError(f"Corpus {source} has no audio files")
+    return files
+
+
+def _silent_wav(seconds: float, rate: int = 16000) -> bytes:
+    buf = io.BytesIO()
+    with closing(wave.open(buf, "wb")) as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buf.getvalue()
+
+
+class StubSynthesizer:
+    """In-process stand-in for `tts_synth.synthesize`: no SDK, no container.
+
+    First audio arrives after `first_audio_ms` +/- uniform `jitter_ms`; the rest
+    of the phrase renders at `render_rtf` x its duration (`ms_per_char` of
+    speech per character). Returns silent 16 kHz 16-bit mono WAV audio.
+    """
+
+    def __init__(self, first_audio_ms: float = 80.0, jitter_ms: float = 20.0, render_rtf: float = 0.1, ms_per_char: float = 60.0, seed: Optional[int] = None):
+        self.first_audio_ms = first_audio_ms
+        self.jitter_ms = jitter_ms
+        self.render_rtf = render_rtf
+        self.ms_per_char = ms_per_char
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str, host: Optional[str] = None, voice: Optional[str] = None, in_memory: bool = False, **_ignored) -> SynthesisResult:
+        with self._lock:
+            delay = max(0.0, self.first_audio_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000.0
+        seconds = max(0.1, len(text) * self.ms_per_char / 1000.0)
+        start = time.perf_counter()
+        time.sleep(delay)
+        first_audio = time.perf_counter()
+        time.sleep(seconds * self.render_rtf)
+        return SynthesisResult(
+            text=text, success=True, reason="OK", latency_ms=int((first_audio - start) * 1000),
+            voice=voice or "stub", host=host or "stub", start_monotonic=start, first_audio_monotonic=first_audio,
+            audio_data=_silent_wav(seconds) if in_memory else None,
+        )
+
+
+class StubRecognizer:
+    """In-process stand-in for continuous recognition of a WAV file.
+
+    Emits one final segment per `segment_seconds` of audio, paced so the whole
+    file is processed at `rtf` x its duration.
+    """
+
+    def __init__(self, rtf: float = 0.2, segment_seconds: float = 2.0):
+        self.rtf = rtf
+        self.segment_seconds = segment_seconds
+
+    def __call__(self, audio_path: Path, on_segment: Callable[[object], None]) -> None:
+        remaining = wav_duration_seconds(audio_path) or 0.0
+        while remaining > 0:
+            step = min(self.segment_seconds, remaining)
+            time.sleep(step * self.rtf)
+            on_segment(step)
+            remaining -= step
+
+
+def run_tts(
+    phrases: List[str],
+    concurrency: int,
+    trials: int,
+    warmup: int,
+    host: str,
+    voice: str,
+    synth_fn: Optional[Callable[..., SynthesisResult]] = None,
+    pool=None,  # noqa: ANN001 (EndpointPool)
+) -> Tuple[List[Sample], float]:
+    """Replay `phrases` through a QueueManager with `concurrency` workers.
+
+    Returns the recorded samples and the wall time of the recorded trials
+    (warmup passes and manager start-up excluded).
+    """
+    from .queue_manager import QueueManager
+
+    manager = QueueManager(
+        host=host, voice=voice, max_queue=len(phrases), pool=pool, prewarm=synth_fn is None,
+        in_memory=True, max_concurrency=concurrency, synth_fn=synth_fn,
+    )
+    samples: List[Sample] = []
+    wall_seconds = 0.0
+    try:
+        for trial in range(warmup + trials):
+            if trial == warmup:
+                tracing.get_default_tracer().reset()  # stages cover recorded trials only
+            submitted = []
+            trial_start = time.perf_counter()
+            for text in phrases:
+                submitted.append((time.perf_counter(), manager.submit(text)))
+            manager.wait_all()
+            if trial < warmup:
+                continue
+            wall_seconds += time.perf_counter() - trial_start
+            for submit_mono, decision in submitted:
+                if decision.future is None:
+                    samples.append(Sample(False, decision.decision, None, None, None, None))
+                    continue
+                r = decision.future.result()
+                if not r.success:
+                    samples.append(Sample(False, r.reason, None, None, None, None))
+                    continue
+                first_audio = r.first_audio_monotonic or r.completed_monotonic
+                audio_seconds = _audio_seconds(r.audio_data)
+                processing = r.completed_monotonic - r.started_monotonic
+                samples.append(Sample(
+                    success=True,
+                    reason=r.reason,
+                    queue_delay_ms=(r.started_monotonic - submit_mono) * 1000,
+                    ttfa_ms=(first_audio - submit_mono) * 1000,
+                    total_ms=processing * 1000,
+                    rtf=processing / audio_seconds if audio_seconds else None,
+                ))
+    finally:
+        manager.stop()
+    return samples, wall_seconds
+
+
+def _audio_seconds(data: Optional[bytes]) -> Optional[float]:
+    if not data:
+        return None
+    try:
+        return wav_utils.parse_wav_header(data).duration_seconds
+    except ValueError:
+        return None
+
+
+def _real_recognizer(endpoints: str) -> Callable[[Path, Callable[[object], None]], None]:
+    from . import s2t_cli_sdk as s2t
+    from .endpoint_pool import EndpointPool
+
+    pool = EndpointPool.from_value(endpoints)
+
+    def recognize(audio_path: Path, on_segment: Callable[[object], None]) -> None:
+        with pool.lease() as host:
+            s2t.transcribe_continuous(audio_path, host, "", "", on_segment=on_segment)
+
+    return recognize
+
+
+def run_stt(files: List[Path], concurrency: int, trials: int, warmup: int, recognize: Callable[[Path, Callable[[object], None]], None]) -> Tuple[List[Sample], float]:
+    """Recognize every file per trial with `concurrency` files in flight.
+
+    Returns the recorded samples and the wall time of the recorded trials.
+    """
+    samples: List[Sample] = []
+    wall_seconds = 0.0
+
+    def job(path: Path, submit_mono: float) -> Sample:
+        start = time.perf_counter()
+        first: List[float] = []
+        try:
+            recognize(path, lambda _seg: first.append(time.perf_counter()) if not first else None)
+        except Exception as e:  # recognition errors are counted, not fatal
+            return Sample(False, type(e).__name__, None, None, None, None)
+        end = time.perf_counter()
+        duration = wav_duration_seconds(path)
+        return Sample(
+            success=True,
+            reason="OK",
+            queue_delay_ms=(start - submit_mono) * 1000,
+            ttfa_ms=((first[0] if first else end) - submit_mono) * 1000,
+            total_ms=(end - start) * 1000,
+            rtf=(end - start) / duration if duration else None,
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench-stt") as executor:
+        for trial in range(warmup + trials):
+            t0 = time.perf_counter()
+            futures = [executor.submit(job, path, t0) for path in files]
+            results = [f.result() for f in futures]
+            if trial >= warmup:
+                samples.extend(results)
+                wall_seconds += time.perf_counter() - t0
+    return samples, wall_seconds
+
+
+def report(samples: List[Sample], concurrency: int, trials: int, wall_seconds: float) -> dict:
+    ok = [s for s in samples if s.success]
+    errors: Dict[str, int] = {}
+    for s in samples:
+        if not s.success:
+            errors[s.reason] = errors.get(s.reason, 0) + 1
+    return {
+        "concurrency": concurrency,
+        "trials": trials,
+        "requests": len(samples),
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(ok) / wall_seconds, 3) if wall_seconds > 0 else None,
+        "metrics": {m: summarize([getattr(s, m) for s in ok if getattr(s, m) is not None]) for m in METRICS},
+    }
+
+
+def stage_summary(tracer: tracing.Tracer) -> Dict[str, dict]:
+    """Duration statistics (ms) per traced stage name."""
+    durations: Dict[str, List[float]] = {}
+    for span in tracer.spans():
+        if span.duration_ms is not None:
+            durations.setdefault(span.name, []).append(span.duration_ms)
+    return {name: summarize(values) for name, values in sorted(durations.items())}
+
+
+def print_run(workload: str, run: dict) -> None:
+    parts = [f"BENCH {workload} | concurrency={run['concurrency']} | n={run['requests']} errors={sum(run['errors'].values())} | rps={run['throughput_rps']}"]
+    for metric in METRICS:
+        m = run["metrics"][metric]
+        parts.append(f"{metric} p50={m['p50']} p95={m['p95']} p99={m['p99']}")
+    print(" | ".join(parts))
+    if run.get("stages"):
+        print("  stages p50/p95 ms | " + " | ".join(f"{name} {m['p50']}/{m['p95']}" for name, m in run["stages"].items()))
+
+
+def print_baseline_delta(runs: List[dict], baseline_path: str) -> None:
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {run["concurrency"]: run for run in baseline.get("runs", [])}
+    for run in runs:
+        old = previous.get(run["concurrency"])
+        if old is None:
+            continue
+        for metric in METRICS:
+            for pct in ("p50", "p95"):
+                new_v, old_v = run["metrics"][metric][pct], old["metrics"].get(metric, {}).get(pct)
+                if new_v is None or not old_v:
+                    continue
+                print(f"DELTA concurrency={run['concurrency']} {metric} {pct} {old_v} -> {new_v} ({(new_v - old_v) / old_v * 100:+.1f}%)")
+
+
+def parse_concurrency(value: str) -> List[int]:
+    try:
+        levels = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid concurrency list '{value}'") from None
+    if not levels or any(level < 1 for level in levels):
+        raise argparse.ArgumentTypeError("concurrency levels must be >= 1")
+    return levels
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m cli.bench", description="TTS/STT latency and throughput benchmark")
+    p.add_argument("--workload", choices=["tts", "stt"], default="tts", help="Default tts.")
+    p.add_argument("--corpus", help="TTS: text file, one phrase per line. STT: WAV file, directory, glob or manifest. Default: built-in phrases / assets/voice-sample16.wav")
+    p.add_argument("--trials", type=int, default=3, help="Recorded passes over the corpus per concurrency level. Default 3.")
+    p.add_argument("--warmup", type=int, default=1, help="Unrecorded passes before the trials. Default 1.")
+    p.add_argument("--concurrency", type=parse_concurrency, default=[1], help="Comma-separated sweep, e.g. 1,2,4. Default 1.")
+    p.add_argument("--host", default=os.getenv("TTS_HOST_URL", "http://localhost:5001"), help="TTS container(s), comma-separated (default env TTS_HOST_URL)")
+    p.add_argument("--voice", default=os.getenv("VOICE_NAME", "en-US-JennyNeural"))
+    p.add_argument("--endpoint", default="ws://localhost:5000", help="STT container(s), comma-separated. Default ws://localhost:5000")
+    p.add_argument("--stub", action="store_true", help="Use the in-process stub backend (offline; no SDK or container)")
+    p.add_argument("--stub-latency-ms", type=float, default=80.0, help="Stub first-audio latency. Default 80.")
+    p.add_argument("--stub-jitter-ms", type=float, default=20.0, help="Stub latency jitter (uniform +/-). Default 20.")
+    p.add_argument("--mock", action="store_true", help="Run against an in-process mock container (real SDK, no billing keys)")
+    mock_container.add_config_arguments(p, prefix="mock-")
+    p.add_argument("--seed", type=int, default=None, help="Stub/mock RNG seed")
+    p.add_argument("--trace", action="store_true", help="TTS: record per-stage spans (cli.tracing) and report a stage breakdown per run")
+    p.add_argument("--cache", action="store_true", help="Keep the TTS audio cache enabled (measures cache hits after the first pass)")
+    p.add_argument("--output", help="JSON report path. Default assets/output/bench_<workload>_<UTC_TIMESTAMP>.json")
+    p.add_argument("--baseline", help="Earlier JSON report to compare p50/p95 against")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.trials < 1 or args.warmup < 0:
+        print("ERROR: --trials must be >= 1 and --warmup >= 0", file=sys.stderr)
+        return 1
+    if args.stub and args.mock:
+        print("ERROR: --stub and --mock are mutually exclusive", file=sys.stderr)
+        return 1
+    if not args.cache:
+        os.environ["TTS_CACHE_MAX_MB"] = "0"
+
+    mock = None
+    if args.mock:
+        try:
+            mock = mock_container.MockContainer(mock_container.config_from_args(args, prefix="mock-", seed=args.seed)).start()
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        args.host, args.endpoint = mock.url, mock.ws_url
+        print(f"Mock container on {mock.url}")
+    try:
+        return _run(args, mock)
+    finally:
+        if mock is not None:
+            mock.stop()
+
+
+def _run(args: argparse.Namespace, mock: Optional["mock_container.MockContainer"]) -> int:
+
+    runs: List[dict] = []
+    if args.workload == "tts":
+        try:
+            corpus: List = load_corpus(args.corpus)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        synth_fn = StubSynthesizer(args.stub_latency_ms, args.stub_jitter_ms, seed=args.seed) if args.stub else None
+        pool = None
+        if not args.stub and "," in args.host:
+            from .endpoint_pool import EndpointPool
+            pool = EndpointPool.from_value(args.host)
+        tracer = tracing.enable_default_tracer() if args.trace else None
+        for level in args.concurrency:
+            samples, wall_seconds = run_tts(corpus, level, args.trials, args.warmup, args.host.split(",")[0].strip(), args.voice, synth_fn, pool)
+            runs.append(report(samples, level, args.trials, wall_seconds))
+            if tracer is not None:
+                runs[-1]["stages"] = stage_summary(tracer)
+            print_run(args.workload, runs[-1])
+    else:
+        try:
+            corpus = load_audio_corpus(args.corpus)
+        except ImportError as e:
+            print(f"ERROR: {e} (directory, glob and manifest corpora need the Speech SDK; pass a WAV file)", file=sys.stderr)
+            return 1
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        recognize = StubRecognizer() if args.stub else _real_recognizer(args.endpoint)
+        for level in args.concurrency:
+            samples, wall_seconds = run_stt(corpus, level, args.trials, args.warmup, recognize)
+            runs.append(report(samples, level, args.trials, wall_seconds))
+            print_run(args.workload, runs[-1])
+
+    payload = {
+        "generated_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "workload": args.workload,
+        "backend": "stub" if args.stub else "mock" if mock is not None else (args.host if args.workload == "tts" else args.endpoint),
+        "corpus": args.corpus or "builtin",
+        "corpus_size": len(corpus),
+        "warmup": args.warmup,
+        "cache": args.cache,
+        "runs": runs,
+    }
+    if mock is not None:
+        payload["mock"] = {"config": asdict(mock.config), "stats": mock.stats()}
+    if args.output:
+        out_path = Path(args.output)
+    else:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        out_path = OUTPUT_DIR / f"bench_{args.workload}_{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}.json"
+    out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"Report written to {out_path}")
+    if args.baseline:
+        print_baseline_delta(runs, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
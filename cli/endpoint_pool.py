@@ -0,0 +1,210 @@
+"""Endpoint pool for spreading requests across several Speech container replicas.
+
+Takes a list of container hosts and picks one per request using a pluggable
+selection strategy (round-robin or least-outstanding-requests). Replicas whose
+requests fail at the connection level are ejected and re-admitted once the `/ready` probe used by
+`tts_cli --ping` succeeds again, so throughput scales horizontally without an
+external load balancer.
+
+Hosts may be HTTP (TTS, e.g. http://localhost:5001) or WebSocket (STT, e.g.
+ws://localhost:5000); the readiness probe maps ws/wss to http/https.
+
+Configuration helpers accept comma-separated host lists, so existing variables
+(`TTS_HOST_URL`, `SPEECH_ENDPOINT`) and `--host`/`--endpoint` flags can name
+several replicas: `http://localhost:5001,http://localhost:5002`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import readiness
+
+ProbeFn = Callable[[str], bool]
+
+
+def ready_url(host: str) -> str:
+    """Map a container host (http or ws scheme) to its HTTP base URL."""
+    if host.startswith("ws://"):
+        return "http://" + host[len("ws://"):]
+    if host.startswith("wss://"):
+        return "https://" + host[len("wss://"):]
+    return host
+
+
+def ready_probe(host: str) -> bool:
+    """Default health probe: the container `/ready` endpoint returns 200."""
+    ok, _status, _elapsed, _message = readiness.ping(ready_url(host))
+    return ok
+
+
+def is_connection_failure(exc: BaseException) -> bool:
+    """True when an exception points at the replica (not the input) being unhealthy.
+
+    The raising counterpart of `tts_synth.is_endpoint_failure`: socket errors,
+    timeouts, and SDK cancellations that mention the connection.
+    """
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return isinstance(exc, RuntimeError) and "connection" in str(exc).lower()
+
+
+class RoundRobin:
+    """Cycle through healthy hosts in order."""
+
+    name = "round_robin"
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, candidates: Sequence[str], outstanding: Dict[str, int]) -> str:
+        return candidates[next(self._counter) % len(candidates)]
+
+
+class LeastOutstanding:
+    """Pick the healthy host with the fewest in-flight requests (ties: list order)."""
+
+    name = "least_outstanding"
+
+    def choose(self, candidates: Sequence[str], outstanding: Dict[str, int]) -> str:
+        return min(candidates, key=lambda h: outstanding[h])
+
+
+STRATEGIES = {
+    RoundRobin.name: RoundRobin,
+    LeastOutstanding.name: LeastOutstanding,
+}
+
+
+class EndpointPool:
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        strategy: object = RoundRobin.name,
+        probe: Optional[ProbeFn] = None,
+        probe_interval: float = 5.0,
+    ):
+        """Initialize endpoint pool.
+
+        Args:
+            hosts: Container hosts (at least one).
+            strategy: Strategy name from STRATEGIES, or an object with
+                `choose(candidates, outstanding) -> host`.
+            probe: Health check returning True when a host is ready.
+                Default: GET <host>/ready via `readiness.ping`.
+            probe_interval: Seconds between re-probes of ejected hosts.
+        """
+        if not hosts:
+            raise ValueError("EndpointPool requires at least one host")
+        if isinstance(strategy, str):
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown strategy: {strategy}. Choose from: {', '.join(STRATEGIES)}")
+            strategy = STRATEGIES[strategy]()
+        self._hosts = list(hosts)
+        self._strategy = strategy
+        self._probe = probe or ready_probe
+        self._probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._outstanding: Dict[str, int] = {h: 0 for h in self._hosts}
+        self._ejected: Dict[str, float] = {}  # host -> monotonic time of ejection
+        self._prober: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    @classmethod
+    def from_value(cls, value: str, **kwargs) -> "EndpointPool":
+        """Build a pool from a comma-separated host list."""
+        return cls(readiness.split_hosts(value), **kwargs)
+
+    @property
+    def hosts(self) -> List[str]:
+        return list(self._hosts)
+
+    @property
+    def healthy_hosts(self) -> List[str]:
+        with self._lock:
+            return [h for h in self._hosts if h not in self._ejected]
+
+    def outstanding(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._outstanding)
+
+    def acquire(self) -> str:
+        """Pick a host for one request and count it as outstanding.
+
+        If every host is ejected the pool fails open and chooses among all
+        hosts, so a flapping probe never blocks traffic entirely.
+        """
+        with self._lock:
+            candidates = [h for h in self._hosts if h not in self._ejected] or self._hosts
+            host = self._strategy.choose(candidates, self._outstanding)
+            self._outstanding[host] += 1
+            return host
+
+    def release(self, host: str, success: bool = True) -> None:
+        """Return a host after a request; failures eject it until it probes ready."""
+        with self._lock:
+            if self._outstanding.get(host, 0) > 0:
+                self._outstanding[host] -= 1
+        if not success:
+            self.eject(host)
+
+    @contextmanager
+    def lease(self) -> Iterator[str]:
+        """Context manager around acquire/release; connection-class exceptions eject the host."""
+        host = self.acquire()
+        try:
+            yield host
+        except Exception as e:
+            self.release(host, success=not is_connection_failure(e))
+            raise
+        self.release(host, success=True)
+
+    def eject(self, host: str) -> None:
+        with self._lock:
+            if host not in self._outstanding or host in self._ejected:
+                return
+            self._ejected[host] = time.perf_counter()
+            if self._prober is None:
+                self._prober = threading.Thread(target=self._probe_loop, name="endpoint-probe", daemon=True)
+                self._prober.start()
+
+    def probe_all(self) -> List[Tuple[str, bool]]:
+        """Probe every host now; eject failing ones and re-admit ready ones."""
+        results = [(h, self._probe(h)) for h in self._hosts]
+        for host, ok in results:
+            if ok:
+                with self._lock:
+                    self._ejected.pop(host, None)
+            else:
+                self.eject(host)
+        return results
+
+    def _probe_loop(self) -> None:
+        # Runs only while at least one host is ejected.
+        while not self._closed.wait(self._probe_interval):
+            with self._lock:
+                ejected = list(self._ejected)
+                if not ejected:
+                    self._prober = None
+                    return
+            for host in ejected:
+                if self._probe(host):
+                    with self._lock:
+                        self._ejected.pop(host, None)
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+def build_endpoint_pool(hosts: Sequence[str], strategy: str = "round_robin") -> Optional[EndpointPool]:
+    """Return an EndpointPool for multiple hosts, or None for a single host."""
+    if len(hosts) < 2:
+        return None
+    return EndpointPool(hosts, strategy=strategy)
+
+
+__all__ = ["EndpointPool", "RoundRobin", "LeastOutstanding", "STRATEGIES", "build_endpoint_pool", "is_connection_failure", "ready_url", "ready_probe"]
@@ -0,0 +1,209 @@
+"""Append-only, buffered, rotating evidence log (JSONL or CSV).
+
+Evidence used to be assembled in memory and rewritten with `write_text` once a
+run finished. `EventLog` records each event as it happens instead:
+
+  - `write(event)` only appends to an in-memory batch; a background thread
+    flushes batches every `flush_interval` seconds (or sooner once
+    `batch_size` events are pending) with one buffered append per batch.
+  - At most `max_pending` events are held; beyond that `write` blocks until
+    the flusher catches up, so memory stays bounded however long a service runs.
+  - When the file reaches `max_bytes` it is rotated to `<name>.1` ..
+    `<name>.<backups>` (oldest dropped), so disk use is bounded too.
+
+Formats: "jsonl" (one JSON object per line), "csv" (header written at the top
+of every new file; columns from `fields` or the first event), or any
+`formatter(event) -> line` for fixed line layouts such as `queue.txt`.
+Write errors are counted in `errors` and never raised to the producer (FR-013).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Sequence, Union
+
+FORMATS = ("jsonl", "csv")
+
+Event = Dict[str, object]
+
+
+def utc_timestamp() -> str:
+    """UTC ISO-8601 timestamp with milliseconds."""
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now * 1000) % 1000:03d}Z"
+
+
+def format_for_path(path: Union[str, Path]) -> str:
+    """'csv' for a .csv path, else 'jsonl'."""
+    return "csv" if str(path).lower().endswith(".csv") else "jsonl"
+
+
+class EventLog:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fmt: str = "jsonl",
+        fields: Optional[Sequence[str]] = None,
+        formatter: Optional[Callable[[Mapping[str, object]], str]] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        flush_interval: float = 0.5,
+        batch_size: int = 256,
+        max_pending: int = 10000,
+        truncate: bool = False,
+    ):
+        """Open (append to) an event log and start its flush thread.
+
+        Args:
+            path: Log file; parent directories are created.
+            fmt: "jsonl" or "csv" (ignored when `formatter` is given).
+            fields: CSV columns; default: keys of the first event.
+            formatter: Renders one event as one line (no newline).
+            max_bytes: Rotate once the file reaches this size; 0 never rotates.
+            backups: Rotated files kept (`<name>.1` is the newest).
+            flush_interval: Longest time an event waits in memory.
+            batch_size: Pending events that trigger an early flush.
+            max_pending: Events held before `write` blocks.
+            truncate: Start from an empty file instead of appending.
+        """
+        if formatter is None and fmt not in FORMATS:
+            raise ValueError(f"fmt must be one of {', '.join(FORMATS)}")
+        if batch_size < 1 or max_pending < batch_size:
+            raise ValueError("batch_size must be >= 1 and max_pending >= batch_size")
+        self.path = Path(path)
+        self._fmt = fmt
+        self._fields: Optional[List[str]] = list(fields) if fields else None
+        self._formatter = formatter
+        self._max_bytes = max_bytes
+        self._backups = max(0, backups)
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._max_pending = max_pending
+        self._cond = threading.Condition()
+        self._pending: Deque[Mapping[str, object]] = deque()
+        self._enqueued = 0
+        self._written = 0  # events handed to the file (or lost to an error)
+        self._flush_requested = False
+        self._closed = False
+        self.errors = 0
+        self.rotations = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "w" if truncate else "a", encoding="utf-8", newline="")
+        self._thread = threading.Thread(target=self._run, name="evidence-flush", daemon=True)
+        self._thread.start()
+
+    def write(self, event: Mapping[str, object]) -> None:
+        """Queue one event; blocks only while `max_pending` events are unflushed."""
+        with self._cond:
+            while len(self._pending) >= self._max_pending and not self._closed:
+                self._flush_requested = True
+                self._cond.notify_all()
+                self._cond.wait()
+            if self._closed:
+                raise ValueError("EventLog is closed")
+            self._pending.append(event)
+            self._enqueued += 1
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+
+    def log(self, kind: str, **fields: object) -> None:
+        """Write `{"ts": <UTC>, "event": kind, **fields}`."""
+        self.write({"ts": utc_timestamp(), "event": kind, **fields})
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every event written so far is on disk; False on timeout."""
+        with self._cond:
+            target = self._enqueued
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target or not self._thread.is_alive(), timeout=timeout)
+
+    def close(self) -> None:
+        """Flush what is pending, stop the flush thread and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        try:
+            self._fh.close()
+        except OSError:
+            self.errors += 1
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._flush_requested or len(self._pending) >= self._batch_size,
+                    timeout=self._flush_interval,
+                )
+                batch = list(self._pending)
+                self._pending.clear()
+                self._flush_requested = False
+                closing = self._closed
+                self._cond.notify_all()  # wake producers blocked on max_pending
+            if batch:
+                self._append(batch)
+            with self._cond:
+                self._written += len(batch)
+                self._cond.notify_all()
+            if closing:
+                return
+
+    def _render(self, batch: List[Mapping[str, object]]) -> str:
+        if self._formatter is not None:
+            return "".join(self._formatter(e) + "\n" for e in batch)
+        if self._fmt == "jsonl":
+            return "".join(json.dumps(e, default=str, ensure_ascii=False) + "\n" for e in batch)
+        if self._fields is None:
+            self._fields = list(batch[0].keys())
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self._fields, extrasaction="ignore", lineterminator="\n")
+        if self._fh.tell() == 0:
+            writer.writeheader()
+        writer.writerows(batch)
+        return buf.getvalue()
+
+    def _append(self, batch: List[Mapping[str, object]]) -> None:
+        try:
+            if self._fh.closed:  # an earlier reopen failed; try again
+                self._fh = open(self.path, "a", encoding="utf-8", newline="")
+            self._fh.write(self._render(batch))
+            self._fh.flush()
+            if self._max_bytes and self._fh.tell() >= self._max_bytes:
+                self._rotate()
+        except (OSError, ValueError):  # disk full, file vanished, ...: keep the producer running
+            self.errors += 1
+
+    def _rotate(self) -> None:
+        self._fh.close()
+        rotated = False
+        try:
+            if self._backups:
+                for i in range(self._backups - 1, 0, -1):
+                    older = self.path.with_name(f"{self.path.name}.{i}")
+                    if older.exists():
+                        os.replace(older, self.path.with_name(f"{self.path.name}.{i + 1}"))
+                os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+            rotated = True
+        finally:
+            # A failed rename leaves the full file in place: keep appending to it and retry next batch
+            self._fh = open(self.path, "w" if rotated else "a", encoding="utf-8", newline="")
+        self.rotations += 1
+
+
+__all__ = ["EventLog", "FORMATS", "format_for_path", "utc_timestamp"]
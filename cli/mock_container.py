@@ -0,0 +1,656 @@
+"""Local stand-in for the Speech containers (`python -m cli.mock_container`).
+
+Serves, on one port and with the standard library only:
+  GET /ready, /status             health probes (`/status` adds live counters)
+  WebSocket upgrade on any path   the SDK's synthesis and recognition sessions
+
+The WebSocket side speaks enough of the Speech SDK protocol for
+`tts_synth.synthesize`, `QueueManager`, `transcribe_audio`/`transcribe_continuous`
+and `python -m cli.bench` to run against it: text messages are
+`Header: value` lines, a blank line and a body; binary messages carry a 2-byte
+big-endian header length, the headers and the payload.
+
+  Synthesis   an `ssml` message opens a turn: `turn.start`, then canned audio
+              as `audio` messages in the format requested by `synthesis.context`
+              (tone PCM at any 16-bit rate, a RIFF header first for `riff-*`;
+              silent MP3 frames or an Ogg Opus stream of silent packets for the
+              compressed formats), then `turn.end`. Several turns may share one
+              connection (pooled synthesizers).
+  Recognition `audio` messages (the first carrying the SDK's WAV header, an
+              empty one ending the stream) are answered with one
+              `speech.hypothesis` + `speech.phrase` per `segment_seconds` of
+              audio, then `speech.endDetected` and `turn.end`.
+
+Each turn waits a first-result latency drawn from `distribution`
+(fixed/uniform/normal/lognormal around `latency_ms` with spread `jitter_ms`),
+fails with probability `error_rate` (WebSocket close 1011, which the SDK
+reports as a connection error), and streams at `tts_rtf`/`stt_rtf` x real time.
+At most `max_sessions` sessions are served at once; later upgrades wait up to
+`queue_timeout_s` for a slot and are then refused with 429.
+
+No billing key is checked: point the clients at it with
+`TTS_HOST_URL=http://127.0.0.1:5000` / `s2t_cli_sdk.py --mock`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import socket
+import struct
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from . import wav_utils
+from .audio_formats import DEFAULT_FORMAT_NAME, AudioFormat, get_format
+
+DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_CONT, _OP_TEXT, _OP_BINARY, _OP_CLOSE, _OP_PING, _OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+_PCM_FORMAT_RE = re.compile(r"(riff|raw)-(\d+)(k?)hz-16bit-(mono|stereo)-pcm")
+_TAG_RE = re.compile(r"<[^>]+>")
+TICKS_PER_SECOND = 10_000_000  # SDK offsets/durations are 100 ns ticks
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 80.0  # first audio (TTS) / first result (STT)
+    jitter_ms: float = 20.0
+    distribution: str = "uniform"
+    error_rate: float = 0.0  # probability a turn fails with a connection error
+    max_sessions: int = 0  # concurrent WebSocket sessions; 0 = unlimited
+    queue_timeout_s: float = 0.0  # wait for a session slot before answering 429
+    tts_rtf: float = 0.1  # synthesized audio streamed at this fraction of real time
+    ms_per_char: float = 60.0  # synthesized speech length per input character
+    chunk_ms: int = 100  # synthesized audio per `audio` message
+    stt_rtf: float = 0.2  # recognition time per second of received audio
+    segment_seconds: float = 2.0  # audio per recognized phrase
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(DISTRIBUTIONS)}")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be within [0, 1]")
+        if self.max_sessions < 0 or self.chunk_ms <= 0 or self.segment_seconds <= 0:
+            raise ValueError("max_sessions must be >= 0; chunk_ms and segment_seconds > 0")
+
+
+def sample_latency(config: MockConfig, rng: random.Random) -> float:
+    """Draw one first-result latency in seconds from the configured distribution."""
+    mean, spread = config.latency_ms, config.jitter_ms
+    if config.distribution == "uniform":
+        value = rng.uniform(mean - spread, mean + spread)
+    elif config.distribution == "normal":
+        value = rng.gauss(mean, spread)
+    elif config.distribution == "lognormal" and mean > 0:
+        # median `latency_ms`, long right tail controlled by jitter/latency
+        value = rng.lognormvariate(math.log(mean), spread / mean)
+    else:
+        value = mean
+    return max(0.0, value) / 1000.0
+
+
+@lru_cache(maxsize=8)
+def _tone_second(rate: int, channels: int) -> bytes:
+    """One second of a quiet 220 Hz tone, 16-bit little-endian PCM."""
+    samples = [int(3000 * math.sin(2 * math.pi * 220 * i / rate)) for i in range(rate)]
+    if channels > 1:
+        samples = [s for s in samples for _ in range(channels)]
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+def canned_pcm(seconds: float, rate: int = 16000, channels: int = 1) -> bytes:
+    """`seconds` of canned tone PCM (whole frames)."""
+    second = _tone_second(rate, channels)
+    frame = 2 * channels
+    size = int(seconds * rate) * frame
+    reps = size // len(second) + 1
+    return (second * reps)[:size]
+
+
+def _wav_header(rate: int, channels: int, data_size: int = 0) -> bytes:
+    block = 2 * channels
+    return (
+        b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, rate, rate * block, block, 16)
+        + b"data" + struct.pack("<I", data_size)
+    )
+
+
+def _session_format(name: str) -> AudioFormat:
+    """The `audio_formats` entry for a requested wire name; unlisted PCM layouts are parsed, the rest fall back to the default."""
+    try:
+        return get_format(name)
+    except ValueError:
+        pass
+    match = _PCM_FORMAT_RE.fullmatch(name)
+    if match is None:
+        return get_format(DEFAULT_FORMAT_NAME)
+    rate = int(match.group(2)) * (1000 if match.group(3) else 1)
+    return AudioFormat(name, "", match.group(1), rate, channels=2 if match.group(4) == "stereo" else 1)
+
+
+# MPEG audio Layer III header fields: version bits, sample-rate index and bitrate index tables
+_MP3_VERSION = {48000: 3, 44100: 3, 32000: 3, 24000: 2, 22050: 2, 16000: 2}
+_MP3_RATE_INDEX = {44100: 0, 48000: 1, 32000: 2, 22050: 0, 24000: 1, 16000: 2}
+_MP3_BITRATES = {
+    3: (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+def canned_mp3(seconds: float, rate: int, kbps: int) -> Tuple[bytes, int]:
+    """(`seconds` of silent mono Layer III frames, bytes per frame).
+
+    All-zero side information (no main data, global gain 0) decodes as silence.
+    """
+    version = _MP3_VERSION[rate]
+    mpeg1 = version == 3
+    header = bytes([0xFF, 0xE0 | version << 3 | 0x02 | 0x01, (_MP3_BITRATES[version].index(kbps) + 1) << 4 | _MP3_RATE_INDEX[rate] << 2, 0xC0])
+    length = (144 if mpeg1 else 72) * kbps * 1000 // rate
+    frames = max(1, math.ceil(seconds * rate / (1152 if mpeg1 else 576)))
+    return (header + bytes(length - 4)) * frames, length
+
+
+_OPUS_SILENCE = b"\xf8\xff\xfe"  # CELT fullband 20 ms frame of silence
+_OPUS_PRE_SKIP = 312
+
+
+@lru_cache(maxsize=1)
+def _ogg_crc_table() -> Tuple[int, ...]:
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x04C11DB7 if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return tuple(table)
+
+
+def _ogg_page(serial: int, sequence: int, granule: int, packets: list, flags: int = 0) -> bytes:
+    lacing = bytearray()
+    for packet in packets:
+        lacing += b"\xff" * (len(packet) // 255) + bytes([len(packet) % 255])
+    page = bytearray(struct.pack("<4sBBqIIIB", b"OggS", 0, flags, granule, serial, sequence, 0, len(lacing)) + lacing + b"".join(packets))
+    crc, table = 0, _ogg_crc_table()
+    for byte in page:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ byte]
+    struct.pack_into("<I", page, 22, crc)
+    return bytes(page)
+
+
+def canned_ogg_opus(seconds: float, rate: int, packets_per_page: int = 5) -> list:
+    """Ogg Opus pages (OpusHead, OpusTags, then silent 20 ms packets) for `seconds` of audio."""
+    serial = 0x6D6F636B
+    pages = [
+        _ogg_page(serial, 0, 0, [b"OpusHead" + struct.pack("<BBHIhB", 1, 1, _OPUS_PRE_SKIP, rate, 0, 0)], flags=0x02),
+        _ogg_page(serial, 1, 0, [b"OpusTags" + struct.pack("<I", 4) + b"mock" + struct.pack("<I", 0)]),
+    ]
+    total = max(1, math.ceil(seconds / 0.02))
+    for first in range(0, total, packets_per_page):
+        count = min(packets_per_page, total - first)
+        granule = _OPUS_PRE_SKIP + (first + count) * 960  # 48 kHz units
+        pages.append(_ogg_page(serial, len(pages), granule, [_OPUS_SILENCE] * count, flags=0x04 if first + count == total else 0))
+    return pages
+
+
+class _Closed(Exception):
+    """The peer closed the WebSocket (or the socket dropped)."""
+
+
+class _WebSocket:
+    """Minimal RFC 6455 server side over an accepted HTTP connection."""
+
+    def __init__(self, rfile, wfile):  # noqa: ANN001
+        self._rfile = rfile
+        self._wfile = wfile
+        self._send_lock = threading.Lock()
+
+    def _read_exact(self, n: int) -> bytes:
+        data = self._rfile.read(n)
+        if data is None or len(data) < n:
+            raise _Closed()
+        return data
+
+    def recv(self) -> Tuple[int, bytes]:
+        """Next complete data message as (opcode, payload); answers pings itself."""
+        opcode = None
+        parts = []
+        while True:
+            b0, b1 = self._read_exact(2)
+            op, fin = b0 & 0x0F, bool(b0 & 0x80)
+            length = b1 & 0x7F
+            if length == 126:
+                (length,) = struct.unpack(">H", self._read_exact(2))
+            elif length == 127:
+                (length,) = struct.unpack(">Q", self._read_exact(8))
+            mask = self._read_exact(4) if b1 & 0x80 else None
+            payload = self._read_exact(length)
+            if mask:
+                payload = _unmask(payload, mask)
+            if op == _OP_CLOSE:
+                self.close(1000)
+                raise _Closed()
+            if op == _OP_PING:
+                self.send(_OP_PONG, payload)
+                continue
+            if op == _OP_PONG:
+                continue
+            if op != _OP_CONT:
+                opcode = op
+            parts.append(payload)
+            if fin:
+                return opcode or _OP_BINARY, b"".join(parts)
+
+    def send(self, opcode: int, payload: bytes) -> None:
+        n = len(payload)
+        if n < 126:
+            header = struct.pack(">BB", 0x80 | opcode, n)
+        elif n < 1 << 16:
+            header = struct.pack(">BBH", 0x80 | opcode, 126, n)
+        else:
+            header = struct.pack(">BBQ", 0x80 | opcode, 127, n)
+        with self._send_lock:
+            try:
+                self._wfile.write(header + payload)
+                self._wfile.flush()
+            except OSError as e:
+                raise _Closed() from e
+
+    def close(self, code: int, reason: str = "") -> None:
+        try:
+            self.send(_OP_CLOSE, struct.pack(">H", code) + reason.encode("utf-8")[:120])
+        except _Closed:
+            pass
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    # XOR as one big integer: far faster than a per-byte loop for audio frames
+    n = len(payload)
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(n, "little")
+
+
+def parse_message(opcode: int, payload: bytes) -> Tuple[Dict[str, str], bytes]:
+    """Split an SDK message into (lower-cased headers, body)."""
+    if opcode == _OP_TEXT:
+        head, _, body = payload.partition(b"\r\n\r\n")
+    else:
+        if len(payload) < 2:
+            return {}, b""
+        (hlen,) = struct.unpack(">H", payload[:2])
+        head, body = payload[2:2 + hlen], payload[2 + hlen:]
+    headers = {}
+    for line in head.decode("utf-8", "replace").split("\r\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def _headers(path: str, request_id: str, content_type: Optional[str]) -> str:
+    lines = [f"X-RequestId:{request_id}", f"X-Timestamp:{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime())}.000Z", f"Path:{path}"]
+    if content_type:
+        lines.append(f"Content-Type:{content_type}")
+    return "\r\n".join(lines) + "\r\n"
+
+
+class _Session:
+    """One SDK WebSocket connection; serves synthesis and recognition turns."""
+
+    def __init__(self, server: "MockContainer", ws: _WebSocket, rng: random.Random):
+        self.server = server
+        self.config = server.config
+        self.ws = ws
+        self.rng = rng
+        self.output_format = "riff-16khz-16bit-mono-pcm"
+        # recognition state
+        self.stt_request_id: Optional[str] = None
+        self.stt_rate, self.stt_frame = 16000, 2
+        self.stt_received = 0.0  # seconds of audio received
+        self.stt_emitted = 0.0  # seconds already answered with phrases
+        self.stt_phrases = 0
+
+    def text(self, path: str, request_id: str, body: object = None) -> None:
+        payload = "" if body is None else json.dumps(body)
+        self.ws.send(_OP_TEXT, (_headers(path, request_id, "application/json; charset=utf-8") + "\r\n" + payload).encode("utf-8"))
+
+    def audio(self, request_id: str, data: bytes) -> None:
+        head = _headers("audio", request_id, "audio/x-wav").encode("ascii")
+        self.ws.send(_OP_BINARY, struct.pack(">H", len(head)) + head + data)
+
+    def fail_turn(self) -> bool:
+        if self.config.error_rate and self.rng.random() < self.config.error_rate:
+            self.server.count("errors_injected")
+            self.ws.close(1011, "mock injected error")
+            return True
+        return False
+
+    def run(self) -> None:
+        while True:
+            opcode, payload = self.ws.recv()
+            headers, body = parse_message(opcode, payload)
+            path = headers.get("path", "").lower()
+            request_id = headers.get("x-requestid") or uuid.uuid4().hex
+            if path == "synthesis.context":
+                self._on_synthesis_context(body)
+            elif path == "ssml":
+                if not self._synthesize(request_id, body.decode("utf-8", "replace")):
+                    return
+            elif path == "audio":
+                if not self._on_audio(request_id, body):
+                    return
+            # speech.config, speech.context, telemetry, ... need no answer
+
+    def _on_synthesis_context(self, body: bytes) -> None:
+        try:
+            fmt = json.loads(body or b"{}").get("synthesis", {}).get("audio", {}).get("outputFormat")
+        except (ValueError, AttributeError):
+            fmt = None
+        if fmt:
+            self.output_format = str(fmt).lower()
+
+    def _synthesize(self, request_id: str, ssml: str) -> bool:
+        self.server.count("tts_turns")
+        fmt = _session_format(self.output_format)
+        text = " ".join(_TAG_RE.sub(" ", ssml).split())
+        seconds = max(0.2, len(text) * self.config.ms_per_char / 1000.0)
+        self.text("turn.start", request_id, {"context": {"serviceTag": uuid.uuid4().hex}})
+        time.sleep(sample_latency(self.config, self.rng))
+        if self.fail_turn():
+            return False
+        for chunk in self._audio_chunks(fmt, seconds):
+            self.audio(request_id, chunk)
+            if self.config.tts_rtf:
+                time.sleep(self.config.chunk_ms / 1000.0 * self.config.tts_rtf)
+        self.text("turn.end", request_id, {})
+        return True
+
+    def _audio_chunks(self, fmt: AudioFormat, seconds: float) -> list:
+        """Canned audio in `fmt`, split into roughly `chunk_ms` messages."""
+        if fmt.container == "ogg":
+            pages = canned_ogg_opus(seconds, fmt.sample_rate, packets_per_page=max(1, self.config.chunk_ms // 20))
+            return [pages[0] + pages[1] + pages[2]] + pages[3:]  # headers ride with the first audio
+        if fmt.container == "mp3":
+            data, step = canned_mp3(seconds, fmt.sample_rate, fmt.bitrate_kbps or 32)
+            step *= max(1, round(self.config.chunk_ms / 1000 * fmt.sample_rate / (1152 if fmt.sample_rate >= 32000 else 576)))
+        else:
+            data = canned_pcm(seconds, fmt.sample_rate, fmt.channels)
+            step = int(fmt.sample_rate * self.config.chunk_ms / 1000) * 2 * fmt.channels
+        chunks = [data[offset:offset + step] for offset in range(0, len(data), step)]
+        if fmt.container == "riff":
+            chunks[0] = _wav_header(fmt.sample_rate, fmt.channels, len(data)) + chunks[0]
+        return chunks
+
+    def _on_audio(self, request_id: str, body: bytes) -> bool:
+        if self.stt_request_id != request_id:
+            # a new recognition turn
+            self.server.count("stt_turns")
+            self.stt_request_id = request_id
+            self.stt_received = self.stt_emitted = 0.0
+            self.stt_phrases = 0
+            self.text("turn.start", request_id, {"context": {"serviceTag": uuid.uuid4().hex}})
+            self.text("speech.startDetected", request_id, {"Offset": 0})
+            time.sleep(sample_latency(self.config, self.rng))
+            if self.fail_turn():
+                return False
+        if not body:
+            return self._end_of_audio(request_id)
+        if body[:4] == b"RIFF":
+            try:
+                info = wav_utils.parse_wav_header(body)
+                self.stt_rate, self.stt_frame = info.framerate or 16000, info.frame_size or 2
+                body = body[info.data_offset:]
+            except ValueError:
+                pass
+        if body:
+            self.stt_received += len(body) / float(self.stt_rate * self.stt_frame)
+            while self.stt_received - self.stt_emitted >= self.config.segment_seconds:
+                self._phrase(request_id, self.config.segment_seconds)
+        return True
+
+    def _end_of_audio(self, request_id: str) -> bool:
+        # an empty audio message ends the stream: flush the tail, close the turn
+        if self.stt_received - self.stt_emitted > 0.3:
+            self._phrase(request_id, self.stt_received - self.stt_emitted)
+        self.text("speech.endDetected", request_id, {"Offset": int(self.stt_received * TICKS_PER_SECOND)})
+        self.text("turn.end", request_id, {})
+        self.stt_request_id = None
+        return True
+
+    def _phrase(self, request_id: str, seconds: float) -> None:
+        time.sleep(seconds * self.config.stt_rtf)
+        self.stt_phrases += 1
+        offset, duration = int(self.stt_emitted * TICKS_PER_SECOND), int(seconds * TICKS_PER_SECOND)
+        words = f"mock phrase {self.stt_phrases}"
+        self.text("speech.hypothesis", request_id, {"Text": words, "Offset": offset, "Duration": duration})
+        self.text("speech.phrase", request_id, {
+            "RecognitionStatus": "Success", "DisplayText": f"Mock phrase {self.stt_phrases}.",
+            "Offset": offset, "Duration": duration, "Channel": 0,
+        })
+        self.stt_emitted += seconds
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        if self.server.mock.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, code: int, body: dict) -> None:
+        data = (json.dumps(body) + "\n").encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:  # noqa: N802
+        mock = self.server.mock
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            self._websocket(mock)
+            return
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/ready":
+            self._reply(200, {"ready": True})
+        elif path == "/status":
+            self._reply(200, {"status": "mock", **mock.stats()})
+        else:
+            self._reply(404, {"error": f"no route for {path or '/'}"})
+
+    def _websocket(self, mock: "MockContainer") -> None:
+        key = self.headers.get("Sec-WebSocket-Key")
+        if not key:
+            self._reply(400, {"error": "missing Sec-WebSocket-Key"})
+            return
+        if not mock.acquire():
+            mock.count("rejected")
+            self._reply(429, {"error": "mock container at max_sessions"})
+            return
+        try:
+            accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode("ascii")).digest()).decode("ascii")
+            self.send_response(101, "Switching Protocols")
+            self.send_header("Upgrade", "websocket")
+            self.send_header("Connection", "Upgrade")
+            self.send_header("Sec-WebSocket-Accept", accept)
+            self.end_headers()
+            self.wfile.flush()
+            self.close_connection = True
+            mock.count("sessions")
+            try:
+                _Session(mock, _WebSocket(self.rfile, self.wfile), mock.session_rng()).run()
+            except (_Closed, ConnectionError, socket.timeout):
+                pass
+        finally:
+            mock.release()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    mock: "MockContainer"
+
+
+class MockContainer:
+    """Run the mock container on a background thread (`with MockContainer() as mock:`).
+
+    `port=0` picks a free port; `url`/`ws_url` give the address to hand to
+    `TTS_HOST_URL`, `QueueManager(host=...)` or `--endpoint`.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        self.config = config or MockConfig()
+        self.verbose = verbose
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.config.max_sessions) if self.config.max_sessions else None
+        self._active = 0
+        self._counters: Dict[str, int] = {"sessions": 0, "tts_turns": 0, "stt_turns": 0, "errors_injected": 0, "rejected": 0}
+        self._seeds = itertools.count(self.config.seed) if self.config.seed is not None else None
+        self._serving = False  # shutdown() blocks forever unless serve_forever is (about to be) running
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._server.server_address[0]}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self._server.server_address[0]}:{self.port}"
+
+    def session_rng(self) -> random.Random:
+        with self._lock:
+            return random.Random(next(self._seeds) if self._seeds is not None else None)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def acquire(self) -> bool:
+        if self._slots is not None:
+            timeout = self.config.queue_timeout_s
+            if not (self._slots.acquire(timeout=timeout) if timeout > 0 else self._slots.acquire(blocking=False)):
+                return False
+        with self._lock:
+            self._active += 1
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._counters, "active_sessions": self._active, "max_sessions": self.config.max_sessions}
+
+    def start(self) -> "MockContainer":
+        if self._thread is None:
+            thread = threading.Thread(target=self._server.serve_forever, name="mock-container", daemon=True)
+            thread.start()
+            self._thread = thread
+            self._serving = True
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted (the CLI entry point)."""
+        self._serving = True
+        try:
+            self._server.serve_forever()
+        finally:
+            self._serving = False
+            self._server.server_close()
+
+    def stop(self) -> None:
+        if self._serving:
+            self._serving = False
+            self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockContainer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    """Add the MockConfig knobs as `--<prefix>latency-ms` etc. (shared with cli.bench)."""
+    defaults = MockConfig()
+    parser.add_argument(f"--{prefix}latency-ms", type=float, default=defaults.latency_ms, help=f"First audio/result latency. Default {defaults.latency_ms:g}.")
+    parser.add_argument(f"--{prefix}jitter-ms", type=float, default=defaults.jitter_ms, help=f"Latency spread (uniform +/-, normal/lognormal sigma). Default {defaults.jitter_ms:g}.")
+    parser.add_argument(f"--{prefix}distribution", choices=DISTRIBUTIONS, default=defaults.distribution, help=f"Latency distribution. Default {defaults.distribution}.")
+    parser.add_argument(f"--{prefix}error-rate", type=float, default=defaults.error_rate, help="Probability a turn fails with a connection error. Default 0.")
+    parser.add_argument(f"--{prefix}max-sessions", type=int, default=defaults.max_sessions, help="Concurrent sessions served; 0 = unlimited. Default 0.")
+    parser.add_argument(f"--{prefix}queue-timeout-s", type=float, default=defaults.queue_timeout_s, help="Wait for a session slot before answering 429. Default 0.")
+    parser.add_argument(f"--{prefix}tts-rtf", type=float, default=defaults.tts_rtf, help=f"Synthesis streaming pace x real time. Default {defaults.tts_rtf:g}.")
+    parser.add_argument(f"--{prefix}stt-rtf", type=float, default=defaults.stt_rtf, help=f"Recognition time per audio second. Default {defaults.stt_rtf:g}.")
+
+
+def config_from_args(args: argparse.Namespace, prefix: str = "", seed: Optional[int] = None) -> MockConfig:
+    attr = prefix.replace("-", "_")
+    return MockConfig(
+        latency_ms=getattr(args, f"{attr}latency_ms"),
+        jitter_ms=getattr(args, f"{attr}jitter_ms"),
+        distribution=getattr(args, f"{attr}distribution"),
+        error_rate=getattr(args, f"{attr}error_rate"),
+        max_sessions=getattr(args, f"{attr}max_sessions"),
+        queue_timeout_s=getattr(args, f"{attr}queue_timeout_s"),
+        tts_rtf=getattr(args, f"{attr}tts_rtf"),
+        stt_rtf=getattr(args, f"{attr}stt_rtf"),
+        seed=seed,
+    )
+
+
+def main(argv: Optional[list] = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m cli.mock_container", description="Local mock Speech container (TTS + STT) for offline load testing")
+    p.add_argument("--bind", default="127.0.0.1", help="Listen address. Default 127.0.0.1.")
+    p.add_argument("--port", type=int, default=5000, help="Listen port (0 = any free port). Default 5000.")
+    p.add_argument("--seed", type=int, default=None, help="RNG seed for latency and error injection")
+    p.add_argument("--verbose", action="store_true", help="Log every HTTP request")
+    add_config_arguments(p)
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        config = config_from_args(args, seed=args.seed)
+        mock = MockContainer(config, host=args.bind, port=args.port, verbose=args.verbose)
+    except (ValueError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    print(f"Mock Speech container on {mock.url} (TTS_HOST_URL={mock.url}, --endpoint {mock.ws_url}); Ctrl+C to stop", flush=True)
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(mock.stats()))
+    return 0
+
+
+__all__ = ["DISTRIBUTIONS", "MockConfig", "MockContainer", "canned_mp3", "canned_ogg_opus", "canned_pcm", "parse_message", "sample_latency"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
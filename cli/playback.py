@@ -8,6 +8,28 @@ always-exit-0 principle and graceful degradation).
 Central artifact path policy: no evidence written directly here; callers
 decide. This module returns structured results for evidence/logging.
 
+In-memory mode: `play_wav` also accepts a whole WAV held in a bytes /
+bytearray / memoryview (e.g. `SynthesisResult.audio_data`). The header is
+parsed in place and the PCM payload is handed to `simpleaudio.play_buffer`
+as a memoryview slice, so no file is written or read.
+
+Streaming mode: `StreamingPlayer` accepts PCM chunks as the synthesizer emits
+them (`synthesize(on_audio_chunk=player.feed)`) into a fixed-size ring
+buffer drained by a playback thread, so audio starts at first-chunk latency
+rather than after full synthesis. It prefers the optional `pyaudio` backend
+(continuous device stream); with only `simpleaudio` each drained block is
+played in turn (may leave tiny gaps between blocks).
+
+Output formats: RIFF WAV plays as above; headerless PCM (`raw-*` formats)
+plays from its `audio_formats` layout; compressed formats (Opus, MP3) are not
+decoded here and come back as UNSUPPORTED_FORMAT (success, not played), like
+a missing backend. `StreamingPlayer(framerate=fmt.sample_rate)` covers raw
+PCM at other rates.
+
+Each successful start is recorded as a `playback.start` span (play call, or
+stream reference time, -> audio handed to the device) on the shared `tracing`
+tracer when tracing is enabled.
+
 Future (T05+) queue/session logic will compose this abstraction.
 """
 
@@ -15,19 +37,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+import threading
 import time
-import wave
-from typing import Optional
+from typing import Optional, Union
+
+from . import tracing
+from .audio_formats import AudioFormat, format_for_extension, get_format
+from .wav_assembly import wav_duration_seconds
+from .wav_utils import Buffer, parse_wav_header, pcm_view
 
 try:  # Optional dependency
     import simpleaudio  # type: ignore
 except ImportError:  # pragma: no cover - environment may lack simpleaudio
     simpleaudio = None  # type: ignore
 
+try:  # Optional dependency (streaming playback backend)
+    import pyaudio  # type: ignore
+except ImportError:  # pragma: no cover - environment may lack pyaudio
+    pyaudio = None  # type: ignore
+
 
 @dataclass
 class PlaybackResult:
-    path: Path
+    path: Optional[Path]  # None when playing an in-memory buffer
     played: bool
     success: bool
     reason: str
@@ -36,33 +68,41 @@ class PlaybackResult:
     start_offset_ms: int
     duration_seconds: Optional[float]
     error: Optional[str] = None
+    streamed: bool = False  # fed chunk by chunk through StreamingPlayer
 
 
-def _wav_duration_seconds(path: Path) -> Optional[float]:
-    try:
-        with wave.open(str(path), "rb") as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-            if rate:
-                return frames / float(rate)
-    except Exception:
-        return None
-    return None
+def _trace_start(start: float, backend: str, streamed: bool = False) -> None:
+    tracing.get_default_tracer().record("playback.start", start, time.perf_counter(), backend=backend, streamed=streamed)
 
 
-def play_wav(path: str | Path, t0_monotonic: Optional[float] = None) -> PlaybackResult:
-    """Attempt to play a WAV file.
+def play_wav(path: Union[str, Path, Buffer], t0_monotonic: Optional[float] = None, output_format: Optional[str] = None) -> PlaybackResult:
+    """Attempt to play a WAV file or in-memory WAV buffer.
 
     Args:
-        path: File system path to WAV.
+        path: File system path to WAV, or a buffer holding a complete WAV.
         t0_monotonic: Optional reference start time (monotonic) to compute offset.
+        output_format: `audio_formats` name of the audio when it is not a WAV
+            (default: guessed from the file suffix; raw PCM needs it).
     Returns:
         PlaybackResult containing metadata; never raises.
     """
+    try:
+        fmt = get_format(output_format) if output_format else None
+    except ValueError:
+        fmt = None
+    if isinstance(path, (bytes, bytearray, memoryview)):
+        return _play_buffer(path, t0_monotonic, fmt)
     p = Path(path)
+    fmt = fmt or format_for_extension(p.suffix)
+    if fmt is not None and fmt.container != "riff" and (not fmt.is_pcm or p.exists()):
+        # Not a WAV on disk: compressed formats are skipped, raw PCM plays from memory
+        try:
+            return _play_buffer(p.read_bytes() if fmt.is_pcm else b"", t0_monotonic, fmt, path=p)
+        except OSError:
+            pass  # unreadable: reported by the WAV path below
     start_reference = t0_monotonic if t0_monotonic is not None else time.perf_counter()
     start_attempt = time.perf_counter()
-    duration = _wav_duration_seconds(p)
+    duration = wav_duration_seconds(p)
 
     if not p.exists():
         return PlaybackResult(
@@ -94,6 +134,7 @@ def play_wav(path: str | Path, t0_monotonic: Optional[float] = None) -> Playback
     try:
         wave_obj = simpleaudio.WaveObject.from_wave_file(str(p))  # type: ignore[attr-defined]
         play_obj = wave_obj.play()  # non-blocking
+        _trace_start(start_attempt, "simpleaudio")
         # We don't wait; session loop (future) can track completion if needed.
         return PlaybackResult(
             path=p,
@@ -120,4 +161,227 @@ def play_wav(path: str | Path, t0_monotonic: Optional[float] = None) -> Playback
         )
 
 
-__all__ = ["PlaybackResult", "play_wav"]
+def _play_buffer(buf: Buffer, t0_monotonic: Optional[float], fmt: Optional[AudioFormat] = None, path: Optional[Path] = None) -> PlaybackResult:
+    start_reference = t0_monotonic if t0_monotonic is not None else time.perf_counter()
+    start_attempt = time.perf_counter()
+    if fmt is not None and not fmt.is_pcm:
+        return PlaybackResult(
+            path=path,
+            played=False,
+            success=True,  # Synthesis OK; compressed audio is for storage/delivery, not local playback
+            reason="UNSUPPORTED_FORMAT",
+            used_simpleaudio=False,
+            start_time_monotonic=start_attempt,
+            start_offset_ms=int((start_attempt - start_reference) * 1000),
+            duration_seconds=None,
+            error=f"{fmt.name} is not decoded for playback",
+        )
+    try:
+        info = fmt.pcm_info(len(buf)) if fmt is not None and fmt.container == "raw" and bytes(buf[:4]) != b"RIFF" else parse_wav_header(buf)
+    except (ValueError, TypeError) as e:
+        return PlaybackResult(
+            path=path,
+            played=False,
+            success=False,
+            reason="INVALID_WAV",
+            used_simpleaudio=False,
+            start_time_monotonic=start_attempt,
+            start_offset_ms=int((start_attempt - start_reference) * 1000),
+            duration_seconds=None,
+            error=str(e),
+        )
+
+    if simpleaudio is None:
+        return PlaybackResult(
+            path=path,
+            played=False,
+            success=True,  # Synthesis OK; playback intentionally skipped
+            reason="SIMPLEAUDIO_MISSING",
+            used_simpleaudio=False,
+            start_time_monotonic=start_attempt,
+            start_offset_ms=int((start_attempt - start_reference) * 1000),
+            duration_seconds=info.duration_seconds,
+            error=None,
+        )
+
+    try:
+        simpleaudio.play_buffer(pcm_view(buf, info), info.channels, info.sampwidth, info.framerate)  # type: ignore[attr-defined]
+        _trace_start(start_attempt, "simpleaudio")
+        return PlaybackResult(
+            path=path,
+            played=True,
+            success=True,
+            reason="OK",
+            used_simpleaudio=True,
+            start_time_monotonic=start_attempt,
+            start_offset_ms=int((start_attempt - start_reference) * 1000),
+            duration_seconds=info.duration_seconds,
+            error=None,
+        )
+    except Exception as e:  # pragma: no cover - rare runtime issues
+        return PlaybackResult(
+            path=path,
+            played=False,
+            success=False,
+            reason="PLAY_ERROR",
+            used_simpleaudio=True,
+            start_time_monotonic=start_attempt,
+            start_offset_ms=int((start_attempt - start_reference) * 1000),
+            duration_seconds=info.duration_seconds,
+            error=str(e),
+        )
+
+
+class StreamingPlayer:
+    """Ring-buffer player that starts audio on the first synthesized chunk.
+
+    Producer: `feed(chunk)` from the synthesizer callback thread (a leading RIFF
+    header is stripped). Consumer: a playback thread that drains the ring
+    buffer into the audio device. `capacity_seconds` is the initial ring size;
+    `feed` never blocks the SDK event thread, so when synthesis runs further
+    ahead of playback the ring doubles instead (memory then tracks the
+    unplayed audio, at most the whole utterance). `finish()` marks end of input and `wait()`
+    returns the PlaybackResult once everything buffered has been played.
+    """
+
+    BLOCK_MS = 50  # consumer read granularity
+
+    def __init__(
+        self,
+        channels: int = 1,
+        sampwidth: int = 2,
+        framerate: int = 16000,
+        capacity_seconds: float = 10.0,
+        t0_monotonic: Optional[float] = None,
+    ):
+        self._channels = channels
+        self._sampwidth = sampwidth
+        self._framerate = framerate
+        frame = channels * sampwidth
+        self._ring = bytearray(max(frame, int(capacity_seconds * framerate) * frame))
+        self._read = 0  # ring index of next byte to play
+        self._fill = 0  # buffered bytes
+        self._total = 0  # bytes fed overall
+        self._seen_first_chunk = False
+        self._finished = False
+        self._cond = threading.Condition()
+        self._reference = t0_monotonic if t0_monotonic is not None else time.perf_counter()
+        self._first_play: Optional[float] = None
+        self._result: Optional[PlaybackResult] = None
+        self._thread = threading.Thread(target=self._run, name="tts-stream-playback", daemon=True)
+        self._thread.start()
+
+    def feed(self, chunk: Buffer) -> None:
+        """Append PCM without blocking; grows the ring when it is full."""
+        view = memoryview(chunk).cast("B")
+        if not self._seen_first_chunk:
+            self._seen_first_chunk = True
+            if bytes(view[:4]) == b"RIFF":
+                try:
+                    view = pcm_view(view)
+                except ValueError:
+                    pass
+        with self._cond:
+            if self._finished:
+                return
+            if len(self._ring) - self._fill < len(view):
+                self._grow(len(view))
+            while len(view):
+                write = (self._read + self._fill) % len(self._ring)
+                n = min(len(view), len(self._ring) - self._fill, len(self._ring) - write)
+                self._ring[write:write + n] = view[:n]
+                self._fill += n
+                self._total += n
+                view = view[n:]
+                self._cond.notify_all()
+
+    def _grow(self, needed: int) -> None:
+        # Lock held: copy the buffered audio to the start of a ring with room for `needed` more bytes
+        size = len(self._ring)
+        while size - self._fill < needed:
+            size *= 2
+        ring = bytearray(size)
+        head = min(self._fill, len(self._ring) - self._read)
+        ring[:head] = self._ring[self._read:self._read + head]
+        ring[head:self._fill] = self._ring[:self._fill - head]
+        self._ring = ring
+        self._read = 0
+
+    def finish(self) -> None:
+        """Mark end of input; playback drains what is buffered and stops."""
+        with self._cond:
+            self._finished = True
+            self._cond.notify_all()
+
+    def _take(self, max_bytes: int) -> Optional[bytes]:
+        """Block until audio (or end of input) is available; None at end."""
+        with self._cond:
+            while self._fill == 0 and not self._finished:
+                self._cond.wait()
+            if self._fill == 0:
+                return None
+            n = min(max_bytes, self._fill, len(self._ring) - self._read)
+            block = bytes(self._ring[self._read:self._read + n])
+            self._read = (self._read + n) % len(self._ring)
+            self._fill -= n
+            self._cond.notify_all()
+            return block
+
+    def _run(self) -> None:
+        block_bytes = self._framerate * self._channels * self._sampwidth * self.BLOCK_MS // 1000
+        backend = "pyaudio" if pyaudio is not None else "simpleaudio" if simpleaudio is not None else None
+        reason, error, played = "OK", None, False
+        try:
+            if backend == "pyaudio":
+                pa = pyaudio.PyAudio()  # type: ignore[union-attr]
+                stream = pa.open(format=pa.get_format_from_width(self._sampwidth), channels=self._channels, rate=self._framerate, output=True)
+                try:
+                    while (block := self._take(block_bytes)) is not None:
+                        if self._first_play is None:
+                            self._first_play = time.perf_counter()
+                            _trace_start(self._reference, "pyaudio", streamed=True)
+                        stream.write(block)
+                        played = True
+                finally:
+                    stream.stop_stream()
+                    stream.close()
+                    pa.terminate()
+            elif backend == "simpleaudio":
+                # Drain everything buffered each time to keep blocks (and gaps) few
+                while (block := self._take(len(self._ring))) is not None:
+                    if self._first_play is None:
+                        self._first_play = time.perf_counter()
+                        _trace_start(self._reference, "simpleaudio", streamed=True)
+                    simpleaudio.play_buffer(block, self._channels, self._sampwidth, self._framerate).wait_done()  # type: ignore[union-attr]
+                    played = True
+            else:
+                reason = "SIMPLEAUDIO_MISSING"
+                while self._take(len(self._ring)) is not None:
+                    if self._first_play is None:
+                        self._first_play = time.perf_counter()
+        except Exception as e:  # pragma: no cover - device/runtime issues
+            reason, error = "PLAY_ERROR", str(e)
+            self.finish()
+            while self._take(len(self._ring)) is not None:
+                pass
+        start = self._first_play if self._first_play is not None else time.perf_counter()
+        self._result = PlaybackResult(
+            path=None,
+            played=played,
+            success=reason != "PLAY_ERROR",
+            reason=reason,
+            used_simpleaudio=backend == "simpleaudio",
+            start_time_monotonic=start,
+            start_offset_ms=int((start - self._reference) * 1000),
+            duration_seconds=self._total / float(self._framerate * self._channels * self._sampwidth),
+            error=error,
+            streamed=True,
+        )
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[PlaybackResult]:
+        """Wait for playback to drain; None if still playing after `timeout`."""
+        self._thread.join(timeout)
+        return self._result
+
+
+__all__ = ["PlaybackResult", "StreamingPlayer", "play_wav"]
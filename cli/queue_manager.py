@@ -1,37 +1,90 @@
-"""Queue manager (T05) enforcing single active synthesis plus one queued.
+"""Queue manager (T05) enforcing `max_concurrency` active syntheses plus a bounded queue.
 
 Implements Functional Requirement FR-012 and supports Success Criterion SC-008.
 
-Policy:
-  - If no active request: new submission becomes active immediately.
-  - If active running and no queued: submission is queued (one-slot buffer).
-  - If active running and already queued: submission rejected (queue full).
+Policy (N = max_concurrency, default 1):
+  - If fewer than N requests are active: new submission becomes active immediately.
+  - If N are active and the queue has room: submission is queued.
+  - If N are active and the queue is full: submission rejected (queue full),
+    unless it outranks the lowest-priority queued request, which is then
+    displaced (DROPPED_PREEMPTED).
 
-Thread model: Each active (and later promoted queued) request runs in its own
-thread performing blocking synthesis via `tts_synth.synthesize`.
+Priorities and deadlines: the queue is a heap ordered by (priority, arrival),
+so PRIORITY_INTERACTIVE prompts start before PRIORITY_BULK jobs submitted
+earlier. A request may carry a deadline (seconds after submission by which it
+must start); requests still queued past their deadline are dropped before
+synthesis (DROPPED_DEADLINE) instead of spending container time. Drops are
+recorded in `dropped` and resolve the request's future with a failed result.
 
-Evidence: Decisions and completion results can be consumed by caller to build
-`assets/output/queue.txt` for task validation.
+Thread model: N long-lived worker threads are started once and sleep on a
+`threading.Condition` until work is dispatched; no thread is created per
+request and nothing polls. A finishing worker promotes the next queued request
+itself. Synthesis is the blocking `tts_synth.synthesize`, which reuses
+connected synthesizers from the shared `tts_pool` pool (pre-warmed at init).
+
+Completion: every accepted submission carries a `concurrent.futures.Future`
+(`QueueDecision.future`) resolved with its `CompletedResult`; `wait_all` waits
+on the same condition, so both wake the moment the last request finishes.
+Cancelling a future before its synthesis starts skips the synthesis; the
+request is delivered in order as a failed CANCELLED result.
+
+Ordering: Requests may finish out of order when N > 1; completed results are
+held in a reorder buffer and delivered (to `results` and `on_result`) strictly
+in submission order so playback never skips ahead.
+
+Speculative pre-synthesis: `hint(texts)` registers likely upcoming prompts.
+While nothing is active or queued, one worker synthesizes hints into the audio
+cache (`tts_cache`), so a later `submit` of the same text is a cache hit.
+Any real submission cancels in-flight speculation (`SynthesisHandle.cancel`)
+and puts the hint back at the front of the hint queue for the next idle spell.
+
+Tracing: with the shared `tracing` tracer enabled, each accepted request is a
+`queue.request` span (submission -> delivery) with `queue.wait` (enqueue ->
+dequeue) and `queue.execute` children; synthesis stages nest under the latter.
+
+Evidence: `on_decision` sees every decision as it is made (including drops
+after submission) and `on_result` every result as it is delivered, so callers
+can stream `assets/output/queue.txt` (task validation) or an `evidence.EventLog`
+while the queue runs.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, Optional, List, Tuple
+import heapq
+import itertools
 import threading
 import time
 import uuid
 
-from . import tts_synth
+from . import tracing, tts_cache, tts_pool, tts_synth
+from .audio_formats import get_format
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .endpoint_pool import EndpointPool
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+PRIORITIES = {"interactive": PRIORITY_INTERACTIVE, "normal": PRIORITY_NORMAL, "bulk": PRIORITY_BULK}
+
+MAX_HINTS = 32  # oldest hints are forgotten beyond this
+SPECULATIVE_CONCURRENCY = 1  # workers allowed to pre-synthesize at once
 
 
 @dataclass
 class QueueDecision:
     request_id: str
     text: str
-    decision: str  # ACTIVE_STARTED | QUEUED | REJECTED_QUEUE_FULL
+    decision: str  # ACTIVE_STARTED | QUEUED | REJECTED_QUEUE_FULL | REJECTED_STOPPED | DROPPED_DEADLINE | DROPPED_PREEMPTED
     timestamp: float  # monotonic time
+    future: Optional["Future[CompletedResult]"] = field(default=None, repr=False, compare=False)  # None when rejected
+    priority: int = PRIORITY_NORMAL
 
 
 @dataclass
@@ -45,55 +98,356 @@ class CompletedResult:
     error: Optional[str]
     started_monotonic: float
     completed_monotonic: float
+    cached: bool = False
+    audio_data: Optional[bytes] = None  # whole WAV when the manager runs in_memory
+    first_audio_monotonic: Optional[float] = None  # perf_counter() at first audio chunk
+    output_format: Optional[str] = None  # audio_formats wire name of audio_path / audio_data
+
+
+def decision_event(d: QueueDecision, max_queue: int) -> dict:
+    """Event-log record of a decision (tts_cli queue.txt / --events, tts_daemon --event-log)."""
+    return {"event": "decision", "request_id": d.request_id, "decision": d.decision, "timestamp_ms": int(d.timestamp * 1000), "text": d.text, "max_queue": max_queue, "priority": d.priority}
+
+
+def result_event(r: CompletedResult, max_queue: int) -> dict:
+    """Event-log record of a delivered result."""
+    return {
+        "event": "result", "request_id": r.request_id, "success": r.success, "reason": r.reason, "latency_ms": r.latency_ms,
+        "started_ms": int(r.started_monotonic * 1000), "completed_ms": int(r.completed_monotonic * 1000), "text": r.text,
+        "max_queue": max_queue, "cached": r.cached, "error": r.error,
+    }
+
+
+AudioSink = Callable[[bytes], None]
+_Work = Tuple[str, str, "Future[CompletedResult]", Optional[AudioSink], Optional[str]]  # (request_id, text, future, on_audio_chunk, output_format)
+
+
+@dataclass(order=True)
+class _Queued:
+    priority: int
+    seq: int  # FIFO within a priority class
+    request_id: str = field(compare=False)
+    text: str = field(compare=False)
+    future: "Future[CompletedResult]" = field(compare=False)
+    deadline: Optional[float] = field(compare=False)  # perf_counter() by which synthesis must start
+    on_audio_chunk: Optional[AudioSink] = field(default=None, compare=False)
+    output_format: Optional[str] = field(default=None, compare=False)
+
+    @property
+    def work(self) -> _Work:
+        return (self.request_id, self.text, self.future, self.on_audio_chunk, self.output_format)
 
 
 class QueueManager:
-    def __init__(self, host: str, voice: str, max_queue: int = 3):
+    def __init__(
+        self,
+        host: str,
+        voice: str,
+        max_queue: int = 3,
+        pool: Optional["EndpointPool"] = None,
+        prewarm: bool = True,
+        in_memory: bool = False,
+        max_concurrency: int = 1,
+        on_result: Optional[Callable[[CompletedResult], None]] = None,
+        synth_fn: Optional[Callable[..., tts_synth.SynthesisResult]] = None,
+        on_decision: Optional[Callable[[QueueDecision], None]] = None,
+        max_results: Optional[int] = None,
+        output_format: Optional[str] = None,
+    ):
         """Initialize queue manager.
 
         Args:
             host: Speech service host URL
             voice: Voice name
             max_queue: Maximum number of queued items (excluding active). Default 3.
+            pool: Optional EndpointPool; when given each synthesis picks a replica
+                from it and `host` is ignored.
+            prewarm: Open a pooled synthesizer connection per host up front so the
+                first submission does not pay connection setup.
+            in_memory: Return audio in `CompletedResult.audio_data` instead of
+                writing a WAV per request.
+            max_concurrency: Number of syntheses allowed to run at once. Default 1.
+            on_result: Called with each result in submission order (from a worker
+                thread) as soon as every earlier request has completed.
+            synth_fn: Replacement for `tts_synth.synthesize` (same signature),
+                e.g. the in-process stub backend used by `cli.bench --stub`.
+            on_decision: Called with every QueueDecision when it is made: from
+                `submit` for the submission itself, and later (possibly from a
+                worker thread) for DROPPED_DEADLINE / DROPPED_PREEMPTED.
+            max_results: Keep only the newest N delivered results / drops in
+                `results` and `dropped` (None keeps all; a long-running service
+                passes a bound, or 0, and consumes futures or callbacks instead).
+            output_format: Default `audio_formats` name for submissions and hints
+                (None: TTS_OUTPUT_FORMAT / FR-011 PCM WAV).
         """
         if max_queue < 0:
             raise ValueError("max_queue must be >= 0")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self._host = host
         self._voice = voice
+        self._pool = pool
+        # Cache identity hints are checked under; matches the keys synthesize() uses with `pool`
+        self._cache_identity = tts_cache.pool_identity(pool.hosts) if pool is not None else host
+        self._in_memory = in_memory
+        self._output_format = output_format
         self._max_queue = max_queue
+        self._max_concurrency = max_concurrency
+        self._on_result = on_result
+        self._on_decision = on_decision
+        self._synth_fn = synth_fn or tts_synth.synthesize
         self._lock = threading.Lock()
-        self._active_id: Optional[str] = None
-        self._active_thread: Optional[threading.Thread] = None
-        self._active_text: Optional[str] = None
-        self._queue: List[tuple[str, str]] = []  # list of (request_id, text)
-        self._results: List[CompletedResult] = []
+        self._cond = threading.Condition(self._lock)
+        self._delivering = False  # one thread runs on_result at a time, keeping calls in order
+        self._active: Dict[str, str] = {}  # request_id -> text (holding a slot)
+        self._dispatch: Deque[_Work] = deque()  # active work not yet picked up by a worker
+        self._queue: List[_Queued] = []  # heap of requests waiting for a free slot
+        self._seq = itertools.count()
+        self._dropped: Deque[QueueDecision] = deque(maxlen=max_results)
+        self._hints: Deque[str] = deque(maxlen=MAX_HINTS)
+        self._speculating: Dict[str, tts_synth.SynthesisHandle] = {}  # hint text -> handle
+        self.hints_completed = 0
+        self.hints_cancelled = 0
+        self._order: Deque[str] = deque()  # accepted, undelivered request ids in submission order
+        self._completed: Dict[str, CompletedResult] = {}  # reorder buffer
+        self._results: Deque[CompletedResult] = deque(maxlen=max_results)
+        self._tracer = tracing.get_default_tracer()
+        self._spans: Dict[str, tracing.Span] = {}  # request_id -> open queue.request span
         self._stop = False
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"tts-queue-{i}", daemon=True)
+            for i in range(max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+        if prewarm:
+            self._prewarm()
+
+    def _prewarm(self):
+        synth_pool = tts_pool.get_default_pool()
+        if synth_pool is None or tts_synth.speechsdk is None:
+            return
+        for host in (self._pool.hosts if self._pool is not None else [self._host]):
+            try:
+                synth_pool.warm(host, self._voice, output_format=self._output_format)
+            except Exception:  # best effort; synthesis reports real failures
+                pass
+
+    def submit(self, text: str, priority: int = PRIORITY_NORMAL, deadline: Optional[float] = None, on_audio_chunk: Optional[AudioSink] = None, output_format: Optional[str] = None) -> QueueDecision:
+        """Submit `text` for synthesis.
+
+        Args:
+            text: Phrase to synthesize.
+            priority: PRIORITY_INTERACTIVE (0) .. PRIORITY_BULK (2); lower runs first.
+            deadline: Seconds from now by which synthesis must start, or None.
+            on_audio_chunk: Receives this request's audio chunks as they are
+                synthesized (from a worker/SDK thread), e.g. to stream them on.
+            output_format: `audio_formats` name for this request only (default:
+                the manager's).
+        """
+        decision, dropped = self._submit(text, priority, deadline, on_audio_chunk, output_format or self._output_format)
+        if self._on_decision is not None:
+            self._on_decision(decision)
+        self._settle_dropped(dropped)
+        return decision
 
-    def submit(self, text: str) -> QueueDecision:
+    def _submit(self, text: str, priority: int, deadline: Optional[float], on_audio_chunk: Optional[AudioSink], output_format: Optional[str]) -> Tuple[QueueDecision, List[QueueDecision]]:
         t = text.strip()
         if not t:
             # Ignore empty submissions; treat as rejection but distinct reason later if needed
-            return QueueDecision(request_id=str(uuid.uuid4()), text=text, decision="REJECTED_EMPTY", timestamp=time.perf_counter())
-        with self._lock:
+            return QueueDecision(request_id=str(uuid.uuid4()), text=text, decision="REJECTED_EMPTY", timestamp=time.perf_counter(), priority=priority), []
+        with self._cond:
             now = time.perf_counter()
-            if self._active_id is None:
-                rid = str(uuid.uuid4())
-                self._active_id = rid
-                self._active_text = t
-                self._active_thread = threading.Thread(target=self._run_active, args=(rid, t), daemon=True)
-                self._active_thread.start()
-                return QueueDecision(request_id=rid, text=t, decision="ACTIVE_STARTED", timestamp=now)
+            rid = str(uuid.uuid4())
+            if self._stop:
+                return QueueDecision(request_id=rid, text=t, decision="REJECTED_STOPPED", timestamp=now, priority=priority), []
+            if deadline is not None and deadline <= 0:
+                decision = QueueDecision(request_id=rid, text=t, decision="DROPPED_DEADLINE", timestamp=now, priority=priority)
+                self._dropped.append(decision)
+                return decision, []
+            future: "Future[CompletedResult]" = Future()
+            self._preempt_speculation_locked(t)
+            if len(self._active) < self._max_concurrency:
+                self._order.append(rid)
+                self._trace_locked(rid, priority, now)
+                self._start_locked((rid, t, future, on_audio_chunk, output_format))
+                return QueueDecision(request_id=rid, text=t, decision="ACTIVE_STARTED", timestamp=now, future=future, priority=priority), []
+            dropped = self._expire_locked(now)
+            if len(self._queue) >= self._max_queue and self._queue:
+                worst = max(self._queue)
+                if priority < worst.priority:
+                    self._queue.remove(worst)
+                    heapq.heapify(self._queue)
+                    dropped.append(self._drop_locked(worst, "DROPPED_PREEMPTED", now))
             if len(self._queue) < self._max_queue:
-                rid = str(uuid.uuid4())
-                self._queue.append((rid, t))
-                return QueueDecision(request_id=rid, text=t, decision="QUEUED", timestamp=now)
-            return QueueDecision(request_id=str(uuid.uuid4()), text=t, decision="REJECTED_QUEUE_FULL", timestamp=now)
+                self._order.append(rid)
+                self._trace_locked(rid, priority, now)
+                heapq.heappush(self._queue, _Queued(priority, next(self._seq), rid, t, future, None if deadline is None else now + deadline, on_audio_chunk, output_format))
+                decision = QueueDecision(request_id=rid, text=t, decision="QUEUED", timestamp=now, future=future, priority=priority)
+            else:
+                decision = QueueDecision(request_id=rid, text=t, decision="REJECTED_QUEUE_FULL", timestamp=now, priority=priority)
+        return decision, dropped
+
+    def _trace_locked(self, rid: str, priority: int, now: float) -> None:
+        span = self._tracer.start("queue.request", start=now, request_id=rid, priority=priority)
+        if span is not None:
+            self._spans[rid] = span
+
+    def _expire_locked(self, now: float) -> List[QueueDecision]:
+        """Drop queued requests whose deadline has passed."""
+        expired = [q for q in self._queue if q.deadline is not None and q.deadline <= now]
+        if expired:
+            self._queue = [q for q in self._queue if q not in expired]
+            heapq.heapify(self._queue)
+        return [self._drop_locked(q, "DROPPED_DEADLINE", now) for q in expired]
 
-    def _run_active(self, rid: str, text: str):
+    def _drop_locked(self, item: _Queued, reason: str, now: float) -> QueueDecision:
+        """Record a drop and park its failed result in the reorder buffer."""
+        decision = QueueDecision(request_id=item.request_id, text=item.text, decision=reason, timestamp=now, future=item.future, priority=item.priority)
+        self._dropped.append(decision)
+        self._completed[item.request_id] = CompletedResult(
+            request_id=item.request_id, text=item.text, success=False, latency_ms=None, audio_path=None,
+            reason=reason, error="Dropped before synthesis", started_monotonic=now, completed_monotonic=now,
+        )
+        return decision
+
+    def _settle_dropped(self, dropped: List[QueueDecision]) -> None:
+        """Report drops, resolve their futures (outside the lock) and release held results."""
+        if not dropped:
+            return
+        for decision in dropped:
+            if self._on_decision is not None:
+                self._on_decision(decision)
+            with self._lock:
+                result = self._completed.get(decision.request_id)
+            if result is not None and decision.future.set_running_or_notify_cancel():
+                decision.future.set_result(result)
+        self._deliver()
+
+    def _next_queued_locked(self, now: float) -> Tuple[Optional[_Queued], List[QueueDecision]]:
+        """Pop the best queued request that can still meet its deadline."""
+        dropped = []
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            if item.deadline is not None and item.deadline <= now:
+                dropped.append(self._drop_locked(item, "DROPPED_DEADLINE", now))
+                continue
+            return item, dropped
+        return None, dropped
+
+    def _start_locked(self, work: _Work):
+        self._active[work[0]] = work[1]
+        self._dispatch.append(work)
+        self._cond.notify_all()
+
+    def hint(self, texts: Iterable[str]) -> int:
+        """Register likely upcoming texts for idle-time pre-synthesis into the cache.
+
+        Texts already cached or hinted are skipped. Returns the number accepted
+        (0 when caching is disabled, as there is nowhere to keep the audio).
+        """
+        audio_cache = tts_cache.get_default_cache()
+        if audio_cache is None:
+            return 0
+        # Speculation stores audio in the manager's output format; check under the same key
+        format_name = get_format(self._output_format).name
+        accepted = 0
+        with self._cond:
+            if self._stop:
+                return 0
+            for text in texts:
+                t = text.strip()
+                if not t or t in self._hints or t in self._speculating:
+                    continue
+                if audio_cache.contains(tts_cache.cache_key(t, self._voice, self._cache_identity, format_name)):
+                    continue
+                self._hints.append(t)
+                accepted += 1
+            if accepted:
+                self._cond.notify_all()
+        return accepted
+
+    def _idle_locked(self) -> bool:
+        return not self._active and not self._queue and not self._dispatch
+
+    def _can_speculate_locked(self) -> bool:
+        return bool(self._hints) and self._idle_locked() and len(self._speculating) < SPECULATIVE_CONCURRENCY
+
+    def _preempt_speculation_locked(self, text: str) -> None:
+        """Real work arrived: stop speculation (its hints are re-queued) and forget `text` as a hint."""
+        try:
+            self._hints.remove(text)
+        except ValueError:
+            pass
+        for handle in self._speculating.values():
+            handle.cancel()
+
+    def _speculate(self, text: str, handle: tts_synth.SynthesisHandle) -> None:
+        try:
+            synth = self._synth_fn(text, host=self._host, voice=self._voice, pool=self._pool, in_memory=True, handle=handle, output_format=self._output_format)
+        except Exception:  # speculation is best effort
+            synth = None
+        with self._cond:
+            del self._speculating[text]
+            if handle.cancelled and (synth is None or not synth.success):
+                self.hints_cancelled += 1
+                if not self._stop:
+                    self._hints.appendleft(text)  # retried at the next idle spell
+            elif synth is not None and synth.success:
+                self.hints_completed += 1
+            self._cond.notify_all()
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while not self._dispatch and not self._stop and not self._can_speculate_locked():
+                    self._cond.wait()
+                if self._dispatch:
+                    work: Optional[_Work] = self._dispatch.popleft()
+                elif self._stop:
+                    return
+                else:
+                    work = None
+                    hinted = self._hints.popleft()
+                    handle = self._speculating[hinted] = tts_synth.SynthesisHandle()
+            if work is None:
+                self._speculate(hinted, handle)
+                continue
+            rid, text, future, on_audio_chunk, output_format = work
+            if future.set_running_or_notify_cancel():
+                with self._lock:
+                    span = self._spans.get(rid)
+                self._tracer.record("queue.wait", span.start if span is not None else None, time.perf_counter(), parent=span)
+                with self._tracer.use(span), self._tracer.span("queue.execute", request_id=rid):
+                    result = self._execute(rid, text, on_audio_chunk, output_format)
+            else:  # the caller cancelled the future before a worker got to it: skip synthesis
+                now = time.perf_counter()
+                result = CompletedResult(
+                    request_id=rid, text=text, success=False, latency_ms=None, audio_path=None, reason="CANCELLED",
+                    error="Cancelled before synthesis", started_monotonic=now, completed_monotonic=now, output_format=output_format,
+                )
+            with self._cond:
+                del self._active[rid]
+                self._completed[rid] = result
+                # Promote next queued if any; this worker (or an idle one) picks it up
+                dropped = []
+                if not self._stop:
+                    item, dropped = self._next_queued_locked(time.perf_counter())
+                    if item is not None:
+                        self._start_locked(item.work)
+            if not future.cancelled():
+                future.set_result(result)
+            self._settle_dropped(dropped)
+            self._deliver()
+
+    def _execute(self, rid: str, text: str, on_audio_chunk: Optional[AudioSink] = None, output_format: Optional[str] = None) -> CompletedResult:
         start_mono = time.perf_counter()
-        synth = tts_synth.synthesize(text, host=self._host, voice=self._voice)
+        try:
+            synth = self._synth_fn(text, host=self._host, voice=self._voice, pool=self._pool, in_memory=self._in_memory, on_audio_chunk=on_audio_chunk, output_format=output_format)
+        except Exception as e:  # keep the slot accounting intact whatever happens
+            synth = tts_synth.SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=self._voice, host=self._host)
         end_mono = time.perf_counter()
-        result = CompletedResult(
+        return CompletedResult(
             request_id=rid,
             text=text,
             success=synth.success,
@@ -103,37 +457,64 @@ class QueueManager:
             error=synth.error,
             started_monotonic=start_mono,
             completed_monotonic=end_mono,
+            cached=synth.cached,
+            audio_data=synth.audio_data,
+            first_audio_monotonic=synth.first_audio_monotonic,
+            output_format=synth.output_format,
         )
-        with self._lock:
-            self._results.append(result)
-            # Promote next queued if any
-            if not self._stop and self._queue:
-                qid, qtext = self._queue.pop(0)
-                self._active_id = qid
-                self._active_text = qtext
-                self._active_thread = threading.Thread(target=self._run_active, args=(qid, qtext), daemon=True)
-                self._active_thread.start()
-            else:
-                self._active_id = None
-                self._active_text = None
-                self._active_thread = None
 
-    def wait_all(self, timeout: Optional[float] = None):
-        start = time.perf_counter()
-        while True:
-            with self._lock:
-                done = self._active_id is None and not self._queue
-            if done:
-                return True
-            if timeout is not None and (time.perf_counter() - start) > timeout:
-                return False
-            time.sleep(0.05)
+    def _deliver(self) -> None:
+        """Move the in-order prefix of the reorder buffer to `results` and `on_result`.
+
+        Whichever thread finds no delivery in progress delivers until nothing
+        is ready; callbacks run with no lock held, so an `on_result` that
+        submits (and drops) work re-enters here, returns at once, and leaves
+        its results to the loop already running.
+        """
+        with self._cond:
+            if self._delivering:
+                return
+            self._delivering = True
+        try:
+            while True:
+                with self._cond:
+                    ready = []
+                    while self._order and self._order[0] in self._completed:
+                        ready.append(self._completed.pop(self._order.popleft()))
+                    if not ready:
+                        self._delivering = False
+                        return
+                    self._results.extend(ready)
+                    spans = [(self._spans.pop(r.request_id, None), r) for r in ready]
+                    self._cond.notify_all()
+                for span, r in spans:
+                    if span is not None:
+                        span.set(reason=r.reason, cached=r.cached)
+                        self._tracer.finish(span, error=None if r.success else (r.error or r.reason))
+                if self._on_result is not None:
+                    for r in ready:
+                        self._on_result(r)
+        except BaseException:
+            with self._cond:
+                self._delivering = False
+            raise
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Block until every accepted request has completed and been delivered; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._order, timeout=timeout)
 
     @property
     def results(self) -> List[CompletedResult]:
         with self._lock:
             return list(self._results)
 
+    @property
+    def dropped(self) -> List[QueueDecision]:
+        """DROPPED_DEADLINE / DROPPED_PREEMPTED decisions recorded after (or at) submission."""
+        with self._lock:
+            return list(self._dropped)
+
     @property
     def pending_queue_length(self) -> int:
         with self._lock:
@@ -143,8 +524,45 @@ class QueueManager:
     def max_queue(self) -> int:
         return self._max_queue
 
-    def stop(self):
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def active_count(self) -> int:
         with self._lock:
+            return len(self._active)
+
+    def stop(self):
+        """Stop accepting work and cancel queued requests; active ones finish.
+
+        Workers exit once their current synthesis completes.
+        """
+        with self._cond:
             self._stop = True
+            self._hints.clear()
+            for handle in self._speculating.values():
+                handle.cancel()
+            dropped = list(self._queue)
+            self._queue.clear()
+            for item in dropped:
+                self._order.remove(item.request_id)
+            cancelled_spans = [self._spans.pop(item.request_id, None) for item in dropped]
+            self._cond.notify_all()
+        for item in dropped:
+            item.future.cancel()
+        for span in cancelled_spans:
+            self._tracer.finish(span, error="CANCELLED")
+        self._deliver()  # results held behind a dropped request
 
-__all__ = ["QueueManager", "QueueDecision", "CompletedResult"]
+__all__ = [
+    "QueueManager",
+    "QueueDecision",
+    "CompletedResult",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_NORMAL",
+    "PRIORITY_BULK",
+    "PRIORITIES",
+    "decision_event",
+    "result_event",
+]
@@ -0,0 +1,47 @@
+"""Container readiness probe and host-list parsing.
+
+Shared by the CLIs (`tts_cli --ping`, `--host` lists) and `endpoint_pool`,
+which re-probes ejected replicas with `ping`. Standard library plus the
+optional `httpx`, so importing it never pulls in the Speech SDK.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import List, Tuple
+
+try:
+    import httpx  # minimal dependency already in tech stack
+except ImportError:  # fail soft per FR-013
+    httpx = None  # type: ignore
+
+
+def ping(tts_url: str, timeout: float = 2.0) -> Tuple[bool, int, float, str]:
+    """Perform readiness ping.
+
+    Returns (ok, status_code, elapsed_seconds, message)
+    """
+    if httpx is None:
+        return False, 0, 0.0, "httpx not installed"
+    start = time.perf_counter()
+    try:
+        resp = httpx.get(f"{tts_url.rstrip('/')}/ready", timeout=timeout)
+        elapsed = time.perf_counter() - start
+        ok = resp.status_code == 200
+        return ok, resp.status_code, elapsed, "READY" if ok else f"Unexpected status {resp.status_code}"
+    except Exception as e:  # soft failure
+        elapsed = time.perf_counter() - start
+        return False, 0, elapsed, f"Error: {e}"[:300]
+
+
+def split_hosts(value: str) -> List[str]:
+    """Split a comma-separated host list, dropping blanks and duplicates."""
+    hosts: List[str] = []
+    for part in value.split(","):
+        h = part.strip()
+        if h and h not in hosts:
+            hosts.append(h)
+    return hosts or [value]
+
+
+__all__ = ["ping", "split_hosts"]
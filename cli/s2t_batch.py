@@ -0,0 +1,233 @@
+"""Batch transcription engine for directories of audio files.
+
+Resolves a directory, glob pattern or manifest file into a list of audio files
+and fans them out over a bounded pool of worker threads. Each worker runs one
+recognizer at a time against a replica picked from an `EndpointPool` and keeps
+one long-lived `SpeechConfig` per replica, so `concurrency` (default: one per
+replica) maps directly onto the containers being fed. The Python startup, SDK
+import and config setup are paid once per batch instead of once per file.
+
+Every input is header-checked first (`s2t_validate`, on its own thread pool),
+so corrupt or mislabeled files are reported as failures immediately and never
+occupy a recognizer.
+
+Outputs (under `output_dir`):
+  - `<stem>.txt` per input file with timestamped transcript lines
+  - `summary.json` with throughput (files/s, real-time factor) and failures
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from . import s2t_cli_sdk as s2t
+from . import s2t_preprocess, s2t_validate
+from .endpoint_pool import EndpointPool, is_connection_failure
+
+
+GLOB_CHARS = set("*?[")
+
+
+@dataclass
+class BatchItemResult:
+    audio_path: str
+    success: bool
+    segments: int
+    audio_seconds: float  # end of last recognized segment
+    elapsed_seconds: float
+    transcript_path: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    total_files: int
+    succeeded: int
+    failed: int
+    concurrency: int
+    wall_seconds: float
+    files_per_second: float
+    audio_seconds: float
+    realtime_factor: float  # audio seconds transcribed per wall-clock second
+    items: List[BatchItemResult] = field(default_factory=list)
+
+    @property
+    def failures(self) -> List[BatchItemResult]:
+        return [i for i in self.items if not i.success]
+
+
+def collect_inputs(source: str) -> List[Path]:
+    """Resolve a directory, glob pattern or manifest file into audio paths.
+
+    - Directory: all files with a supported extension (non-recursive), sorted.
+    - Glob: any pattern containing `*`, `?` or `[` (recursive `**` allowed).
+    - Manifest: any other file; one path per line, `#` comments, relative
+      paths resolved against the manifest's directory.
+    """
+    if any(ch in source for ch in GLOB_CHARS):
+        return [Path(p) for p in sorted(glob.glob(source, recursive=True)) if Path(p).is_file()]
+    src = Path(source)
+    if src.is_dir():
+        return sorted(p for p in src.iterdir() if p.is_file() and p.suffix.lower() in s2t.SUPPORTED_FORMATS)
+    if src.is_file():
+        paths = []
+        for line in src.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            p = Path(line)
+            paths.append(p if p.is_absolute() else src.parent / p)
+        return paths
+    raise FileNotFoundError(f"Batch source not found: {source}")
+
+
+def _transcript_name(path: Path, used: set) -> str:
+    name = f"{path.stem}.txt"
+    n = 1
+    while name in used:
+        name = f"{path.stem}_{n}.txt"
+        n += 1
+    used.add(name)
+    return name
+
+
+def run_batch(
+    inputs: List[Path],
+    pool: EndpointPool,
+    output_dir: Path,
+    concurrency: Optional[int] = None,
+    debug: bool = False,
+    on_item: Optional[Callable[[BatchItemResult], None]] = None,
+    preprocess: bool = True,
+) -> BatchSummary:
+    """Transcribe `inputs` with at most `concurrency` recognizers in flight.
+
+    `concurrency` defaults to the number of hosts in `pool`. Per-file failures
+    (validation or recognition) are recorded, never raised, so one bad file
+    does not abort the batch; connection failures also eject the replica.
+    With `preprocess`, inputs go through `s2t_preprocess.prepare_audio` first,
+    so a re-run over the same files reuses their decoded 16 kHz mono copies.
+    """
+    if concurrency is None:
+        concurrency = len(pool.hosts)
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    used_names: set = set()
+    jobs = [(p, output_dir / _transcript_name(p, used_names)) for p in inputs]
+    local = threading.local()
+
+    def worker_config(host: str):
+        # One SpeechConfig per (worker thread, replica), reused for every file.
+        configs = getattr(local, "speech_configs", None)
+        if configs is None:
+            configs = local.speech_configs = {}
+        if host not in configs:
+            configs[host] = s2t.speechsdk.SpeechConfig(host=host)
+        return configs[host]
+
+    def recognize(audio_path: Path) -> List[s2t.TranscriptSegment]:
+        host = pool.acquire()
+        healthy = True
+        try:
+            return s2t.transcribe_continuous(
+                audio_path, host, "", "", debug=debug, on_segment=None,
+                speech_config=worker_config(host),
+            )
+        except Exception as e:
+            healthy = not is_connection_failure(e)
+            raise
+        finally:
+            pool.release(host, success=healthy)
+
+    def run_one(audio_path: Path, transcript_path: Path) -> BatchItemResult:
+        start = time.perf_counter()
+        try:
+            if preprocess:
+                with s2t_preprocess.prepare_audio(audio_path) as prepared:
+                    segments = recognize(prepared.path)
+            else:
+                segments = recognize(audio_path)
+            lines = [f"[{s2t.format_timestamp(seg.offset_ticks)}] {seg.text}" for seg in segments]
+            transcript_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+            return BatchItemResult(
+                audio_path=str(audio_path),
+                success=True,
+                segments=len(segments),
+                audio_seconds=segments[-1].end_seconds if segments else 0.0,
+                elapsed_seconds=round(time.perf_counter() - start, 3),
+                transcript_path=str(transcript_path),
+            )
+        except Exception as e:  # recorded per file, batch continues
+            return BatchItemResult(
+                audio_path=str(audio_path),
+                success=False,
+                segments=0,
+                audio_seconds=0.0,
+                elapsed_seconds=round(time.perf_counter() - start, 3),
+                error=str(e),
+            )
+
+    items: List[BatchItemResult] = []
+    wall_start = time.perf_counter()
+    checked = s2t_validate.validate_many([p for p, _ in jobs], check=lambda p: s2t.check_audio_file(str(p)))
+    valid_jobs = []
+    for job, check in zip(jobs, checked):
+        if check.ok:
+            valid_jobs.append(job)
+            continue
+        item = BatchItemResult(
+            audio_path=str(job[0]),
+            success=False,
+            segments=0,
+            audio_seconds=0.0,
+            elapsed_seconds=round(check.elapsed_us / 1e6, 6),
+            error=check.error,
+        )
+        items.append(item)
+        if on_item is not None:
+            on_item(item)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="s2t-batch") as executor:
+        futures = [executor.submit(run_one, p, t) for p, t in valid_jobs]
+        for fut in as_completed(futures):
+            item = fut.result()
+            items.append(item)
+            if on_item is not None:
+                on_item(item)
+    wall = time.perf_counter() - wall_start
+
+    order = {str(p): i for i, (p, _) in enumerate(jobs)}
+    items.sort(key=lambda i: order[i.audio_path])
+    audio_seconds = sum(i.audio_seconds for i in items)
+    succeeded = sum(1 for i in items if i.success)
+    summary = BatchSummary(
+        total_files=len(items),
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        concurrency=concurrency,
+        wall_seconds=round(wall, 3),
+        files_per_second=round(len(items) / wall, 3) if wall > 0 else 0.0,
+        audio_seconds=round(audio_seconds, 3),
+        realtime_factor=round(audio_seconds / wall, 3) if wall > 0 else 0.0,
+        items=items,
+    )
+    write_summary(summary, output_dir / "summary.json", pool.hosts)
+    return summary
+
+
+def write_summary(summary: BatchSummary, path: Path, endpoints: List[str]) -> None:
+    payload = asdict(summary)
+    payload["generated_utc"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    payload["endpoints"] = endpoints
+    payload["failures"] = [asdict(i) for i in summary.failures]
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+__all__ = ["BatchItemResult", "BatchSummary", "collect_inputs", "run_batch"]
@@ -0,0 +1,224 @@
+"""Chunked long-audio transcription with energy-based VAD splitting.
+
+Pipeline stage for recordings near or above `MAX_FILE_SIZE_MB`: the PCM is
+scanned with a vectorized (NumPy) energy voice-activity detector, cut into
+chunks at silence boundaries close to `max_chunk_seconds`, and every chunk is
+recognized in parallel across the replicas of an `EndpointPool`. Results are
+stitched back with offsets relative to the whole file.
+
+Overlap stitching: each chunk is recognized with `overlap_seconds` of extra
+audio on both sides, but only segments whose midpoint falls inside the chunk's
+own span are kept. A word cut by a hard split (no silence found) is therefore
+recognized whole by one neighbour and never duplicated.
+
+Input must be 16-bit PCM WAV. NumPy is an optional dependency only required
+for this mode.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # only needed for chunked mode
+    np = None  # type: ignore
+
+from . import s2t_cli_sdk as s2t
+from .endpoint_pool import EndpointPool
+
+FRAME_MS = 30  # VAD analysis window
+SILENCE_MARGIN_DB = 10.0  # frames quieter than noise floor + margin are silence
+MIN_SILENCE_MS = 300  # preferred silence run length at a cut
+SEARCH_FRACTION = 0.25  # look back this share of max_chunk_seconds for a cut
+
+
+@dataclass
+class AudioChunk:
+    index: int
+    start_frame: int  # first audio frame sent for recognition (includes overlap)
+    end_frame: int  # one past last frame sent
+    keep_start_frame: int  # segments with midpoint in [keep_start, keep_end) are kept
+    keep_end_frame: int
+
+
+def frame_energy_db(samples, rate: int, frame_ms: int = FRAME_MS):
+    """Return the mean energy (dB) of each analysis frame."""
+    frame = max(1, int(rate * frame_ms / 1000))
+    n = len(samples) // frame
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[: n * frame].astype(np.float32).reshape(n, frame)
+    return 10.0 * np.log10((frames * frames).mean(axis=1) + 1e-9)
+
+
+def _silence_from_energy(energy_db, margin_db: float = SILENCE_MARGIN_DB):
+    if len(energy_db) == 0:
+        return np.zeros(0, dtype=bool)
+    floor = np.percentile(energy_db, 10)
+    return energy_db < floor + margin_db
+
+
+def silence_mask(samples, rate: int, frame_ms: int = FRAME_MS, margin_db: float = SILENCE_MARGIN_DB):
+    """Return a boolean array (one entry per analysis frame) marking silence.
+
+    The threshold adapts to the recording: the 10th percentile of frame energy
+    is taken as the noise floor and anything within `margin_db` of it is silent.
+    """
+    return _silence_from_energy(frame_energy_db(samples, rate, frame_ms), margin_db)
+
+
+def plan_chunks(
+    samples,
+    rate: int,
+    max_chunk_seconds: float = 60.0,
+    overlap_seconds: float = 0.5,
+    frame_ms: int = FRAME_MS,
+) -> List[AudioChunk]:
+    """Split `samples` (mono) into chunks no longer than `max_chunk_seconds`.
+
+    Each cut is placed at the centre of the best silence run within the last
+    SEARCH_FRACTION of the chunk; without any silence it falls back to the
+    centre of the lowest-energy run there (a hard cut covered by the overlap).
+    """
+    if max_chunk_seconds <= 0:
+        raise ValueError("max_chunk_seconds must be > 0")
+    total = len(samples)
+    frame = max(1, int(rate * frame_ms / 1000))
+    max_frames = int(max_chunk_seconds * rate)
+    overlap = int(overlap_seconds * rate)
+    energy_db = frame_energy_db(samples, rate, frame_ms)
+    silent = _silence_from_energy(energy_db).astype(np.float32)
+    run = max(1, MIN_SILENCE_MS // frame_ms)
+    kernel = np.ones(run, dtype=np.float32)
+    # score[i] = number of silent analysis frames in the window centred on frame i;
+    # loudness[i] = mean energy of that window, for cuts where nothing is silent
+    score = np.convolve(silent, kernel, mode="same") if len(silent) else silent
+    loudness = np.convolve(energy_db, kernel / run, mode="same") if len(energy_db) else energy_db
+
+    cuts = [0]
+    while total - cuts[-1] > max_frames:
+        target = cuts[-1] + max_frames
+        lo = max(cuts[-1] + 1, target - int(max_frames * SEARCH_FRACTION)) // frame
+        hi = target // frame
+        window = score[lo:hi]
+        if len(window) == 0:
+            cuts.append(target)
+            continue
+        # arg{max,min} over the reversed window prefers the candidate closest to the target
+        if window.max() > 0:
+            best = hi - 1 - int(np.argmax(window[::-1]))
+        else:
+            best = hi - 1 - int(np.argmin(loudness[lo:hi][::-1]))
+        cuts.append(min(max(best * frame + frame // 2, cuts[-1] + 1), target))
+    cuts.append(total)
+
+    chunks = []
+    for i in range(len(cuts) - 1):
+        keep_start, keep_end = cuts[i], cuts[i + 1]
+        chunks.append(AudioChunk(
+            index=i,
+            start_frame=max(0, keep_start - overlap),
+            end_frame=min(total, keep_end + overlap),
+            keep_start_frame=keep_start,
+            keep_end_frame=keep_end,
+        ))
+    return chunks
+
+
+def stitch_segments(chunk: AudioChunk, rate: int, segments: List[s2t.TranscriptSegment]) -> List[s2t.TranscriptSegment]:
+    """Shift chunk-relative segments to file offsets and drop overlap duplicates."""
+    base_ticks = chunk.start_frame * s2t.TICKS_PER_SECOND // rate
+    keep_start = chunk.keep_start_frame * s2t.TICKS_PER_SECOND // rate
+    keep_end = chunk.keep_end_frame * s2t.TICKS_PER_SECOND // rate
+    kept = []
+    for seg in segments:
+        shifted = replace(seg, offset_ticks=seg.offset_ticks + base_ticks)
+        midpoint = shifted.offset_ticks + shifted.duration_ticks // 2
+        if keep_start <= midpoint < keep_end:
+            kept.append(shifted)
+    return kept
+
+
+def transcribe_chunked(
+    audio_path: Path,
+    pool: EndpointPool,
+    max_chunk_seconds: float = 60.0,
+    overlap_seconds: float = 0.5,
+    concurrency: Optional[int] = None,
+    debug: bool = False,
+    on_segment: Optional[Callable[[s2t.TranscriptSegment], None]] = s2t.print_segment,
+) -> List[s2t.TranscriptSegment]:
+    """Split a WAV at silence, recognize chunks in parallel and stitch the result.
+
+    Segments are passed to `on_segment` in file order as soon as every earlier
+    chunk has finished. `concurrency` defaults to one recognizer per replica.
+
+    Raises:
+        RuntimeError: NumPy missing, or any chunk failed recognition.
+        ValueError: Input is not 16-bit PCM WAV.
+    """
+    if np is None:
+        raise RuntimeError("numpy not installed (required for chunked transcription)")
+    if audio_path.suffix.lower() != ".wav":
+        raise ValueError("Chunked transcription requires WAV input")
+    with wave.open(str(audio_path), "rb") as wf:
+        params = wf.getparams()
+        if params.sampwidth != 2:
+            raise ValueError(f"Chunked transcription requires 16-bit PCM (got {params.sampwidth * 8}-bit)")
+        pcm = wf.readframes(params.nframes)
+    rate, channels = params.framerate, params.nchannels
+    samples = np.frombuffer(pcm, dtype="<i2")
+    if channels > 1:
+        samples = samples[: len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+    chunks = plan_chunks(samples, rate, max_chunk_seconds, overlap_seconds)
+    if concurrency is None:
+        concurrency = len(pool.hosts)
+    if debug:
+        print(f"[DEBUG] {len(chunks)} chunks, concurrency={concurrency}", file=sys.stderr)
+
+    view = memoryview(pcm)
+    frame_bytes = channels * params.sampwidth
+    lock = threading.Lock()
+    done: Dict[int, List[s2t.TranscriptSegment]] = {}
+    emitted: List[s2t.TranscriptSegment] = []
+    next_index = 0
+
+    def run_chunk(chunk: AudioChunk, workdir: Path) -> None:
+        nonlocal next_index
+        chunk_path = workdir / f"chunk_{chunk.index:05d}.wav"
+        with wave.open(str(chunk_path), "wb") as out:
+            out.setnchannels(channels)
+            out.setsampwidth(params.sampwidth)
+            out.setframerate(rate)
+            out.writeframes(view[chunk.start_frame * frame_bytes: chunk.end_frame * frame_bytes])
+        with pool.lease() as host:
+            segments = s2t.transcribe_continuous(chunk_path, host, "", "", debug=debug, on_segment=None)
+        chunk_path.unlink()
+        with lock:
+            done[chunk.index] = stitch_segments(chunk, rate, segments)
+            # Release segments in file order once all earlier chunks are done
+            while next_index in done:
+                for seg in done.pop(next_index):
+                    emitted.append(seg)
+                    if on_segment is not None:
+                        on_segment(seg)
+                next_index += 1
+
+    with tempfile.TemporaryDirectory(prefix="s2t-chunks-") as tmp:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="s2t-chunk") as executor:
+            futures = [executor.submit(run_chunk, c, Path(tmp)) for c in chunks]
+            errors = [f.exception() for f in futures if f.exception() is not None]
+    if errors:
+        raise RuntimeError(f"{len(errors)} of {len(chunks)} chunks failed: {errors[0]}")
+    return emitted
+
+
+__all__ = ["AudioChunk", "frame_energy_db", "silence_mask", "plan_chunks", "stitch_segments", "transcribe_chunked"]
@@ -9,8 +9,11 @@ container for transcription using the official Azure SDK, then displays the time
 import argparse
 import os
 import sys
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, List, Optional
 
 import azure.cognitiveservices.speech as speechsdk
 
@@ -20,10 +23,56 @@ DEFAULT_ENDPOINT = "ws://localhost:5000"
 MAX_FILE_SIZE_MB = 50
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 SUPPORTED_FORMATS = {".wav", ".mp3", ".flac"}
+TICKS_PER_SECOND = 10_000_000  # SDK offsets/durations are in 100 ns ticks
+OUTPUT_DIR = Path(__file__).resolve().parents[1] / "assets" / "output"
 
 
-def validate_audio_file(file_path: str) -> Path:
-    """Validate audio file exists and meets requirements."""
+@dataclass
+class TranscriptSegment:
+    """A final recognized segment with its position in the source audio."""
+    text: str
+    offset_ticks: int
+    duration_ticks: int
+    speaker_id: Optional[str] = None
+
+    @property
+    def start_seconds(self) -> float:
+        return self.offset_ticks / TICKS_PER_SECOND
+
+    @property
+    def end_seconds(self) -> float:
+        return (self.offset_ticks + self.duration_ticks) / TICKS_PER_SECOND
+
+
+def format_timestamp(offset_ticks: int) -> str:
+    """Convert offset ticks to HH:MM:SS.mmm format."""
+    offset_seconds = offset_ticks / TICKS_PER_SECOND
+    hours = int(offset_seconds // 3600)
+    minutes = int((offset_seconds % 3600) // 60)
+    seconds = offset_seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+
+
+def print_segment(segment: TranscriptSegment) -> None:
+    """Default segment sink: print one timestamped line to stdout."""
+    print(f"[{format_timestamp(segment.offset_ticks)}] {segment.text}", flush=True)
+
+
+def validate_audio_file(file_path: str, max_size_bytes: Optional[int] = MAX_FILE_SIZE_BYTES) -> Path:
+    """Validate audio file exists and meets requirements.
+    
+    `max_size_bytes=None` lifts the size cap (chunked mode splits large files).
+    """
+    return check_audio_file(file_path, max_size_bytes).path
+
+
+def check_audio_file(file_path: str, max_size_bytes: Optional[int] = MAX_FILE_SIZE_BYTES):
+    """`validate_audio_file` checks plus header sniffing; returns the `s2t_validate.AudioProbe`.
+    
+    The header (RIFF/fmt, FLAC STREAMINFO, MP3 frames) is parsed from the
+    first few KB, so corrupt or mislabeled files fail here rather than inside
+    a container session.
+    """
     audio_path = Path(file_path)
     
     if not audio_path.exists():
@@ -40,23 +89,31 @@ def validate_audio_file(file_path: str) -> Path:
         )
     
     file_size = audio_path.stat().st_size
-    if file_size > MAX_FILE_SIZE_BYTES:
+    if max_size_bytes is not None and file_size > max_size_bytes:
         file_size_mb = file_size / (1024 * 1024)
         raise ValueError(
             f"File size ({file_size_mb:.2f} MB) exceeds maximum "
-            f"allowed size of {MAX_FILE_SIZE_MB} MB"
+            f"allowed size of {max_size_bytes / (1024 * 1024):.0f} MB"
+            + (" (use --chunked to split WAV recordings)" if file_extension == ".wav" else "")
         )
     
-    return audio_path
+    return import_cli_module("s2t_validate").probe_audio(audio_path)
 
 
-def load_environment() -> dict:
-    """Load required environment variables."""
+def load_environment(require_billing: bool = True) -> dict:
+    """Load required environment variables.
+    
+    With `require_billing=False` (the local mock container, `--mock`) the key and
+    region checks are skipped; missing values come back as "" / "local".
+    """
     api_key = os.getenv("APIKEY") or os.getenv("Billing__SubscriptionKey")
     endpoint = os.getenv("SPEECH_ENDPOINT", DEFAULT_ENDPOINT)
     region = os.getenv("Billing__Region", "local")
     billing = os.getenv("Billing", "")
     
+    if not require_billing:
+        return {"api_key": api_key or "", "endpoint": endpoint, "region": region or "local", "billing": billing}
+    
     if not api_key:
         raise ValueError(
             "API key not found. Set APIKEY or Billing__SubscriptionKey "
@@ -108,14 +165,7 @@ def transcribe_audio(audio_path: Path, endpoint: str, api_key: str, region: str,
     
     # Check result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        # Calculate timestamp (for single result, starts at 0)
-        offset_seconds = result.offset / 10_000_000  # Convert from ticks
-        hours = int(offset_seconds // 3600)
-        minutes = int((offset_seconds % 3600) // 60)
-        seconds = offset_seconds % 60
-        timestamp = f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
-        
-        print(f"[{timestamp}] {result.text}")
+        print(f"[{format_timestamp(result.offset)}] {result.text}")
         
     elif result.reason == speechsdk.ResultReason.NoMatch:
         print("Error: No speech could be recognized", file=sys.stderr)
@@ -136,7 +186,128 @@ def transcribe_audio(audio_path: Path, endpoint: str, api_key: str, region: str,
         sys.exit(2)
 
 
-def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, region: str, cloud_mode: bool = False, debug: bool = False) -> None:
+def transcribe_continuous(
+    audio_path: Optional[Path],
+    endpoint: str,
+    api_key: str,
+    region: str,
+    debug: bool = False,
+    on_segment: Optional[Callable[[TranscriptSegment], None]] = print_segment,
+    timeout: Optional[float] = None,
+    speech_config=None,
+    audio_config=None,
+    on_partial: Optional[Callable[[str], None]] = None,
+) -> List[TranscriptSegment]:
+    """Transcribe a whole audio file using continuous recognition.
+
+    `transcribe_audio` stops after the first utterance (recognize_once). This
+    variant keeps the session open until the SDK reports the end of the audio,
+    handing every final segment to `on_segment` as soon as it is recognized.
+    Completion is signalled by an Event set from the session_stopped/canceled
+    callbacks, so the caller returns as soon as the container is done.
+
+    Args:
+        audio_path: Path to audio file (may be None when audio_config is given)
+        endpoint: Container WebSocket endpoint (e.g., ws://localhost:5000)
+        api_key: Azure subscription key (unused for container auth, kept for parity)
+        region: Azure region (unused for container auth, kept for parity)
+        debug: Enable debug output
+        on_segment: Called with each final TranscriptSegment (None to disable)
+        timeout: Optional maximum seconds to wait for the session to finish
+        speech_config: Optional pre-built SpeechConfig to reuse across files
+        audio_config: Optional AudioConfig (e.g. push stream) used instead of audio_path
+        on_partial: Called with intermediate (recognizing) text while audio arrives
+
+    Returns:
+        All recognized segments in order.
+
+    Raises:
+        RuntimeError: If recognition is canceled with an error or times out.
+    """
+    if debug:
+        print(f"[DEBUG] Endpoint: {endpoint}", file=sys.stderr)
+        if audio_path is not None:
+            print(f"[DEBUG] Audio file: {audio_path}", file=sys.stderr)
+        print("[DEBUG] Continuous recognition enabled", file=sys.stderr)
+
+    if speech_config is None:
+        speech_config = speechsdk.SpeechConfig(host=endpoint)
+    if audio_config is None:
+        audio_config = speechsdk.AudioConfig(filename=str(audio_path))
+    speech_recognizer = speechsdk.SpeechRecognizer(
+        speech_config=speech_config,
+        audio_config=audio_config
+    )
+
+    done = threading.Event()
+    segments: List[TranscriptSegment] = []
+    errors: List[str] = []
+
+    def recognized_cb(evt: speechsdk.SpeechRecognitionEventArgs):
+        """Emit each final segment immediately."""
+        if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech and evt.result.text:
+            segment = TranscriptSegment(
+                text=evt.result.text,
+                offset_ticks=evt.result.offset,
+                duration_ticks=evt.result.duration,
+            )
+            segments.append(segment)
+            if on_segment is not None:
+                on_segment(segment)
+        elif evt.result.reason == speechsdk.ResultReason.NoMatch and debug:
+            print("[DEBUG] NOMATCH: Speech could not be recognized", file=sys.stderr)
+
+    def session_stopped_cb(evt: speechsdk.SessionEventArgs):
+        if debug:
+            print(f"[DEBUG] Session stopped: {evt.session_id}", file=sys.stderr)
+        done.set()
+
+    def canceled_cb(evt: speechsdk.SpeechRecognitionCanceledEventArgs):
+        # EndOfStream is the normal way a file-backed session ends.
+        if evt.reason == speechsdk.CancellationReason.Error:
+            message = f"Recognition canceled: {evt.error_details}"
+            if "connection" in (evt.error_details or "").lower():
+                message += " (ensure the Speech container is running at the configured endpoint)"
+            errors.append(message)
+        elif debug:
+            print(f"[DEBUG] Canceled: {evt.reason}", file=sys.stderr)
+        done.set()
+
+    speech_recognizer.recognized.connect(recognized_cb)
+    if on_partial is not None:
+        speech_recognizer.recognizing.connect(lambda evt: on_partial(evt.result.text))
+    speech_recognizer.session_stopped.connect(session_stopped_cb)
+    speech_recognizer.canceled.connect(canceled_cb)
+
+    if debug:
+        print("[DEBUG] Starting continuous recognition...", file=sys.stderr)
+
+    speech_recognizer.start_continuous_recognition_async().get()
+    finished = done.wait(timeout)
+    speech_recognizer.stop_continuous_recognition_async().get()
+
+    if errors:
+        raise RuntimeError(errors[0])
+    if not finished:
+        raise RuntimeError(f"Recognition did not finish within {timeout} seconds")
+    return segments
+
+
+def print_speaker_segment(segment: TranscriptSegment) -> None:
+    """Default diarization sink: print one timestamped, speaker-labelled line to stdout."""
+    print(f"[{format_timestamp(segment.offset_ticks)}] Speaker {segment.speaker_id or 'Unknown'}: {segment.text}", flush=True)
+
+
+def transcribe_with_diarization(
+    audio_path: Path,
+    endpoint: str,
+    api_key: str,
+    region: str,
+    cloud_mode: bool = False,
+    debug: bool = False,
+    on_segment: Optional[Callable[[TranscriptSegment], None]] = print_speaker_segment,
+    timeout: Optional[float] = None,
+) -> List[TranscriptSegment]:
     """Transcribe audio file with speaker diarization using Azure Speech SDK.
     
     Supports both container and cloud modes:
@@ -145,6 +316,11 @@ def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, r
       This is implemented for future container versions that may support diarization
     - Cloud mode (cloud_mode=True): Uses Azure Speech service with subscription/region
     
+    Each final segment (with its speaker_id) goes to `on_segment` as soon as it
+    is transcribed, e.g. `s2t_sinks` writers fanned out with the console printer.
+    Completion is signalled by an Event set from the session_stopped/canceled
+    callbacks, so the call returns as soon as the service is done.
+    
     Args:
         audio_path: Path to audio file
         endpoint: Container WebSocket endpoint (e.g., ws://localhost:5000)
@@ -152,6 +328,14 @@ def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, r
         region: Azure region (e.g., uksouth)
         cloud_mode: If True, use cloud service; if False, use container
         debug: Enable debug output
+        on_segment: Called with each final TranscriptSegment (None to disable)
+        timeout: Optional maximum seconds to wait for the session to finish
+    
+    Returns:
+        All transcribed segments in order.
+    
+    Raises:
+        RuntimeError: If transcription is canceled with an error or times out.
     """
     
     if debug:
@@ -194,23 +378,22 @@ def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, r
     )
     
     # Track transcription state
-    transcribing_stop = False
-    error_occurred = False
-    
-    def format_timestamp(offset_ticks: int) -> str:
-        """Convert offset ticks to HH:MM:SS.mmm format."""
-        offset_seconds = offset_ticks / 10_000_000
-        hours = int(offset_seconds // 3600)
-        minutes = int((offset_seconds % 3600) // 60)
-        seconds = offset_seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+    done = threading.Event()
+    segments: List[TranscriptSegment] = []
+    errors: List[str] = []
     
     def transcribed_cb(evt: speechsdk.SpeechRecognitionEventArgs):
-        """Handle final transcribed results."""
-        if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            timestamp = format_timestamp(evt.result.offset)
-            speaker_id = evt.result.speaker_id if evt.result.speaker_id else "Unknown"
-            print(f"[{timestamp}] Speaker {speaker_id}: {evt.result.text}")
+        """Emit each final transcribed segment immediately."""
+        if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech and evt.result.text:
+            segment = TranscriptSegment(
+                text=evt.result.text,
+                offset_ticks=evt.result.offset,
+                duration_ticks=evt.result.duration,
+                speaker_id=evt.result.speaker_id or None,
+            )
+            segments.append(segment)
+            if on_segment is not None:
+                on_segment(segment)
         elif evt.result.reason == speechsdk.ResultReason.NoMatch:
             if debug:
                 print("[DEBUG] NOMATCH: Speech could not be transcribed", file=sys.stderr)
@@ -229,28 +412,25 @@ def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, r
     
     def session_stopped_cb(evt: speechsdk.SessionEventArgs):
         """Handle session stopped event."""
-        nonlocal transcribing_stop
         if debug:
             print(f"[DEBUG] Session stopped: {evt.session_id}", file=sys.stderr)
-        transcribing_stop = True
+        done.set()
     
     def canceled_cb(evt: speechsdk.SessionEventArgs):
         """Handle cancellation event."""
-        nonlocal transcribing_stop, error_occurred
         if debug:
             print(f"[DEBUG] Canceled event", file=sys.stderr)
         
         cancellation = evt.result.cancellation_details if hasattr(evt, 'result') else None
-        if cancellation:
-            print(f"Error: Recognition canceled: {cancellation.reason}", file=sys.stderr)
-            
-            if cancellation.reason == speechsdk.CancellationReason.Error:
-                print(f"Error details: {cancellation.error_details}", file=sys.stderr)
-                if "connection" in cancellation.error_details.lower():
-                    print("\nHint: Ensure the Speech container is running at the configured endpoint.", file=sys.stderr)
-                error_occurred = True
+        if cancellation and cancellation.reason == speechsdk.CancellationReason.Error:
+            message = f"Recognition canceled: {cancellation.error_details}"
+            if "connection" in (cancellation.error_details or "").lower():
+                message += " (ensure the Speech container is running at the configured endpoint)"
+            errors.append(message)
+        elif cancellation and debug:
+            print(f"[DEBUG] Canceled: {cancellation.reason}", file=sys.stderr)
         
-        transcribing_stop = True
+        done.set()
     
     # Connect callbacks to events
     conversation_transcriber.transcribed.connect(transcribed_cb)
@@ -263,18 +443,164 @@ def transcribe_with_diarization(audio_path: Path, endpoint: str, api_key: str, r
     if debug:
         print("[DEBUG] Starting transcription with diarization...", file=sys.stderr)
     
-    # Start transcription
-    conversation_transcriber.start_transcribing_async()
+    # Start transcription and wait for the session to end
+    conversation_transcriber.start_transcribing_async().get()
+    finished = done.wait(timeout)
+    conversation_transcriber.stop_transcribing_async().get()
     
-    # Wait for transcription to complete
-    while not transcribing_stop:
-        time.sleep(0.5)
+    if errors:
+        raise RuntimeError(errors[0])
+    if not finished:
+        raise RuntimeError(f"Transcription did not finish within {timeout} seconds")
+    return segments
+
+
+def import_cli_module(name: str):
+    """Import a sibling `cli.<name>` module, also when this file runs as a script."""
+    import importlib
+    # Ensure repository root is on sys.path so the cli package resolves
+    repo_root = Path(__file__).resolve().parent.parent
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    return importlib.import_module(f"cli.{name}")
+
+
+def build_endpoint_pool(endpoints: str):
+    """Build an EndpointPool from a comma-separated endpoint list."""
+    endpoint_pool = import_cli_module("endpoint_pool")
+    return endpoint_pool.EndpointPool.from_value(endpoints)
+
+
+def select_endpoint(endpoints: str) -> str:
+    """Pick one endpoint; with several replicas prefer the first that reports ready."""
+    pool = build_endpoint_pool(endpoints)
+    if len(pool.hosts) > 1:
+        pool.probe_all()
+    return pool.acquire()
+
+
+def preprocess_audio(audio_path: Path, debug: bool = False):
+    """Decode/downmix/resample to 16 kHz mono PCM (cached by content); returns a `PreparedAudio`."""
+    prepared = import_cli_module("s2t_preprocess").prepare_audio(audio_path)
+    if debug:
+        if prepared.converted:
+            origin = "decode cache" if prepared.cached else f"{prepared.source_rate} Hz, {prepared.source_channels} ch"
+            print(f"[DEBUG] Preprocessed {audio_path} -> {prepared.path} ({origin}, {prepared.decode_ms} ms)", file=sys.stderr)
+        else:
+            print(f"[DEBUG] Preprocessing skipped for {audio_path}: {prepared.reason}", file=sys.stderr)
+    return prepared
+
+
+def run_validate_only(args: argparse.Namespace) -> int:
+    """Run --validate-only: header-check the input(s) in parallel, print one line per file."""
+    s2t_validate = import_cli_module("s2t_validate")
+    if args.batch:
+        inputs = import_cli_module("s2t_batch").collect_inputs(args.batch)
+        if not inputs:
+            raise ValueError(f"No audio files found for batch source: {args.batch}")
+    else:
+        inputs = [Path(args.audio_file)]
+    max_size_bytes = None if args.chunked else MAX_FILE_SIZE_BYTES
+    started = time.perf_counter()
+    results = s2t_validate.validate_many(inputs, check=lambda p: check_audio_file(str(p), max_size_bytes), workers=args.concurrency)
+    wall = time.perf_counter() - started
+    for r in results:
+        if r.ok:
+            p = r.probe
+            duration = f"{p.duration_seconds:.2f}s" if p.duration_seconds is not None else "?s"
+            print(f"OK   {r.path} | {p.codec} {p.sample_rate} Hz {p.channels} ch {duration} ({r.elapsed_us:.0f} us)")
+        else:
+            print(f"FAIL {r.path} | {r.error} ({r.elapsed_us:.0f} us)")
+    failed = sum(1 for r in results if not r.ok)
+    print(f"VALIDATE complete | files={len(results)} valid={len(results) - failed} invalid={failed} wall_ms={wall * 1000:.1f}")
+    return 0 if failed == 0 else 1
+
+
+def run_batch_mode(args: argparse.Namespace) -> int:
+    """Run --batch: transcribe every resolved input and print a summary."""
+    s2t_batch = import_cli_module("s2t_batch")
+    
+    env_config = load_environment(require_billing=not args.mock)
+    pool = build_endpoint_pool(args.endpoint or env_config["endpoint"])
+    inputs = s2t_batch.collect_inputs(args.batch)
+    if not inputs:
+        raise ValueError(f"No audio files found for batch source: {args.batch}")
+    output_dir = Path(args.output_dir) if args.output_dir else (
+        OUTPUT_DIR / f"batch_{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}"
+    )
     
-    # Stop transcription
-    conversation_transcriber.stop_transcribing_async()
+    def report(item) -> None:
+        status = "OK  " if item.success else "FAIL"
+        detail = f"{item.segments} segments" if item.success else item.error
+        print(f"{status} {item.audio_path} ({item.elapsed_seconds:.2f}s) {detail}", flush=True)
     
-    if error_occurred:
-        sys.exit(2)
+    summary = s2t_batch.run_batch(
+        inputs, pool, output_dir, concurrency=args.concurrency, debug=args.debug, on_item=report,
+        preprocess=not args.no_preprocess,
+    )
+    print(
+        f"BATCH complete | files={summary.total_files} succeeded={summary.succeeded} "
+        f"failed={summary.failed} wall_s={summary.wall_seconds} files_per_s={summary.files_per_second} "
+        f"rtf={summary.realtime_factor} | summary={output_dir / 'summary.json'}"
+    )
+    return 0 if summary.failed == 0 else 1
+
+
+def run_chunked_mode(args: argparse.Namespace, audio_path: Path, on_segment: Optional[Callable[[TranscriptSegment], None]] = print_segment) -> int:
+    """Run --chunked: VAD-split the file and recognize chunks across all endpoints."""
+    s2t_chunking = import_cli_module("s2t_chunking")
+    
+    env_config = load_environment(require_billing=not args.mock)
+    pool = build_endpoint_pool(args.endpoint or env_config["endpoint"])
+    segments = s2t_chunking.transcribe_chunked(
+        audio_path,
+        pool,
+        max_chunk_seconds=args.max_chunk_seconds,
+        overlap_seconds=args.overlap_seconds,
+        concurrency=args.concurrency,
+        debug=args.debug,
+        on_segment=on_segment,
+    )
+    if not segments:
+        print("Error: No speech could be recognized", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_stream_mode(args: argparse.Namespace, on_segment: Optional[Callable[[TranscriptSegment], None]] = print_segment) -> int:
+    """Run --stream: push audio from stdin/FIFO/growing file while it arrives."""
+    s2t_stream = import_cli_module("s2t_stream")
+    
+    env_config = load_environment(require_billing=not args.mock)
+    endpoint = select_endpoint(args.endpoint or env_config["endpoint"])
+    segments = s2t_stream.transcribe_stream(
+        args.stream,
+        endpoint,
+        stream_format=s2t_stream.parse_stream_format(args.stream_format),
+        follow=args.follow,
+        idle_seconds=args.follow_idle_seconds,
+        debug=args.debug,
+        on_segment=on_segment,
+    )
+    if not segments:
+        print("Error: No speech could be recognized", file=sys.stderr)
+        return 1
+    return 0
+
+
+def open_transcript_sinks(args: argparse.Namespace) -> list:
+    """Open the --transcript writers; files default to assets/output/<audio stem>.<ext>."""
+    if not args.transcript:
+        return []
+    s2t_sinks = import_cli_module("s2t_sinks")
+    source = args.stream if args.stream else args.audio_file
+    stem = "stream" if source in (None, "-") else Path(source).stem
+    return s2t_sinks.open_sinks(args.transcript, OUTPUT_DIR / stem)
+
+
+def fan_out(*callbacks: Optional[Callable[[TranscriptSegment], None]]) -> Optional[Callable[[TranscriptSegment], None]]:
+    """Console printer plus any transcript sinks as one `on_segment` callback."""
+    return import_cli_module("s2t_sinks").fan_out(*callbacks)
 
 
 def main() -> int:
@@ -289,9 +615,37 @@ Examples:
   %(prog)s --debug /path/to/meeting.mp3
   %(prog)s --endpoint ws://speech-container:5000 audio.flac
   
+  # Container mode - whole-file continuous transcription (long recordings)
+  %(prog)s --continuous meeting.wav
+  
+  # Container mode - live input: stdin, a named pipe or a growing file
+  arecord -f S16_LE -r 16000 -c 1 | %(prog)s --stream -
+  %(prog)s --stream /tmp/call.fifo
+  %(prog)s --stream recording-in-progress.wav --follow
+  
+  # Container mode - split long WAVs at silence and recognize chunks in parallel
+  %(prog)s --chunked --endpoint ws://localhost:5000,ws://localhost:5002 all-day-meeting.wav
+  
+  # Container mode - batch transcription of a directory, glob or manifest
+  %(prog)s --batch ./recordings --concurrency 4
+  %(prog)s --batch "./recordings/**/*.wav" --output-dir ./transcripts
+  %(prog)s --batch manifest.txt
+  %(prog)s --batch ./recordings --endpoint ws://localhost:5000,ws://localhost:5002
+  
   # Container mode - diarization (will fail with v5.0.3, future support)
   %(prog)s --diarize multi-speaker.wav
   
+  # Incremental transcript files, written segment by segment while recognition runs
+  %(prog)s --continuous --transcript srt --transcript jsonl meeting.wav
+  %(prog)s --cloud --diarize --transcript speakers --transcript vtt=captions.vtt meeting.wav
+  
+  # Header-only validation of a file or a whole batch source (parallel, no container)
+  %(prog)s --validate-only --batch ./recordings
+  
+  # Offline - local mock container (no APIKEY/region needed; see cli/mock_container.py)
+  %(prog)s --mock --continuous meeting.wav
+  %(prog)s --mock --endpoint ws://127.0.0.1:5000 --batch ./recordings
+  
   # Cloud mode - diarization (working)
   %(prog)s --cloud --diarize multi-speaker-conversation.wav
   %(prog)s --cloud --diarize --debug meeting.mp3
@@ -299,19 +653,96 @@ Examples:
 Environment Variables:
   APIKEY                     Azure Speech subscription key (required)
   Billing__SubscriptionKey   Alternative name for subscription key
-  SPEECH_ENDPOINT            Speech container endpoint (default: ws://localhost:5000)
+  SPEECH_ENDPOINT            Speech container endpoint(s), comma-separated (default: ws://localhost:5000)
   Billing__Region            Azure region (default: local)
+  S2T_DECODE_CACHE_DIR       Decoded 16 kHz mono inputs (default: assets/output/decode_cache)
+  S2T_DECODE_CACHE_MAX_MB    Decode cache size cap in MB; 0 disables caching (default: 512)
         """,
     )
     
     parser.add_argument(
         "audio_file",
+        nargs="?",
         help="Path to audio file (WAV, MP3, or FLAC format)",
     )
     
+    parser.add_argument(
+        "--batch",
+        metavar="SOURCE",
+        help="Transcribe many files: a directory, a glob pattern, or a manifest "
+             "file listing one audio path per line",
+    )
+    
+    parser.add_argument(
+        "--stream",
+        metavar="SOURCE",
+        help="Recognize audio while it arrives from SOURCE ('-' for stdin, a named pipe "
+             "or a file still being written); partial results go to stderr",
+    )
+    
+    parser.add_argument(
+        "--stream-format",
+        default="16000:16:1",
+        help="Stream mode: RATE:BITS:CHANNELS of raw PCM input (default: 16000:16:1); "
+             "a leading WAV header overrides it",
+    )
+    
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Stream mode: keep reading a regular file as it grows (like tail -f)",
+    )
+    
+    parser.add_argument(
+        "--follow-idle-seconds",
+        type=float,
+        default=5.0,
+        help="Stream mode with --follow: end the stream after this long without new data (default: 5)",
+    )
+    
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Batch/chunked mode: number of recognizers run in parallel (default: one per endpoint)",
+    )
+    
+    parser.add_argument(
+        "--output-dir",
+        help="Batch mode: directory for per-file transcripts and summary.json "
+             "(default: assets/output/batch_<UTC_TIMESTAMP>)",
+    )
+    
     parser.add_argument(
         "--endpoint",
-        help=f"Speech container endpoint URL (default: {DEFAULT_ENDPOINT})",
+        help=f"Speech container endpoint URL; comma-separated for several replicas (default: {DEFAULT_ENDPOINT})",
+    )
+    
+    parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help="Transcribe the whole file with continuous recognition, printing each "
+             "segment as soon as it is final (default transcribes the first utterance only)",
+    )
+    
+    parser.add_argument(
+        "--chunked",
+        action="store_true",
+        help="Split a WAV at silence (energy VAD, requires numpy), recognize chunks in "
+             f"parallel and stitch the timestamps; lifts the {MAX_FILE_SIZE_MB} MB size cap",
+    )
+    
+    parser.add_argument(
+        "--max-chunk-seconds",
+        type=float,
+        default=60.0,
+        help="Chunked mode: maximum chunk length in seconds (default: 60)",
+    )
+    
+    parser.add_argument(
+        "--overlap-seconds",
+        type=float,
+        default=0.5,
+        help="Chunked mode: extra audio recognized on each side of a cut (default: 0.5)",
     )
     
     parser.add_argument(
@@ -327,6 +758,36 @@ Environment Variables:
              "Note: Current containers (v5.0.3) do NOT support this - use --cloud for working diarization",
     )
     
+    parser.add_argument(
+        "--transcript",
+        action="append",
+        metavar="FORMAT[=PATH]",
+        help="Write segments to a file as each one is final (with --continuous, --diarize, "
+             "--chunked or --stream): jsonl, srt, vtt or speakers (per-speaker merged turns). "
+             "PATH defaults to assets/output/<audio stem>.<ext>. Repeatable.",
+    )
+    
+    parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="Only check the audio file (or every --batch input, in parallel) from its header: "
+             "codec, sample rate, channels, duration; no container needed",
+    )
+    
+    parser.add_argument(
+        "--no-preprocess",
+        action="store_true",
+        help="Send files to the SDK as they are instead of first decoding MP3/FLAC and "
+             "downmixing/resampling to 16 kHz mono PCM (cached in assets/output/decode_cache)",
+    )
+    
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="Target the local mock container (cli/mock_container.py) and skip the APIKEY/region "
+             "checks; without --endpoint an in-process mock is started for the run",
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -334,16 +795,50 @@ Environment Variables:
     )
     
     args = parser.parse_args()
+    if sum(map(bool, (args.audio_file, args.batch, args.stream))) != 1:
+        parser.error("provide exactly one of audio_file, --batch SOURCE or --stream SOURCE")
+    if args.validate_only and args.stream:
+        parser.error("--validate-only checks files; it cannot be combined with --stream")
+    if args.mock and args.cloud:
+        parser.error("--mock and --cloud are mutually exclusive")
+    if args.transcript and not (args.continuous or args.diarize or args.chunked or args.stream):
+        parser.error("--transcript needs --continuous, --diarize, --chunked or --stream")
+    
+    mock = None
+    sinks = []
+    prepared = None
+    if args.mock and not args.endpoint:
+        mock = import_cli_module("mock_container").MockContainer().start()
+        args.endpoint = mock.ws_url
+        if args.debug:
+            print(f"[DEBUG] Mock container: {mock.ws_url}", file=sys.stderr)
     
     try:
-        # Validate audio file
-        audio_path = validate_audio_file(args.audio_file)
+        if args.validate_only:
+            return run_validate_only(args)
+        if args.batch:
+            return run_batch_mode(args)
+        if args.stream:
+            sinks = open_transcript_sinks(args)
+            return run_stream_mode(args, on_segment=fan_out(print_segment, *sinks))
+        
+        # Validate audio file (chunked mode has no size cap)
+        audio_path = validate_audio_file(
+            args.audio_file, max_size_bytes=None if args.chunked else MAX_FILE_SIZE_BYTES
+        )
+        sinks = open_transcript_sinks(args)
+        if not args.no_preprocess:
+            prepared = preprocess_audio(audio_path, debug=args.debug)
+            audio_path = prepared.path
+        
+        if args.chunked:
+            return run_chunked_mode(args, audio_path, on_segment=fan_out(print_segment, *sinks))
         
         # Load environment configuration
-        env_config = load_environment()
+        env_config = load_environment(require_billing=not args.mock)
         api_key = env_config["api_key"]
         region = env_config["region"]
-        endpoint = args.endpoint or env_config["endpoint"]
+        endpoint = select_endpoint(args.endpoint or env_config["endpoint"])
         
         # Transcribe audio
         if args.diarize:
@@ -354,19 +849,29 @@ Environment Variables:
                 print("This will attempt to use ConversationTranscriber with the container but will likely fail.", file=sys.stderr)
                 print("For working diarization, use: --cloud --diarize\n", file=sys.stderr)
             
-            transcribe_with_diarization(
+            segments = transcribe_with_diarization(
                 audio_path, 
                 endpoint, 
                 api_key, 
                 region, 
                 cloud_mode=args.cloud, 
-                debug=args.debug
+                debug=args.debug,
+                on_segment=fan_out(print_speaker_segment, *sinks),
             )
+            if not segments:
+                print("Error: No speech could be transcribed", file=sys.stderr)
+                return 1
         elif args.cloud:
             # Cloud mode without diarization - not implemented yet
             print("Error: Cloud mode without diarization not yet implemented.", file=sys.stderr)
             print("Use --cloud --diarize for speaker diarization, or omit --cloud for container transcription.", file=sys.stderr)
             return 1
+        elif args.continuous:
+            # Container mode: Whole-file continuous transcription
+            segments = transcribe_continuous(audio_path, endpoint, api_key, region, debug=args.debug, on_segment=fan_out(print_segment, *sinks))
+            if not segments:
+                print("Error: No speech could be recognized", file=sys.stderr)
+                return 1
         else:
             # Container mode: Basic transcription
             transcribe_audio(audio_path, endpoint, api_key, region, debug=args.debug)
@@ -379,12 +884,23 @@ Environment Variables:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         if args.debug if 'args' in locals() else False:
             import traceback
             traceback.print_exc()
         return 2
+    finally:
+        for sink in sinks:
+            sink.close()
+            print(f"Transcript: {sink.path} ({sink.count} segments)", file=sys.stderr)
+        if prepared is not None:
+            prepared.cleanup()
+        if mock is not None:
+            mock.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,322 @@
+"""Decode, downmix and resample STT inputs to 16 kHz mono PCM, with a decode cache.
+
+The container recognizes 16 kHz 16-bit mono PCM natively. Anything else (MP3,
+FLAC, 44.1/48 kHz or stereo WAV) is decoded and resampled inside the SDK on
+every run, and a 48 kHz stereo WAV carries six times the bytes the recognizer
+needs. `prepare_audio` does that work once per distinct input:
+
+  - PCM WAV (8/16/24/32-bit integer or 32-bit float) is read in place; MP3,
+    FLAC and other WAV codecs are decoded by `ffmpeg` to a WAV on stdout at
+    the source rate and channel count.
+  - Channels are averaged to mono and the rate is converted to 16 kHz with a
+    vectorized NumPy windowed-sinc resampler (band-limited, so 44.1/48 kHz
+    sources do not alias), evaluated only at the output sample positions.
+  - The result is stored in a `tts_cache.AudioCache` keyed by the SHA-256 of
+    the source bytes, so re-running transcription on the same file skips the
+    decode entirely, whatever the file is called.
+
+Inputs already in 16 kHz mono 16-bit PCM WAV are passed through untouched.
+NumPy, and ffmpeg for compressed inputs, are optional: without them the source
+is passed through and the SDK decodes it as before.
+
+Environment overrides for the shared default decode cache:
+  S2T_DECODE_CACHE_DIR     cache root (default assets/output/decode_cache)
+  S2T_DECODE_CACHE_MAX_MB  size cap in MB; 0 disables caching (default 512)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # preprocessing is skipped without it
+    np = None  # type: ignore
+
+from .audio_formats import get_format, wav_header
+from .tts_cache import AudioCache
+from .wav_assembly import read_wav_info
+from .wav_utils import WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_PCM, WavInfo, parse_wav_header, pcm_view
+
+TARGET_FORMAT = get_format("riff-16khz-16bit-mono-pcm")  # the container's native input
+ZERO_CROSSINGS = 8  # sinc lobes on each side of an output sample
+BLOCK_SAMPLES = 16384  # output samples resampled per vectorized block
+HASH_BLOCK_BYTES = 1024 * 1024
+# Bump when the decode/resample output changes, so stale cache entries are not reused
+PIPELINE_VERSION = "1"
+
+OUTPUT_DIR = Path(__file__).resolve().parents[1] / "assets" / "output"
+
+
+@dataclass
+class PreparedAudio:
+    """What to hand the recognizer for one input file."""
+    path: Path  # the converted copy, or the source itself
+    source: Path
+    converted: bool = False  # `path` is a 16 kHz mono copy
+    cached: bool = False  # the copy came from the decode cache
+    reason: str = "OK"  # why the source was passed through (NATIVE, NUMPY_MISSING, ...)
+    source_rate: Optional[int] = None
+    source_channels: Optional[int] = None
+    decode_ms: float = 0.0
+    temporary: bool = False  # `path` is a temp file or a private link to a cache entry; removed by cleanup()
+
+    def cleanup(self) -> None:
+        if self.temporary:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def __enter__(self) -> "PreparedAudio":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cleanup()
+
+
+def source_digest(path: Path) -> str:
+    """SHA-256 of the file contents plus the target layout: the decode cache key."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    digest.update(f"\x1f{TARGET_FORMAT.name}\x1f{PIPELINE_VERSION}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _samples(data, info: WavInfo):
+    """Float32 samples (int16 scale, interleaved) from a PCM payload buffer or memmap."""
+    bits = info.sampwidth * 8
+    if info.codec == WAVE_FORMAT_IEEE_FLOAT:
+        if bits != 32:
+            raise ValueError(f"Unsupported float WAV width: {bits}-bit")
+        return np.frombuffer(data, dtype="<f4").astype(np.float32) * 32768.0
+    if bits == 8:
+        return (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) * 256.0
+    if bits == 16:
+        return np.frombuffer(data, dtype="<i2").astype(np.float32)
+    if bits == 24:
+        raw = np.frombuffer(data, dtype=np.uint8)[: len(data) // 3 * 3].reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        values = np.where(values & 0x800000, values - 0x1000000, values)
+        return values.astype(np.float32) / 256.0
+    if bits == 32:
+        return np.frombuffer(data, dtype="<i4").astype(np.float32) / 65536.0
+    raise ValueError(f"Unsupported PCM width: {bits}-bit")
+
+
+def downmix(samples, channels: int):
+    """Average interleaved channels to mono."""
+    if channels <= 1:
+        return samples
+    return samples[: len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+
+
+def _kernel(dist, cutoff: float, half: int):
+    """Hann-windowed sinc taps at `dist` input samples from the output position."""
+    return (cutoff * np.sinc(cutoff * dist) * (0.5 + 0.5 * np.cos(np.pi * dist / half))).astype(np.float32)
+
+
+def resample(samples, rate: int, target_rate: int = TARGET_FORMAT.sample_rate, zero_crossings: int = ZERO_CROSSINGS):
+    """Band-limited resampling of mono float samples (Hann-windowed sinc).
+
+    Every output sample is a weighted sum of the `2 * half` input samples
+    around its position; for downsampling the sinc is stretched so its cutoff
+    is the target Nyquist. The rate ratio is rational (`down / up` input
+    samples per output), so only `up` distinct tap sets exist: they are
+    computed once and each block of outputs is one gather plus a row-wise dot.
+    """
+    if rate == target_rate or len(samples) == 0:
+        return samples
+    g = math.gcd(rate, target_rate)
+    up, down = target_rate // g, rate // g
+    cutoff = min(1.0, up / down)
+    half = int(math.ceil(zero_crossings / cutoff))
+    taps = np.arange(-half + 1, half + 1)
+    phases = np.arange(up)
+    table = _kernel(taps[None, :] - ((phases * down) % up / up)[:, None], cutoff, half)  # (up, 2 * half)
+    n_out = len(samples) * up // down
+    padded = np.pad(samples.astype(np.float32, copy=False), (half, half + 1))
+    out = np.empty(n_out, dtype=np.float32)
+    for start in range(0, n_out, BLOCK_SAMPLES):
+        i = np.arange(start, min(n_out, start + BLOCK_SAMPLES))
+        base = (i * down) // up + half  # padded index of the input sample at or before each output
+        window = padded[base[:, None] + taps[None, :]]
+        out[start:start + len(i)] = np.einsum("ij,ij->i", window, table[i % up])
+    return out
+
+
+def to_pcm16(samples) -> bytes:
+    return np.clip(np.rint(samples), -32768, 32767).astype("<i2").tobytes()
+
+
+def _is_native(info: WavInfo) -> bool:
+    return (
+        info.codec == WAVE_FORMAT_PCM
+        and (info.channels, info.sampwidth, info.framerate) == (TARGET_FORMAT.channels, TARGET_FORMAT.sampwidth, TARGET_FORMAT.sample_rate)
+    )
+
+
+def _reads_in_place(info: Optional[WavInfo]) -> bool:
+    """Whether `_decode` memory-maps this WAV rather than running ffmpeg."""
+    return info is not None and info.codec in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT)
+
+
+def _pin(entry: Path) -> Optional[Path]:
+    """Hardlink (or copy) a cache entry under a private name; None if it was evicted first.
+
+    The recognizer reads the file long after `get`/`put` return, and another
+    worker's `put` may evict the entry meanwhile; the private name keeps the
+    bytes on disk until `PreparedAudio.cleanup()` removes it.
+    """
+    pinned = entry.with_name(f".{entry.stem}.{uuid.uuid4().hex}{entry.suffix}")  # dot names are not indexed
+    try:
+        os.link(entry, pinned)
+    except FileNotFoundError:
+        return None
+    except OSError:  # no hardlinks on this filesystem
+        try:
+            shutil.copyfile(entry, pinned)
+        except FileNotFoundError:
+            return None
+    return pinned
+
+
+def _decode_with_ffmpeg(path: Path) -> Tuple[object, WavInfo]:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileNotFoundError("ffmpeg")
+    proc = subprocess.run(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", str(path), "-map", "0:a:0", "-f", "wav", "-acodec", "pcm_s16le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False,
+    )
+    if proc.returncode != 0:
+        detail = proc.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise ValueError(f"ffmpeg could not decode {path}: {detail[-1] if detail else f'exit {proc.returncode}'}")
+    info = parse_wav_header(proc.stdout)
+    return pcm_view(proc.stdout, info), info
+
+
+def _decode(path: Path) -> Tuple[object, WavInfo]:
+    """(PCM payload, layout): PCM WAV memory-mapped in place, everything else via ffmpeg."""
+    if path.suffix.lower() == ".wav":
+        try:
+            info = read_wav_info(path)
+        except ValueError:  # not RIFF after all; ffmpeg sniffs the real container
+            return _decode_with_ffmpeg(path)
+        if _reads_in_place(info):
+            if info.data_size == 0:
+                return b"", info
+            return np.memmap(path, dtype=np.uint8, mode="r", offset=info.data_offset, shape=(info.data_size,)), info
+    return _decode_with_ffmpeg(path)
+
+
+def convert(path: Path) -> Tuple[bytes, WavInfo]:
+    """Decode `path` to a 16 kHz mono 16-bit WAV; returns (WAV bytes, source layout).
+
+    Raises:
+        FileNotFoundError: ffmpeg is needed (compressed input) but not installed.
+        ValueError: The input cannot be decoded.
+    """
+    data, info = _decode(path)
+    if info.sampwidth == 0 or info.channels == 0 or info.framerate == 0:
+        raise ValueError(f"Invalid audio layout in {path}: {info.channels} ch, {info.sampwidth * 8}-bit, {info.framerate} Hz")
+    usable = len(data) // info.frame_size * info.frame_size
+    mono = downmix(_samples(data[:usable], info), info.channels)
+    pcm = to_pcm16(resample(mono, info.framerate))
+    return wav_header(TARGET_FORMAT, len(pcm)) + pcm, info
+
+
+def prepare_audio(path: Path, cache: Optional[AudioCache] = None) -> PreparedAudio:
+    """Return the 16 kHz mono version of `path` to recognize (cached by content).
+
+    `cache` defaults to the shared decode cache. The returned copy is always
+    private to this call (a link to the cache entry, or a temp file with
+    caching disabled) and is removed by `PreparedAudio.cleanup()`, so cache
+    eviction cannot remove it while it is being recognized. Sources that are
+    already native, or that cannot be converted here (NumPy or ffmpeg
+    missing), come back unchanged with `reason` saying why.
+
+    Raises:
+        ValueError: The input is corrupt or uses an unsupported encoding.
+    """
+    path = Path(path)
+    info = None
+    if path.suffix.lower() == ".wav":
+        try:
+            info = read_wav_info(path)
+        except ValueError:
+            pass  # let ffmpeg (or the SDK) have a go at mislabeled files
+        if info is not None and _is_native(info):
+            return PreparedAudio(path, path, reason="NATIVE", source_rate=info.framerate, source_channels=info.channels)
+    if np is None:
+        return PreparedAudio(path, path, reason="NUMPY_MISSING")
+    if not _reads_in_place(info) and shutil.which("ffmpeg") is None:
+        return PreparedAudio(path, path, reason="FFMPEG_MISSING")  # before hashing what we cannot decode
+
+    start = time.perf_counter()
+    audio_cache = cache or get_default_decode_cache()
+    key = source_digest(path)
+    if audio_cache is not None:
+        hit = audio_cache.get(key)
+        pinned = _pin(hit) if hit is not None else None
+        if pinned is not None:
+            return PreparedAudio(
+                pinned, path, converted=True, cached=True, decode_ms=round((time.perf_counter() - start) * 1000, 1), temporary=True,
+            )
+    try:
+        wav, info = convert(path)
+    except FileNotFoundError:
+        return PreparedAudio(path, path, reason="FFMPEG_MISSING")
+    target = _pin(audio_cache.put(key, wav, extension=TARGET_FORMAT.extension)) if audio_cache is not None else None
+    if target is None:
+        fd, name = tempfile.mkstemp(prefix="s2t-decoded-", suffix=TARGET_FORMAT.extension)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(wav)
+        target = Path(name)
+    return PreparedAudio(
+        target, path, converted=True, source_rate=info.framerate, source_channels=info.channels,
+        decode_ms=round((time.perf_counter() - start) * 1000, 1), temporary=True,
+    )
+
+
+_default_cache: Optional[AudioCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_decode_cache() -> Optional[AudioCache]:
+    """Shared process-wide decode cache, or None when S2T_DECODE_CACHE_MAX_MB=0."""
+    global _default_cache
+    max_mb = float(os.getenv("S2T_DECODE_CACHE_MAX_MB", "512"))
+    if max_mb <= 0:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            root = Path(os.getenv("S2T_DECODE_CACHE_DIR", str(OUTPUT_DIR / "decode_cache")))
+            _default_cache = AudioCache(root, int(max_mb * 1024 * 1024))
+        return _default_cache
+
+
+__all__ = [
+    "PreparedAudio",
+    "TARGET_FORMAT",
+    "convert",
+    "downmix",
+    "get_default_decode_cache",
+    "prepare_audio",
+    "resample",
+    "source_digest",
+    "to_pcm16",
+]
@@ -0,0 +1,206 @@
+"""Incremental transcript writers for speech-to-text segments.
+
+Every recognition mode hands final segments to an `on_segment` callback as
+soon as they are recognized. The sinks here turn that callback into files that
+grow while the audio is still being transcribed: each segment is written and
+flushed on arrival, so a consumer tailing the file (an indexer, a live
+caption overlay) sees it immediately rather than at the end of the meeting.
+
+Formats:
+  jsonl     one JSON object per segment (text, start/end seconds, ticks, speaker)
+  srt       SubRip cues, numbered from 1; speakers prefix the cue text
+  vtt       WebVTT cues; speakers as `<v Speaker>` voice spans
+  speakers  per-speaker merged transcript: consecutive segments from the same
+            speaker become one turn, written when the next speaker starts (or
+            at close)
+
+`open_sinks(["srt", "jsonl=out.jsonl"], stem)` builds sinks from FORMAT[=PATH]
+specs; `fan_out(print_segment, *sinks)` combines them into one `on_segment`.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, TextIO, Union
+
+if TYPE_CHECKING:  # the SDK import stays with the recognizers
+    from .s2t_cli_sdk import TranscriptSegment
+
+TICKS_PER_SECOND = 10_000_000
+
+
+def _clock(offset_ticks: int, separator: str) -> str:
+    """HH:MM:SS<sep>mmm, the cue timestamp layout shared by SRT (',') and WebVTT ('.')."""
+    total_ms = offset_ticks // 10_000
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, ms = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{ms:03d}"
+
+
+def _speaker(segment: "TranscriptSegment") -> Optional[str]:
+    return segment.speaker_id or None
+
+
+class TranscriptSink:
+    """Appends segments to a text file, flushing after each one."""
+
+    suffix = ".txt"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: TextIO = open(self.path, "w", encoding="utf-8")
+        self.count = 0
+        self._begin()
+
+    def __call__(self, segment: "TranscriptSegment") -> None:
+        self.write(segment)
+
+    def write(self, segment: "TranscriptSegment") -> None:
+        self.count += 1
+        self._fh.write(self._render(segment))
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self._end()
+        self._fh.close()
+
+    def __enter__(self) -> "TranscriptSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _begin(self) -> None:
+        pass
+
+    def _end(self) -> None:
+        pass
+
+    def _render(self, segment: "TranscriptSegment") -> str:
+        raise NotImplementedError
+
+
+class JsonlSink(TranscriptSink):
+    suffix = ".jsonl"
+
+    def _render(self, segment: "TranscriptSegment") -> str:
+        record = {
+            "index": self.count,
+            "start": round(segment.start_seconds, 3),
+            "end": round(segment.end_seconds, 3),
+            "speaker": _speaker(segment),
+            "text": segment.text,
+            "offset_ticks": segment.offset_ticks,
+            "duration_ticks": segment.duration_ticks,
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class SrtSink(TranscriptSink):
+    suffix = ".srt"
+
+    def _render(self, segment: "TranscriptSegment") -> str:
+        end = segment.offset_ticks + segment.duration_ticks
+        speaker = _speaker(segment)
+        text = f"{speaker}: {segment.text}" if speaker else segment.text
+        return f"{self.count}\n{_clock(segment.offset_ticks, ',')} --> {_clock(end, ',')}\n{text}\n\n"
+
+
+class WebVttSink(TranscriptSink):
+    suffix = ".vtt"
+
+    def _begin(self) -> None:
+        self._fh.write("WEBVTT\n\n")
+        self._fh.flush()
+
+    def _render(self, segment: "TranscriptSegment") -> str:
+        end = segment.offset_ticks + segment.duration_ticks
+        speaker = _speaker(segment)
+        text = f"<v {speaker}>{segment.text}" if speaker else segment.text
+        return f"{_clock(segment.offset_ticks, '.')} --> {_clock(end, '.')}\n{text}\n\n"
+
+
+class SpeakerTranscriptSink(TranscriptSink):
+    """One line per speaker turn; a turn is flushed once another speaker starts."""
+
+    suffix = ".speakers.txt"
+
+    def _begin(self) -> None:
+        self._turn: List["TranscriptSegment"] = []
+
+    def write(self, segment: "TranscriptSegment") -> None:
+        self.count += 1
+        if self._turn and _speaker(self._turn[-1]) != _speaker(segment):
+            self._flush_turn()
+        self._turn.append(segment)
+
+    def _end(self) -> None:
+        self._flush_turn()
+
+    def _flush_turn(self) -> None:
+        if not self._turn:
+            return
+        first, last = self._turn[0], self._turn[-1]
+        speaker = _speaker(first) or "Unknown"
+        text = " ".join(s.text for s in self._turn)
+        self._fh.write(f"[{_clock(first.offset_ticks, '.')} - {_clock(last.offset_ticks + last.duration_ticks, '.')}] {speaker}: {text}\n")
+        self._fh.flush()
+        self._turn = []
+
+
+SINKS: Dict[str, type] = {
+    "jsonl": JsonlSink,
+    "srt": SrtSink,
+    "vtt": WebVttSink,
+    "speakers": SpeakerTranscriptSink,
+}
+
+
+def open_sinks(specs: Sequence[str], default_stem: Union[str, Path]) -> List[TranscriptSink]:
+    """Open one sink per FORMAT[=PATH] spec; PATH defaults to `<default_stem><suffix>`.
+
+    Raises:
+        ValueError: For an unknown format.
+    """
+    sinks: List[TranscriptSink] = []
+    for spec in specs:
+        name, _, path = spec.partition("=")
+        cls = SINKS.get(name)
+        if cls is None:
+            for sink in sinks:
+                sink.close()
+            raise ValueError(f"Unknown transcript format '{name}' (available: {', '.join(SINKS)})")
+        sinks.append(cls(path or f"{default_stem}{cls.suffix}"))
+    return sinks
+
+
+def fan_out(*callbacks: Optional[Callable[["TranscriptSegment"], None]]) -> Optional[Callable[["TranscriptSegment"], None]]:
+    """Combine several `on_segment` callbacks (None entries are skipped) into one."""
+    active = [cb for cb in callbacks if cb is not None]
+    if not active:
+        return None
+    if len(active) == 1:
+        return active[0]
+
+    def on_segment(segment: "TranscriptSegment") -> None:
+        for cb in active:
+            cb(segment)
+
+    return on_segment
+
+
+__all__ = [
+    "JsonlSink",
+    "SINKS",
+    "SpeakerTranscriptSink",
+    "SrtSink",
+    "TranscriptSink",
+    "WebVttSink",
+    "fan_out",
+    "open_sinks",
+]
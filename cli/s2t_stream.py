@@ -0,0 +1,188 @@
+"""Streaming push-stream input for speech-to-text.
+
+`transcribe_audio`/`transcribe_continuous` build `AudioConfig(filename=...)`,
+so audio must be complete on disk before recognition starts. This module
+instead feeds a `PushAudioInputStream` from stdin, a named pipe or a file that
+is still being written, in fixed-size buffers. Recognition (and partial
+results) start with the first buffer, removing the record-then-upload delay
+and the temp file.
+
+Input is raw PCM described by `StreamFormat` (default 16 kHz, 16-bit, mono);
+a leading RIFF/WAVE header is detected, parsed and stripped automatically.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from . import s2t_cli_sdk as s2t
+
+BUFFER_MS = 100  # push granularity
+FOLLOW_POLL_SECONDS = 0.05  # re-check interval when a followed file has no new data
+
+
+@dataclass
+class StreamFormat:
+    rate: int = 16000
+    bits: int = 16
+    channels: int = 1
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.rate * self.bits // 8 * self.channels
+
+
+def parse_stream_format(value: str) -> StreamFormat:
+    """Parse `RATE:BITS:CHANNELS` (e.g. 16000:16:1)."""
+    try:
+        rate, bits, channels = (int(p) for p in value.split(":"))
+    except ValueError:
+        raise ValueError(f"Invalid stream format '{value}', expected RATE:BITS:CHANNELS") from None
+    return StreamFormat(rate=rate, bits=bits, channels=channels)
+
+
+def print_partial(text: str) -> None:
+    """Default partial-result sink: stderr, so stdout stays final segments only."""
+    print(f"[PARTIAL] {text}", file=sys.stderr, flush=True)
+
+
+def _read_exact(reader: BinaryIO, n: int) -> bytes:
+    data = b""
+    while len(data) < n:
+        part = reader.read(n - len(data))
+        if not part:
+            break
+        data += part
+    return data
+
+
+def read_wav_header(reader: BinaryIO) -> Tuple[Optional[StreamFormat], bytes]:
+    """Consume a leading WAV header if present.
+
+    Returns (format or None, leftover bytes). When the input does not start
+    with RIFF the bytes read while sniffing are returned as leftover PCM.
+    """
+    head = _read_exact(reader, 12)
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None, head
+    fmt: Optional[StreamFormat] = None
+    while True:
+        chunk_header = _read_exact(reader, 8)
+        if len(chunk_header) < 8:
+            return fmt, b""
+        chunk_id, size = chunk_header[:4], struct.unpack("<I", chunk_header[4:])[0]
+        if chunk_id == b"data":
+            return fmt, b""
+        body = _read_exact(reader, size + (size & 1))  # chunks are word aligned
+        if chunk_id == b"fmt " and len(body) >= 16:
+            _tag, channels, rate, _byte_rate, _align, bits = struct.unpack("<HHIIHH", body[:16])
+            fmt = StreamFormat(rate=rate, bits=bits, channels=channels)
+
+
+def open_source(source: str) -> BinaryIO:
+    """'-' is stdin; anything else (FIFO or regular file) is opened unbuffered."""
+    if source == "-":
+        return sys.stdin.buffer
+    return open(source, "rb", buffering=0)
+
+
+def feed_push_stream(
+    reader: BinaryIO,
+    push_stream,
+    buffer_size: int,
+    leftover: bytes = b"",
+    follow: bool = False,
+    idle_seconds: float = 5.0,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """Copy `reader` into `push_stream` in `buffer_size` writes; returns bytes pushed.
+
+    At EOF the stream is closed, which ends the recognition session. With
+    `follow`, EOF only ends the stream after `idle_seconds` without growth.
+    """
+    total = 0
+    try:
+        if leftover:
+            push_stream.write(leftover)
+            total += len(leftover)
+        last_data = time.perf_counter()
+        while stop is None or not stop.is_set():
+            data = reader.read(buffer_size)
+            if data:
+                push_stream.write(data)
+                total += len(data)
+                last_data = time.perf_counter()
+                continue
+            if not follow or time.perf_counter() - last_data > idle_seconds:
+                break
+            time.sleep(FOLLOW_POLL_SECONDS)
+    finally:
+        push_stream.close()
+    return total
+
+
+def transcribe_stream(
+    source: str,
+    endpoint: str,
+    stream_format: StreamFormat = StreamFormat(),
+    buffer_ms: int = BUFFER_MS,
+    follow: bool = False,
+    idle_seconds: float = 5.0,
+    debug: bool = False,
+    on_segment: Optional[Callable[[s2t.TranscriptSegment], None]] = s2t.print_segment,
+    on_partial: Optional[Callable[[str], None]] = print_partial,
+) -> List[s2t.TranscriptSegment]:
+    """Recognize audio from `source` while it is still arriving.
+
+    Raises:
+        RuntimeError: If recognition is canceled with an error.
+        OSError: If reading `source` failed mid-stream (raised once recognition ends).
+    """
+    reader = open_source(source)
+    try:
+        header_format, leftover = read_wav_header(reader)
+        fmt = header_format or stream_format
+        if debug:
+            origin = "WAV header" if header_format else "--stream-format"
+            print(f"[DEBUG] Stream source: {source} ({fmt.rate} Hz, {fmt.bits}-bit, {fmt.channels} ch from {origin})", file=sys.stderr)
+        push_stream = s2t.speechsdk.audio.PushAudioInputStream(
+            stream_format=s2t.speechsdk.audio.AudioStreamFormat(
+                samples_per_second=fmt.rate, bits_per_sample=fmt.bits, channels=fmt.channels
+            )
+        )
+        audio_config = s2t.speechsdk.audio.AudioConfig(stream=push_stream)
+        buffer_size = max(1, fmt.bytes_per_second * buffer_ms // 1000)
+        stop = threading.Event()
+        feed_errors: List[BaseException] = []
+
+        def feed() -> None:
+            # A read error closes the push stream (ending recognition); keep it for the caller
+            try:
+                feed_push_stream(reader, push_stream, buffer_size, leftover, follow, idle_seconds, stop)
+            except Exception as e:
+                feed_errors.append(e)
+
+        feeder = threading.Thread(target=feed, name="s2t-push-feeder", daemon=True)
+        feeder.start()
+        try:
+            segments = s2t.transcribe_continuous(
+                None, endpoint, "", "", debug=debug, on_segment=on_segment,
+                audio_config=audio_config, on_partial=on_partial,
+            )
+        finally:
+            stop.set()
+            feeder.join(timeout=1.0)
+        if feed_errors:
+            raise feed_errors[0]
+        return segments
+    finally:
+        if reader is not sys.stdin.buffer:
+            reader.close()
+
+
+__all__ = ["StreamFormat", "parse_stream_format", "read_wav_header", "feed_push_stream", "transcribe_stream"]
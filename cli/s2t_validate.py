@@ -0,0 +1,260 @@
+"""Header-sniffing validation of STT inputs.
+
+`validate_audio_file` used to trust the file suffix, so a truncated WAV, an
+HTML error page saved as `.mp3` or a FLAC named `.wav` only failed inside a
+container session, after connection setup. `probe_audio` reads the first
+`HEAD_BYTES` of the file (plus, for WAV, the chunk headers it seeks to) and
+parses the container header itself:
+
+  WAV   RIFF/WAVE, the `fmt ` chunk (codec, rate, channels, bits) and the
+        `data` chunk size; the RIFF size is checked against the file size.
+        Any codec tag is accepted (mu-law, ADPCM, ... are left to
+        preprocessing or the SDK); only PCM and float layouts are checked
+  FLAC  `fLaC` magic and the STREAMINFO block (rate, channels, bits, total
+        samples)
+  MP3   optional ID3v2 tag, then an MPEG audio frame header confirmed by the
+        next frame's sync; duration from a Xing/Info frame count or, for CBR,
+        from the bitrate
+
+The detected container must match the suffix, and the header must describe
+audio (non-zero rate, channels, and duration where the header carries one).
+Failures raise `AudioValidationError` in microseconds, without the SDK.
+
+`validate_many` checks a list of files on a thread pool (header reads are
+I/O bound), so batch mode rejects a directory's bad inputs up front instead of
+spending recognizer slots on them.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .wav_assembly import read_wav_info
+from .wav_utils import WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_PCM
+
+HEAD_BYTES = 16 * 1024
+# Codec tags with a known sample layout; any other tag (ADPCM, mu-law, ...) passes through to preprocessing
+WAV_CODECS = {WAVE_FORMAT_PCM: "pcm", WAVE_FORMAT_EXTENSIBLE: "pcm", WAVE_FORMAT_IEEE_FLOAT: "float"}
+SUFFIXES = {"wav": {".wav"}, "flac": {".flac"}, "mp3": {".mp3"}}
+
+# MPEG audio frame header tables, indexed by the header's version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MPEG_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_MPEG_BITRATES = {  # (MPEG-1?, layer) -> kbps by bitrate index 1..14
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+class AudioValidationError(ValueError):
+    """The file is not (valid) audio of the kind its name claims."""
+
+
+@dataclass
+class AudioProbe:
+    path: Path
+    container: str  # wav | flac | mp3
+    codec: str  # pcm, float, flac, mp3, mp2, ... or a WAV tag such as 0x0007
+    sample_rate: int
+    channels: int
+    bits_per_sample: Optional[int] = None  # None for MP3
+    duration_seconds: Optional[float] = None  # None when the header does not say
+    bitrate_kbps: Optional[int] = None  # MP3 (first frame)
+    size_bytes: int = 0
+
+
+@dataclass
+class _MpegFrame:
+    mpeg1: bool
+    layer: int
+    sample_rate: int
+    bitrate_kbps: int
+    channels: int
+    length: int  # bytes, header included
+    samples: int  # per frame
+
+
+def _id3v2_size(head: bytes) -> int:
+    """Bytes taken by a leading ID3v2 tag (0 when there is none)."""
+    if len(head) < 10 or head[:3] != b"ID3" or any(b & 0x80 for b in head[6:10]):
+        return 0
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    return 10 + size + (10 if head[5] & 0x10 else 0)  # footer flag
+
+
+def _mpeg_frame(head: bytes, pos: int) -> Optional[_MpegFrame]:
+    if pos + 4 > len(head) or head[pos] != 0xFF or head[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = head[pos + 1], head[pos + 2], head[pos + 3]
+    version, layer_bits = (b1 >> 3) & 3, (b1 >> 1) & 3
+    bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 3
+    if version == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None  # reserved values (or free format, which cannot be sized)
+    mpeg1, layer = version == 3, 4 - layer_bits
+    rate = _MPEG_RATES[version][rate_index]
+    kbps = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index - 1]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        length, samples = (12 * kbps * 1000 // rate + padding) * 4, 384
+    elif layer == 2 or mpeg1:
+        length, samples = 144 * kbps * 1000 // rate + padding, 1152
+    else:
+        length, samples = 72 * kbps * 1000 // rate + padding, 576
+    return _MpegFrame(mpeg1, layer, rate, kbps, 1 if b3 >> 6 == 3 else 2, length, samples)
+
+
+def _probe_wav(path: Path, head: bytes, size: int) -> AudioProbe:
+    declared = struct.unpack_from("<I", head, 4)[0]
+    if declared not in (0, 0xFFFFFFFF) and declared + 8 > size + 1:  # tolerate a missing pad byte
+        raise AudioValidationError(f"Truncated WAV: header declares {declared + 8} bytes, file has {size}: {path}")
+    try:
+        info = read_wav_info(path)
+    except (ValueError, struct.error) as e:
+        raise AudioValidationError(f"Corrupt WAV header: {e}") from None
+    codec = WAV_CODECS.get(info.audio_format)
+    if not info.audio_format or not info.channels or not info.framerate or (codec is not None and info.sampwidth not in (1, 2, 3, 4)):
+        raise AudioValidationError(
+            f"Invalid WAV format: codec 0x{info.audio_format:04x}, {info.channels} ch, {info.sampwidth * 8}-bit, {info.framerate} Hz: {path}"
+        )
+    if info.data_size == 0:
+        raise AudioValidationError(f"WAV contains no audio samples: {path}")
+    if codec is None:  # compressed/companded: ffmpeg (preprocessing) or the SDK decides whether it decodes
+        return AudioProbe(path, "wav", f"0x{info.audio_format:04x}", info.framerate, info.channels, info.sampwidth * 8 or None, size_bytes=size)
+    return AudioProbe(path, "wav", codec, info.framerate, info.channels, info.sampwidth * 8, info.duration_seconds, size_bytes=size)
+
+
+def _probe_flac(path: Path, head: bytes, size: int) -> AudioProbe:
+    block = head[4:8 + 34]
+    if len(block) < 38 or block[0] & 0x7F != 0 or int.from_bytes(block[1:4], "big") != 34:
+        raise AudioValidationError(f"Corrupt FLAC: first metadata block is not STREAMINFO: {path}")
+    info = block[4:]
+    min_block = int.from_bytes(info[0:2], "big")
+    packed = int.from_bytes(info[10:18], "big")
+    rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    bits = ((packed >> 36) & 0x1F) + 1
+    total = packed & 0xFFFFFFFFF
+    if rate == 0 or min_block < 16 or bits < 4:
+        raise AudioValidationError(f"Corrupt FLAC STREAMINFO ({rate} Hz, {bits}-bit, min block {min_block}): {path}")
+    return AudioProbe(path, "flac", "flac", rate, channels, bits, total / rate if total else None, size_bytes=size)
+
+
+def _find_mpeg_frame(head: bytes) -> Optional[Tuple[int, _MpegFrame]]:
+    """First frame header whose successor (when inside `head`) is also a frame header."""
+    pos = head.find(b"\xff")
+    while 0 <= pos <= len(head) - 4:
+        frame = _mpeg_frame(head, pos)
+        if frame is not None:
+            following = _mpeg_frame(head, pos + frame.length)
+            if pos + frame.length + 4 > len(head) or (following is not None and following.sample_rate == frame.sample_rate):
+                return pos, frame
+        pos = head.find(b"\xff", pos + 1)  # otherwise a stray sync pattern
+    return None
+
+
+def _probe_mp3(path: Path, head: bytes, start: int, size: int) -> AudioProbe:
+    found = _find_mpeg_frame(head)
+    if found is None:
+        raise AudioValidationError(f"No MPEG audio frame found in the first {len(head)} bytes of audio: {path}")
+    pos, frame = found
+    duration = None
+    side_info = (32 if frame.channels == 2 else 17) if frame.mpeg1 else (17 if frame.channels == 2 else 9)
+    xing = pos + 4 + side_info
+    if frame.layer == 3 and head[xing:xing + 4] in (b"Xing", b"Info") and len(head) >= xing + 12:
+        flags, frames = struct.unpack_from(">II", head, xing + 4)
+        if flags & 1:
+            duration = frames * frame.samples / frame.sample_rate
+    if duration is None:
+        duration = (size - start - pos) * 8 / (frame.bitrate_kbps * 1000)
+    codec = "mp3" if frame.layer == 3 else f"mp{frame.layer}"
+    return AudioProbe(path, "mp3", codec, frame.sample_rate, frame.channels, None, duration, frame.bitrate_kbps, size)
+
+
+def probe_audio(path: Union[str, Path]) -> AudioProbe:
+    """Identify and sanity-check an audio file from its header alone.
+
+    Raises:
+        AudioValidationError: Unrecognized, mislabeled, truncated or corrupt file.
+        OSError: The file cannot be read.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        head = fh.read(HEAD_BYTES)
+        start = 0
+        if len(head) >= 12 and head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+            kind = "wav"
+        else:
+            start = _id3v2_size(head)
+            if start:  # FLAC/MP3 data begins after the ID3v2 tag, possibly beyond the first read
+                fh.seek(start)
+                head = fh.read(HEAD_BYTES)
+            if head[:4] == b"fLaC":
+                kind = "flac"
+            elif start or suffix == ".mp3" or _find_mpeg_frame(head[:4096]) is not None:
+                kind = "mp3"  # _probe_mp3 insists on two consecutive frame headers
+            else:
+                raise AudioValidationError(f"Unrecognized audio header (not WAV, FLAC or MP3): {path}")
+    if suffix not in SUFFIXES[kind]:
+        raise AudioValidationError(f"File contains {kind.upper()} data but is named {path.suffix or '(no suffix)'}: {path}")
+    if kind == "wav":
+        probe = _probe_wav(path, head, size)
+    elif kind == "flac":
+        probe = _probe_flac(path, head, size)
+    else:
+        probe = _probe_mp3(path, head, start, size)
+    if probe.duration_seconds is not None and probe.duration_seconds <= 0:
+        raise AudioValidationError(f"{kind.upper()} contains no audio: {path}")
+    return probe
+
+
+@dataclass
+class ValidationResult:
+    path: Path
+    probe: Optional[AudioProbe] = None
+    error: Optional[str] = None
+    elapsed_us: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def validate_many(
+    paths: Sequence[Union[str, Path]],
+    check: Callable[[Union[str, Path]], AudioProbe] = probe_audio,
+    workers: Optional[int] = None,
+) -> List[ValidationResult]:
+    """Run `check` over `paths` on a thread pool; results keep the input order.
+
+    `check` defaults to `probe_audio`; callers pass a wrapper that adds their
+    own rules (size caps, ...). Missing/unreadable files and validation
+    failures become results with `error` set, never exceptions.
+    """
+    def run(path: Union[str, Path]) -> ValidationResult:
+        start = time.perf_counter()
+        try:
+            probe, error = check(path), None
+        except (OSError, ValueError) as e:
+            probe, error = None, str(e)
+        return ValidationResult(Path(path), probe, error, round((time.perf_counter() - start) * 1e6, 1))
+
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    if len(paths) <= 1 or workers <= 1:
+        return [run(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s2t-validate") as executor:
+        return list(executor.map(run, paths))
+
+
+__all__ = ["AudioProbe", "AudioValidationError", "HEAD_BYTES", "ValidationResult", "probe_audio", "validate_many"]
@@ -0,0 +1,351 @@
+"""Per-stage latency tracing and metrics export for NearRealTimeText2Speech.
+
+`SynthesisResult` only carries start and first-audio times. The tracer
+timestamps each stage of a request as a span. Every finished span also feeds a
+per-stage latency histogram.
+
+Stages (span names):
+  tts.synthesize          one `tts_synth.synthesize` call (cache hit or synthesis)
+  tts.config_build        SpeechConfig construction
+  tts.synthesizer_create  SpeechSynthesizer construction (synthesizer pool miss)
+  tts.connection_open     `Connection.open` pre-warm
+  tts.first_byte          speak request -> first audio chunk
+  tts.last_byte           speak request -> synthesis completed (last chunk)
+  tts.file_write          WAV written under OUTPUT_DIR
+  queue.request           QueueManager submission -> result delivered
+  queue.wait              enqueue -> dequeue by a worker
+  queue.execute           worker synthesis of one request
+  playback.start          play call -> audio handed to the device
+
+Spans opened with `span()` become the parent of spans opened inside them on the
+same thread (a context variable); `use(span)` adopts a parent on another thread,
+which is how QueueManager workers attach to the submitting request.
+
+Exporters are pluggable: `PrometheusExporter` renders the histograms in the
+Prometheus text exposition format; `OtlpJsonExporter` renders the buffered
+spans as OpenTelemetry OTLP/JSON (`resourceSpans`). `register_exporter` adds
+more by name.
+
+Environment overrides for the shared default tracer:
+  TTS_TRACE            1 enables tracing (default 0: spans are no-ops)
+  TTS_TRACE_MAX_SPANS  finished spans kept for export; older ones are dropped (default 10000)
+"""
+
+from __future__ import annotations
+
+import abc
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SERVICE_NAME = "near-realtime-speech"
+
+# perf_counter() -> wall clock, fixed at import so exported timestamps stay monotonic
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+_current: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("tracing_current_span", default=None)
+
+AttrValue = Union[str, int, float, bool, None]
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float  # perf_counter()
+    end: Optional[float] = None
+    attributes: Dict[str, AttrValue] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end is None else (self.end - self.start) * 1000.0
+
+    def set(self, **attributes: AttrValue) -> None:
+        self.attributes.update(attributes)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (milliseconds)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot: +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.errors = 0
+
+    def observe(self, value_ms: float, error: bool = False) -> None:
+        i = 0
+        while i < len(self.buckets) and value_ms > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += value_ms
+        self.count += 1
+        if error:
+            self.errors += 1
+
+    def cumulative(self) -> List[int]:
+        out, total = [], 0
+        for c in self.counts:
+            total += c
+            out.append(total)
+        return out
+
+    def copy(self) -> "Histogram":
+        h = Histogram(self.buckets)
+        h.counts, h.sum, h.count, h.errors = list(self.counts), self.sum, self.count, self.errors
+        return h
+
+
+class Tracer:
+    def __init__(self, enabled: bool = True, max_spans: int = 10000, buckets: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """Initialize tracer.
+
+        Args:
+            enabled: When False every method is a cheap no-op returning None.
+            max_spans: Finished spans buffered for span exporters (oldest dropped).
+            buckets: Histogram bucket upper bounds in milliseconds.
+        """
+        self.enabled = enabled
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=max(1, max_spans))
+        self._histograms: Dict[str, Histogram] = {}
+
+    def start(self, name: str, parent: Optional[Span] = None, start: Optional[float] = None, **attributes: AttrValue) -> Optional[Span]:
+        """Open a span without making it current; close it with `finish`."""
+        if not self.enabled:
+            return None
+        parent = parent or _current.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            start=time.perf_counter() if start is None else start,
+            attributes=dict(attributes),
+        )
+
+    def finish(self, span: Optional[Span], end: Optional[float] = None, error: Optional[str] = None) -> None:
+        if span is None or span.end is not None:
+            return
+        span.end = time.perf_counter() if end is None else end
+        if error is not None:
+            span.error = error
+        with self._lock:
+            self._spans.append(span)
+            hist = self._histograms.get(span.name)
+            if hist is None:
+                hist = self._histograms[span.name] = Histogram(self._buckets)
+            hist.observe(span.duration_ms or 0.0, error=span.error is not None)
+
+    @contextmanager
+    def use(self, span: Optional[Span]) -> Iterator[Optional[Span]]:
+        """Make `span` the current parent on this thread for the block."""
+        if span is None:
+            yield None
+            return
+        token = _current.set(span)
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes: AttrValue) -> Iterator[Optional[Span]]:
+        """Time the enclosed block as a (current) span; exceptions mark it failed."""
+        if not self.enabled:
+            yield None
+            return
+        s = self.start(name, parent=parent, **attributes)
+        token = _current.set(s)
+        try:
+            yield s
+        except BaseException as e:
+            self.finish(s, error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(s)
+
+    def record(self, name: str, start: Optional[float], end: Optional[float], parent: Optional[Span] = None, error: Optional[str] = None, **attributes: AttrValue) -> Optional[Span]:
+        """Record a stage measured elsewhere from two perf_counter() timestamps."""
+        if not self.enabled or start is None or end is None:
+            return None
+        s = self.start(name, parent=parent, start=start, **attributes)
+        self.finish(s, end=end, error=error)
+        return s
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def histograms(self) -> Dict[str, Histogram]:
+        with self._lock:
+            return {name: h.copy() for name, h in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+
+
+class Exporter(abc.ABC):
+    """Renders a tracer snapshot; `write` saves it to a file."""
+
+    content_type = "text/plain"
+
+    @abc.abstractmethod
+    def render(self, tracer: Tracer) -> str:
+        """The snapshot as the exporter's document (text)."""
+
+    def write(self, tracer: Tracer, path: Union[str, Path]) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(self.render(tracer), encoding="utf-8")
+        return p
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _le(bound: float) -> str:
+    return f"{bound:g}"
+
+
+class PrometheusExporter(Exporter):
+    """Per-stage histograms in the Prometheus text exposition format (0.0.4)."""
+
+    content_type = "text/plain; version=0.0.4"
+
+    def __init__(self, metric: str = "speech_stage_duration_ms"):
+        self.metric = metric
+
+    def render(self, tracer: Tracer) -> str:
+        m = self.metric
+        lines = [f"# HELP {m} Duration of traced request stages in milliseconds.", f"# TYPE {m} histogram"]
+        hists = sorted(tracer.histograms().items())
+        for stage, h in hists:
+            stage_label = f'stage="{_label(stage)}"'
+            for bound, total in zip(h.buckets + (float("inf"),), h.cumulative()):
+                le = "+Inf" if bound == float("inf") else _le(bound)
+                lines.append(f'{m}_bucket{{{stage_label},le="{le}"}} {total}')
+            lines.append(f"{m}_sum{{{stage_label}}} {h.sum:.3f}")
+            lines.append(f"{m}_count{{{stage_label}}} {h.count}")
+        lines += ["# HELP speech_stage_errors_total Traced stages that ended in an error.", "# TYPE speech_stage_errors_total counter"]
+        lines += [f'speech_stage_errors_total{{stage="{_label(stage)}"}} {h.errors}' for stage, h in hists]
+        return "\n".join(lines) + "\n"
+
+
+def _otlp_value(value: AttrValue) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": "" if value is None else str(value)}
+
+
+def _unix_nano(t: float) -> str:
+    return str(int((t + _EPOCH_OFFSET) * 1e9))
+
+
+class OtlpJsonExporter(Exporter):
+    """Buffered spans as an OTLP/JSON `ExportTraceServiceRequest` document."""
+
+    content_type = "application/json"
+
+    def __init__(self, service_name: str = SERVICE_NAME):
+        self.service_name = service_name
+
+    def render(self, tracer: Tracer) -> str:
+        spans = []
+        for s in tracer.spans():
+            item = {
+                "traceId": s.trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": _unix_nano(s.start),
+                "endTimeUnixNano": _unix_nano(s.end if s.end is not None else s.start),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+                "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+            }
+            if s.parent_id:
+                item["parentSpanId"] = s.parent_id
+            spans.append(item)
+        doc = {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                "scopeSpans": [{"scope": {"name": "cli.tracing"}, "spans": spans}],
+            }]
+        }
+        return json.dumps(doc, indent=2) + "\n"
+
+
+EXPORTERS: Dict[str, Callable[[], Exporter]] = {
+    "prometheus": PrometheusExporter,
+    "otlp-json": OtlpJsonExporter,
+}
+
+
+def register_exporter(name: str, factory: Callable[[], Exporter]) -> None:
+    EXPORTERS[name] = factory
+
+
+def get_exporter(name: str) -> Exporter:
+    try:
+        return EXPORTERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown trace exporter '{name}' (available: {', '.join(sorted(EXPORTERS))})") from None
+
+
+_default_tracer: Optional[Tracer] = None
+_default_lock = threading.Lock()
+
+
+def get_default_tracer() -> Tracer:
+    """Shared process-wide tracer; disabled (no-op) unless TTS_TRACE=1 or `enable_default_tracer()`."""
+    global _default_tracer
+    with _default_lock:
+        if _default_tracer is None:
+            _default_tracer = Tracer(
+                enabled=os.getenv("TTS_TRACE", "0").lower() in ("1", "true", "yes"),
+                max_spans=int(os.getenv("TTS_TRACE_MAX_SPANS", "10000")),
+            )
+        return _default_tracer
+
+
+def enable_default_tracer() -> Tracer:
+    tracer = get_default_tracer()
+    tracer.enabled = True
+    return tracer
+
+
+__all__ = [
+    "DEFAULT_BUCKETS_MS",
+    "EXPORTERS",
+    "Exporter",
+    "Histogram",
+    "OtlpJsonExporter",
+    "PrometheusExporter",
+    "Span",
+    "Tracer",
+    "enable_default_tracer",
+    "get_default_tracer",
+    "get_exporter",
+    "register_exporter",
+]
@@ -0,0 +1,583 @@
+"""asyncio surface for synthesis and queueing.
+
+`tts_synth.synthesize` and `QueueManager` block a thread per in-flight phrase
+(`speak_text_async(text).get()`). Embedded in an asyncio server that means an
+executor thread per session. Here the SDK is started with
+`start_speaking_text_async` and its `synthesis_completed` /
+`synthesis_canceled` / `synthesizing` events (raised on SDK threads) are
+bridged onto the event loop with `loop.call_soon_threadsafe`, so awaiting a
+phrase holds no thread at all.
+
+Cancellation: cancelling the awaiting task stops the synthesizer
+(`stop_speaking_async`) and drops it from the pool, since its late events can
+no longer be attributed to a caller.
+
+`AsyncQueueManager` mirrors `QueueManager` on `max_concurrency` worker tasks:
+the same decisions (priorities, deadlines, preemption) and `CompletedResult`,
+results in submission order, `hint()` pre-synthesis while idle, and the same
+`queue.request` / `queue.wait` / `queue.execute` spans, with `tts.synthesize`
+and its stages nested inside. `put()` awaits room (backpressure) while
+`submit()` rejects when full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import uuid
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from . import tracing, tts_cache, tts_pool, tts_synth
+from .audio_formats import AudioFormat, get_format
+from .endpoint_pool import is_connection_failure
+from .queue_manager import MAX_HINTS, PRIORITY_NORMAL, SPECULATIVE_CONCURRENCY, AudioSink, CompletedResult, QueueDecision, _Queued
+from .tts_synth import SynthesisResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .endpoint_pool import EndpointPool
+    from .tts_cache import AudioCache
+    from .tts_pool import SynthesizerPool
+
+
+async def synthesize(
+    text: str,
+    host: Optional[str] = None,
+    voice: Optional[str] = None,
+    pool: Optional["EndpointPool"] = None,
+    synthesizers: Optional["SynthesizerPool"] = None,
+    cache: Optional["AudioCache"] = None,
+    in_memory: bool = False,
+    on_audio_chunk: Optional[Callable[[bytes], None]] = None,
+    output_format: Optional[str] = None,
+    cache_identity: Optional[str] = None,
+) -> SynthesisResult:
+    """Awaitable counterpart of `tts_synth.synthesize` (same arguments and result).
+
+    `on_audio_chunk` is called on the event loop thread. Wrap the call in
+    `asyncio.wait_for` for a timeout.
+    """
+    if pool is not None:
+        chosen = pool.acquire()
+        try:
+            result = await synthesize(
+                text, host=chosen, voice=voice, synthesizers=synthesizers, cache=cache, in_memory=in_memory,
+                on_audio_chunk=on_audio_chunk, output_format=output_format,
+                cache_identity=cache_identity or tts_synth._pool_identity(pool),
+            )
+        except BaseException as e:  # caller errors and cancellation keep the replica in rotation
+            pool.release(chosen, success=not is_connection_failure(e))
+            raise
+        pool.release(chosen, success=not tts_synth.is_endpoint_failure(result))
+        return result
+    host = host or tts_synth.DEFAULT_HOST
+    voice = voice or tts_synth.DEFAULT_VOICE
+    fmt = get_format(output_format)
+    with tracing.get_default_tracer().span("tts.synthesize", host=host, voice=voice, chars=len(text), output_format=fmt.name) as span:
+        outcome = await _synthesize_on_host(text, host, voice, synthesizers, cache, in_memory, on_audio_chunk, fmt, cache_identity)
+        if span is not None:
+            span.set(reason=outcome.reason, cached=outcome.cached)
+            if not outcome.success:
+                span.error = outcome.error or outcome.reason
+    return outcome
+
+
+async def _synthesize_on_host(text: str, host: str, voice: str, synthesizers: Optional["SynthesizerPool"], cache: Optional["AudioCache"], in_memory: bool, on_audio_chunk: Optional[Callable[[bytes], None]], fmt: AudioFormat, cache_identity: Optional[str]) -> SynthesisResult:
+    if tts_synth.speechsdk is None:
+        return SynthesisResult(text=text, success=False, reason="SDK_MISSING", latency_ms=None, error="Speech SDK not installed", voice=voice, host=host, output_format=fmt.name)
+    if not text.strip():
+        return SynthesisResult(text=text, success=False, reason="EMPTY", latency_ms=None, error="Empty text", voice=voice, host=host, output_format=fmt.name)
+
+    loop = asyncio.get_running_loop()
+    audio_cache, key, hit = tts_synth._cache_lookup(text, voice, host, cache, in_memory, on_audio_chunk, fmt, cache_identity)
+    if hit is not None:
+        return hit
+    output_path = tts_synth._prepare_output(in_memory, fmt)
+
+    synth_pool = synthesizers or tts_pool.get_default_pool()
+    try:
+        if synth_pool is not None:
+            # Only blocks when a new synthesizer has to connect; idle ones return at once
+            entry = await loop.run_in_executor(None, synth_pool.acquire, host, voice, fmt.name)
+        else:
+            entry = await loop.run_in_executor(None, tts_pool.PooledSynthesizer, host, voice, fmt.name)
+    except Exception as e:  # SDK could not build a synthesizer for this host
+        tts_synth._discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=voice, host=host, output_format=fmt.name)
+
+    done: "asyncio.Future[object]" = loop.create_future()
+
+    def settle(evt) -> None:  # noqa: ANN001  (SDK thread)
+        loop.call_soon_threadsafe(lambda: done.done() or done.set_result(evt.result))
+
+    entry.on_completed = settle
+    entry.on_canceled = settle
+    if on_audio_chunk is not None:
+        entry.on_synthesizing = lambda evt: loop.call_soon_threadsafe(on_audio_chunk, evt.result.audio_data)
+
+    start = time.perf_counter()
+    try:
+        entry.synthesizer.start_speaking_text_async(text)
+        result = await done
+        first_audio_time = entry.first_audio_time
+        tts_synth._trace_stream(start, first_audio_time, result)
+    except asyncio.CancelledError:
+        try:
+            entry.synthesizer.stop_speaking_async()
+        except Exception:
+            pass
+        tts_synth._release_synthesizer(synth_pool, entry, healthy=False)
+        tts_synth._discard_if_empty(output_path)
+        raise
+    except RuntimeError as e:  # container connection / audio system issues
+        tts_synth._release_synthesizer(synth_pool, entry, healthy=False)
+        tts_synth._discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="RUNTIME_ERROR", latency_ms=None, error=str(e), voice=voice, host=host, audio_path=output_path, output_format=fmt.name)
+    except Exception as e:  # generic failure
+        tts_synth._release_synthesizer(synth_pool, entry, healthy=False)
+        tts_synth._discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=voice, host=host, audio_path=output_path, output_format=fmt.name)
+    try:
+        if output_path or audio_cache is not None:
+            await loop.run_in_executor(None, tts_synth._store_audio, result, output_path, audio_cache, key, fmt)
+    except asyncio.CancelledError:  # the audio is complete; only the write was abandoned
+        tts_synth._release_synthesizer(synth_pool, entry, healthy=True)
+        tts_synth._discard_if_empty(output_path)
+        raise
+    except OSError as e:  # local disk (output file / cache): the container and synthesizer are fine
+        tts_synth._release_synthesizer(synth_pool, entry, healthy=True)
+        tts_synth._discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="IO_ERROR", latency_ms=None, error=str(e), voice=voice, host=host, audio_path=output_path, output_format=fmt.name)
+
+    outcome, healthy = tts_synth._build_result(text, voice, host, result, start, first_audio_time, output_path, in_memory, fmt)
+    tts_synth._release_synthesizer(synth_pool, entry, healthy=healthy)
+    return outcome
+
+
+class AsyncQueueManager:
+    def __init__(
+        self,
+        host: str,
+        voice: str,
+        max_queue: int = 3,
+        pool: Optional["EndpointPool"] = None,
+        in_memory: bool = False,
+        max_concurrency: int = 1,
+        on_result: Optional[Callable[[CompletedResult], None]] = None,
+        output_format: Optional[str] = None,
+        on_decision: Optional[Callable[[QueueDecision], None]] = None,
+    ):
+        """Initialize async queue manager (arguments as for `QueueManager`).
+
+        Worker tasks start on first use inside a running loop; use
+        `async with` or call `close()` to stop them. Callbacks run on the
+        event loop.
+        """
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._host = host
+        self._voice = voice
+        self._pool = pool
+        # Cache identity hints are checked under; matches the keys synthesize() uses with `pool`
+        self._cache_identity = tts_cache.pool_identity(pool.hosts) if pool is not None else host
+        self._in_memory = in_memory
+        self._output_format = output_format
+        self._max_queue = max_queue
+        self._max_concurrency = max_concurrency
+        self._on_result = on_result
+        self._on_decision = on_decision
+        self._dispatch: "Optional[asyncio.Queue[_Queued]]" = None  # slot holders not yet picked up by a worker
+        self._workers: List[asyncio.Task] = []
+        self._active: Dict[str, str] = {}  # request_id -> text (holding a slot)
+        self._queue: List[_Queued] = []  # heap of requests waiting for a free slot
+        self._seq = itertools.count()
+        self._running: Dict[str, asyncio.Task] = {}  # request_id -> synthesis task
+        self._futures: Dict[str, "asyncio.Future[CompletedResult]"] = {}  # unfinished requests
+        self._dropped: List[QueueDecision] = []
+        self._hints: Deque[str] = deque(maxlen=MAX_HINTS)
+        self._speculating: Dict[str, asyncio.Task] = {}  # hint text -> pre-synthesis task
+        self.hints_completed = 0
+        self.hints_cancelled = 0
+        self._order: Deque[str] = deque()  # accepted, undelivered request ids in submission order
+        self._completed: Dict[str, CompletedResult] = {}  # reorder buffer
+        self._results: List[CompletedResult] = []
+        self._delivering = False
+        self._drained: Optional[asyncio.Event] = None  # set while nothing is undelivered
+        self._room: Optional[asyncio.Event] = None  # set when a slot or queue entry frees up
+        self._tracer = tracing.get_default_tracer()
+        self._spans: Dict[str, tracing.Span] = {}  # request_id -> open queue.request span
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncQueueManager":
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _start(self) -> None:
+        if self._dispatch is not None:
+            return
+        self._dispatch = asyncio.Queue()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._room = asyncio.Event()
+        self._workers = [asyncio.get_running_loop().create_task(self._worker()) for _ in range(self._max_concurrency)]
+
+    def submit(self, text: str, priority: int = PRIORITY_NORMAL, deadline: Optional[float] = None, on_audio_chunk: Optional[AudioSink] = None, output_format: Optional[str] = None) -> QueueDecision:
+        """Non-blocking submit with the same arguments and decisions as `QueueManager.submit`."""
+        decision, dropped = self._submit(text, priority, deadline, on_audio_chunk, output_format or self._output_format)
+        if self._on_decision is not None:
+            self._on_decision(decision)
+        self._settle_dropped(dropped)
+        return decision
+
+    async def put(self, text: str, priority: int = PRIORITY_NORMAL, deadline: Optional[float] = None, on_audio_chunk: Optional[AudioSink] = None, output_format: Optional[str] = None) -> "asyncio.Future[CompletedResult]":
+        """Enqueue `text`, waiting for queue room instead of rejecting (backpressure).
+
+        Raises:
+            ValueError: Empty text or a deadline that has already passed.
+            RuntimeError: Manager closed.
+        """
+        if not text.strip():
+            raise ValueError("Empty text")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be > 0")
+        self._start()
+        while not self._closed and len(self._active) >= self._max_concurrency and len(self._queue) >= self._max_queue:
+            self._room.clear()
+            await self._room.wait()
+        if self._closed:
+            raise RuntimeError("AsyncQueueManager is closed")
+        return self.submit(text, priority, deadline, on_audio_chunk, output_format).future
+
+    def _submit(self, text: str, priority: int, deadline: Optional[float], on_audio_chunk: Optional[AudioSink], output_format: Optional[str]) -> Tuple[QueueDecision, List[QueueDecision]]:
+        t = text.strip()
+        if not t:
+            return QueueDecision(request_id=str(uuid.uuid4()), text=text, decision="REJECTED_EMPTY", timestamp=time.perf_counter(), priority=priority), []
+        self._start()
+        now = time.perf_counter()
+        rid = str(uuid.uuid4())
+        if self._closed:
+            return QueueDecision(request_id=rid, text=t, decision="REJECTED_STOPPED", timestamp=now, priority=priority), []
+        if deadline is not None and deadline <= 0:
+            decision = QueueDecision(request_id=rid, text=t, decision="DROPPED_DEADLINE", timestamp=now, priority=priority)
+            self._dropped.append(decision)
+            return decision, []
+        self._preempt_speculation(t)
+        if len(self._active) < self._max_concurrency:
+            future = self._track(rid, priority, now)
+            self._start_work(_Queued(priority, next(self._seq), rid, t, future, None, on_audio_chunk, output_format))
+            return QueueDecision(request_id=rid, text=t, decision="ACTIVE_STARTED", timestamp=now, future=future, priority=priority), []
+        dropped = self._expire(now)
+        if len(self._queue) >= self._max_queue and self._queue:
+            worst = max(self._queue)
+            if priority < worst.priority:
+                self._queue.remove(worst)
+                heapq.heapify(self._queue)
+                dropped.append(self._drop(worst, "DROPPED_PREEMPTED", now))
+        if len(self._queue) >= self._max_queue:
+            return QueueDecision(request_id=rid, text=t, decision="REJECTED_QUEUE_FULL", timestamp=now, priority=priority), dropped
+        future = self._track(rid, priority, now)
+        heapq.heappush(self._queue, _Queued(priority, next(self._seq), rid, t, future, None if deadline is None else now + deadline, on_audio_chunk, output_format))
+        return QueueDecision(request_id=rid, text=t, decision="QUEUED", timestamp=now, future=future, priority=priority), dropped
+
+    def _track(self, rid: str, priority: int, now: float) -> "asyncio.Future[CompletedResult]":
+        future: "asyncio.Future[CompletedResult]" = asyncio.get_running_loop().create_future()
+        self._order.append(rid)
+        self._futures[rid] = future
+        self._drained.clear()
+        span = self._tracer.start("queue.request", start=now, request_id=rid, priority=priority)
+        if span is not None:
+            self._spans[rid] = span
+        # Cancelling the caller's future cancels the request as well
+        future.add_done_callback(lambda f: f.cancelled() and self.cancel(rid))
+        return future
+
+    def _start_work(self, item: _Queued) -> None:
+        self._active[item.request_id] = item.text
+        self._dispatch.put_nowait(item)
+
+    def _expire(self, now: float) -> List[QueueDecision]:
+        """Drop queued requests whose deadline has passed."""
+        expired = [q for q in self._queue if q.deadline is not None and q.deadline <= now]
+        if expired:
+            self._queue = [q for q in self._queue if q not in expired]
+            heapq.heapify(self._queue)
+        return [self._drop(q, "DROPPED_DEADLINE", now) for q in expired]
+
+    def _drop(self, item: _Queued, reason: str, now: float) -> QueueDecision:
+        """Record a drop and park its failed result in the reorder buffer."""
+        decision = QueueDecision(request_id=item.request_id, text=item.text, decision=reason, timestamp=now, future=item.future, priority=item.priority)
+        self._dropped.append(decision)
+        self._futures.pop(item.request_id, None)
+        self._completed[item.request_id] = CompletedResult(
+            request_id=item.request_id, text=item.text, success=False, latency_ms=None, audio_path=None,
+            reason=reason, error="Dropped before synthesis", started_monotonic=now, completed_monotonic=now,
+        )
+        return decision
+
+    def _settle_dropped(self, dropped: List[QueueDecision]) -> None:
+        """Report drops, resolve their futures and release held results."""
+        if not dropped:
+            return
+        for decision in dropped:
+            if self._on_decision is not None:
+                self._on_decision(decision)
+            result = self._completed.get(decision.request_id)
+            if result is not None and not decision.future.done():
+                decision.future.set_result(result)
+        self._room.set()
+        self._deliver()
+
+    def _next_queued(self, now: float) -> Tuple[Optional[_Queued], List[QueueDecision]]:
+        """Pop the best queued request that can still meet its deadline."""
+        dropped = []
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            if item.deadline is not None and item.deadline <= now:
+                dropped.append(self._drop(item, "DROPPED_DEADLINE", now))
+                continue
+            return item, dropped
+        return None, dropped
+
+    def cancel(self, request_id: str) -> bool:
+        """Cancel a queued or running request; False if unknown or already finished.
+
+        The request is still delivered in order, as a failed CANCELLED result.
+        """
+        future = self._futures.pop(request_id, None)
+        if future is None:
+            return False
+        future.cancel()
+        task = self._running.get(request_id)
+        queued = next((q for q in self._queue if q.request_id == request_id), None)
+        if task is not None:  # stops the synthesizer; the worker records a CANCELLED result
+            task.cancel()
+        elif queued is not None:
+            self._queue.remove(queued)
+            heapq.heapify(self._queue)
+            self._completed[request_id] = self._cancelled(queued)
+            self._room.set()
+            self._deliver()
+        # else: dispatched but not started; the worker sees the cancelled future and skips synthesis
+        return True
+
+    def _cancelled(self, item: _Queued) -> CompletedResult:
+        now = time.perf_counter()
+        return CompletedResult(
+            request_id=item.request_id, text=item.text, success=False, latency_ms=None, audio_path=None, reason="CANCELLED",
+            error="Cancelled before synthesis", started_monotonic=now, completed_monotonic=now, output_format=item.output_format,
+        )
+
+    def hint(self, texts: Iterable[str]) -> int:
+        """Register likely upcoming texts for idle-time pre-synthesis into the cache (see `QueueManager.hint`).
+
+        Call from the event loop; returns the number of texts accepted.
+        """
+        audio_cache = tts_cache.get_default_cache()
+        if audio_cache is None or self._closed:
+            return 0
+        # Speculation stores audio in the manager's output format; check under the same key
+        format_name = get_format(self._output_format).name
+        accepted = 0
+        for text in texts:
+            t = text.strip()
+            if not t or t in self._hints or t in self._speculating:
+                continue
+            if audio_cache.contains(tts_cache.cache_key(t, self._voice, self._cache_identity, format_name)):
+                continue
+            self._hints.append(t)
+            accepted += 1
+        if accepted:
+            self._start()
+            self._maybe_speculate()
+        return accepted
+
+    def _maybe_speculate(self) -> None:
+        if self._closed or not self._hints or self._active or self._queue or len(self._speculating) >= SPECULATIVE_CONCURRENCY:
+            return
+        text = self._hints.popleft()
+        self._speculating[text] = asyncio.get_running_loop().create_task(self._speculate(text))
+
+    def _preempt_speculation(self, text: str) -> None:
+        """Real work arrived: stop speculation (its hints are re-queued) and forget `text` as a hint."""
+        try:
+            self._hints.remove(text)
+        except ValueError:
+            pass
+        for task in self._speculating.values():
+            task.cancel()
+
+    async def _speculate(self, text: str) -> None:
+        try:
+            synth = await synthesize(text, host=self._host, voice=self._voice, pool=self._pool, in_memory=True, output_format=self._output_format)
+        except asyncio.CancelledError:
+            self.hints_cancelled += 1
+            if not self._closed:
+                self._hints.appendleft(text)  # retried at the next idle spell
+            return
+        except Exception:  # speculation is best effort
+            return
+        finally:
+            del self._speculating[text]
+        if synth.success:
+            self.hints_completed += 1
+        self._maybe_speculate()
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._dispatch.get()
+            rid = item.request_id
+            if item.future.cancelled():  # cancelled before a worker got to it: skip synthesis
+                result = self._cancelled(item)
+            else:
+                span = self._spans.get(rid)
+                self._tracer.record("queue.wait", span.start if span is not None else None, time.perf_counter(), parent=span)
+                with self._tracer.use(span), self._tracer.span("queue.execute", request_id=rid):
+                    result = await self._execute(item)
+            self._finish(item, result)
+
+    async def _execute(self, item: _Queued) -> CompletedResult:
+        rid, text = item.request_id, item.text
+        task = asyncio.ensure_future(synthesize(
+            text, host=self._host, voice=self._voice, pool=self._pool, in_memory=self._in_memory,
+            on_audio_chunk=item.on_audio_chunk, output_format=item.output_format,
+        ))
+        self._running[rid] = task
+        start_mono = time.perf_counter()
+        try:
+            synth = await task
+        except asyncio.CancelledError:
+            if self._closed or not task.cancelled():  # the worker itself is being cancelled
+                raise
+            synth = SynthesisResult(text=text, success=False, reason="CANCELLED", latency_ms=None, error="Cancelled", voice=self._voice, host=self._host)
+        except Exception as e:  # keep the slot accounting intact whatever happens
+            synth = SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=self._voice, host=self._host)
+        finally:
+            self._running.pop(rid, None)
+        return CompletedResult(
+            request_id=rid,
+            text=text,
+            success=synth.success,
+            latency_ms=synth.latency_ms,
+            audio_path=synth.audio_path,
+            reason=synth.reason,
+            error=synth.error,
+            started_monotonic=start_mono,
+            completed_monotonic=time.perf_counter(),
+            cached=synth.cached,
+            audio_data=synth.audio_data,
+            first_audio_monotonic=synth.first_audio_monotonic,
+            output_format=synth.output_format,
+        )
+
+    def _finish(self, item: _Queued, result: CompletedResult) -> None:
+        """Free the slot, resolve the future, promote the next queued request."""
+        rid = item.request_id
+        del self._active[rid]
+        self._futures.pop(rid, None)
+        if not item.future.done():
+            item.future.set_result(result)
+        self._completed[rid] = result
+        dropped: List[QueueDecision] = []
+        if not self._closed:
+            nxt, dropped = self._next_queued(time.perf_counter())
+            if nxt is not None:
+                self._start_work(nxt)
+        self._room.set()
+        self._settle_dropped(dropped)
+        self._deliver()
+        self._maybe_speculate()
+
+    def _deliver(self) -> None:
+        """Move the in-order prefix of the reorder buffer to `results` and `on_result`."""
+        if self._delivering:  # an on_result callback re-entered; the outer loop picks up the rest
+            return
+        self._delivering = True
+        try:
+            while self._order and self._order[0] in self._completed:
+                result = self._completed.pop(self._order.popleft())
+                self._results.append(result)
+                span = self._spans.pop(result.request_id, None)
+                if span is not None:
+                    span.set(reason=result.reason, cached=result.cached)
+                    self._tracer.finish(span, error=None if result.success else (result.error or result.reason))
+                if self._on_result is not None:
+                    self._on_result(result)
+        finally:
+            self._delivering = False
+        if not self._order and self._drained is not None:
+            self._drained.set()
+
+    async def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every accepted request has completed and been delivered; False on timeout."""
+        if self._drained is None:
+            return True
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Reject new work, cancel queued and running requests and stop the workers.
+
+        Every undelivered request is delivered as CANCELLED, so `wait_all`
+        returns at once afterwards.
+        """
+        self._closed = True
+        self._hints.clear()
+        for task in list(self._speculating.values()):
+            task.cancel()
+        for rid in list(self._order):
+            self.cancel(rid)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, *self._speculating.values(), return_exceptions=True)
+        self._workers = []
+        # Requests a cancelled worker had dispatched or was running never reach _finish
+        for rid in self._order:
+            if rid not in self._completed:
+                now = time.perf_counter()
+                self._completed[rid] = CompletedResult(
+                    request_id=rid, text=self._active.get(rid, ""), success=False, latency_ms=None, audio_path=None,
+                    reason="CANCELLED", error="Manager closed", started_monotonic=now, completed_monotonic=now,
+                )
+        self._active.clear()
+        self._queue.clear()
+        if self._room is not None:
+            self._room.set()  # put() callers waiting for room raise RuntimeError
+        self._deliver()
+
+    @property
+    def results(self) -> List[CompletedResult]:
+        return list(self._results)
+
+    @property
+    def dropped(self) -> List[QueueDecision]:
+        """DROPPED_DEADLINE / DROPPED_PREEMPTED decisions recorded after (or at) submission."""
+        return list(self._dropped)
+
+    @property
+    def pending_queue_length(self) -> int:
+        return len(self._queue)
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @property
+    def max_queue(self) -> int:
+        return self._max_queue
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+
+__all__ = ["synthesize", "AsyncQueueManager"]
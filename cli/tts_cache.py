@@ -0,0 +1,163 @@
+"""Content-addressed on-disk TTS audio cache with LRU eviction.
+
+IVR-style prompts repeat the same phrases all day; re-synthesizing each one
+costs a container round-trip and a new WAV. Entries are keyed by a SHA-256 of
+(text, voice, model identity, output format) and stored as
+`<root>/<key[:2]>/<key><ext>`, the extension of the output format
+(`.wav`, `.ogg`, `.mp3`, `.pcm`) so a hit can be handed out as-is. Total size is capped at `max_bytes`; the least
+recently used entries (file mtime, refreshed on every hit) are evicted first.
+
+Model identity is `TTS_MODEL_VERSION` when set (lets replicas running the same
+image share entries) and the container host otherwise; requests spread over an
+`EndpointPool` use the pool's replica set (`pool_identity`), so a phrase cached
+through one replica is a hit whichever replica the next request would pick.
+
+Counters (`hits`, `misses`, `evictions`) are exposed via `stats()` for sizing.
+
+Environment overrides for the shared default cache:
+  TTS_CACHE_DIR      cache root (default assets/output/cache)
+  TTS_CACHE_MAX_MB   size cap in MB; 0 disables caching (default 256)
+  TTS_MODEL_VERSION  model identity used in keys (default: host)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from .audio_formats import DEFAULT_FORMAT_NAME
+from .tts_synth import OUTPUT_DIR
+
+DEFAULT_FORMAT = DEFAULT_FORMAT_NAME  # FR-011
+EXTENSIONS = (".wav", ".ogg", ".mp3", ".pcm")
+
+
+def cache_key(text: str, voice: str, host: str, output_format: str = DEFAULT_FORMAT) -> str:
+    model = os.getenv("TTS_MODEL_VERSION") or host
+    material = "\x1f".join((text, voice, model, output_format))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def pool_identity(hosts: Sequence[str]) -> str:
+    """Cache identity of an EndpointPool: its replicas, assumed to serve one model."""
+    return ",".join(sorted(hosts))
+
+
+class AudioCache:
+    def __init__(self, root: Path, max_bytes: int):
+        """Initialize cache, indexing any entries already on disk (oldest first)."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self._root = Path(root)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()  # key -> (size, extension), LRU order
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load()
+
+    def _path(self, key: str, extension: str = ".wav") -> Path:
+        return self._root / key[:2] / f"{key}{extension}"
+
+    def _load(self) -> None:
+        if not self._root.exists():
+            return
+        entries = []
+        for p in self._root.glob("*/*.*"):
+            if p.suffix not in EXTENSIONS or p.name.startswith("."):
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, p.stem, st.st_size, p.suffix))
+        for _mtime, key, size, extension in sorted(entries):
+            self._index[key] = (size, extension)
+            self._bytes += size
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file for `key` (refreshing its LRU position) or None."""
+        with self._lock:
+            path = self._path(key, self._index[key][1]) if key in self._index else None
+            if path is not None and path.exists():
+                self._index.move_to_end(key)
+                self.hits += 1
+                try:
+                    os.utime(path)  # persist recency across processes
+                except OSError:
+                    pass
+                return path
+            if key in self._index:  # removed behind our back
+                self._bytes -= self._index.pop(key)[0]
+            self.misses += 1
+            return None
+
+    def contains(self, key: str) -> bool:
+        """Membership test that does not count as a lookup or refresh recency."""
+        with self._lock:
+            return key in self._index
+
+    def put(self, key: str, data: bytes, extension: str = ".wav") -> Path:
+        """Store `data` under `key` (atomic rename) and evict LRU entries over the cap."""
+        path = self._path(key, extension)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{key}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            if key in self._index:
+                self._bytes -= self._index.pop(key)[0]
+            self._index[key] = (len(data), extension)
+            self._bytes += len(data)
+            victims = []
+            while self._bytes > self._max_bytes and len(self._index) > 1:
+                old_key, (size, old_extension) = self._index.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+                victims.append(self._path(old_key, old_extension))
+        for victim in victims:
+            try:
+                victim.unlink()
+            except OSError:
+                pass
+        return path
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+
+_default_cache: Optional[AudioCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[AudioCache]:
+    """Shared process-wide cache, or None when TTS_CACHE_MAX_MB=0."""
+    global _default_cache
+    max_mb = float(os.getenv("TTS_CACHE_MAX_MB", "256"))
+    if max_mb <= 0:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            root = Path(os.getenv("TTS_CACHE_DIR", str(OUTPUT_DIR / "cache")))
+            _default_cache = AudioCache(root, int(max_mb * 1024 * 1024))
+        return _default_cache
+
+
+__all__ = ["AudioCache", "cache_key", "get_default_cache", "pool_identity"]
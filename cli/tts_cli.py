@@ -9,10 +9,22 @@ Usage:
   ./cli/tts_cli.py --ping
 
 Environment variables (optional overrides):
-  TTS_HOST_URL: Base URL to the TTS container (default http://localhost:5001)
+  TTS_HOST_URL: Base URL to the TTS container (default http://localhost:5001).
+    A comma-separated list spreads --say/--multi requests over several replicas.
+  TTS_TRACE: 1 records per-stage spans (see cli/tracing.py); --trace-export
+    enables it too and writes Prometheus / OTLP JSON files at exit.
+  TTS_EVENT_LOG: Append-only event log (default assets/output/events.jsonl;
+    a .csv path writes CSV; "off" disables). Every readiness result, queue
+    decision, queue result and --say result is appended as it happens.
+  TTS_DAEMON_URL: Send --say/--multi to a running `python -m cli.tts_daemon`
+    (http://HOST:PORT or unix:///PATH) instead of synthesizing in-process.
+  TTS_OUTPUT_FORMAT: Output format for --say/--multi (see cli/audio_formats.py),
+    e.g. opus or mp3 for ~10x smaller archives; default 16 kHz PCM WAV.
 
 Evidence artifact path:
     assets/output/readiness.txt
+    assets/output/queue.txt (streamed while --multi runs)
+    assets/output/events.jsonl (rotating, see cli/evidence.py)
 
 Functional mapping:
   FR-004 Readiness probe command
@@ -31,119 +43,344 @@ import time
 from pathlib import Path
 from typing import Tuple
 
-try:
-    import httpx  # minimal dependency already in tech stack
-except ImportError:  # fail soft per FR-013
-    httpx = None  # type: ignore
-
 OUTPUT_DIR = Path("assets/output")  # Single centralized evidence directory
 READINESS_FILE = OUTPUT_DIR / "readiness.txt"
 
 
+def import_cli_module(name: str):
+    """Import a sibling `cli.<name>` module, also when this file runs as a script."""
+    import importlib
+    # Ensure repository root is on sys.path so the cli package resolves
+    repo_root = Path(__file__).resolve().parent.parent
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    return importlib.import_module(f"cli.{name}")
+
+
 def ensure_dirs() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def ping(tts_url: str, timeout: float = 2.0) -> Tuple[bool, int, float, str]:
-    """Perform readiness ping.
-
-    Returns (ok, status_code, elapsed_seconds, message)
-    """
-    if httpx is None:
-        return False, 0, 0.0, "httpx not installed"
-    start = time.perf_counter()
-    try:
-        resp = httpx.get(f"{tts_url.rstrip('/')}/ready", timeout=timeout)
-        elapsed = time.perf_counter() - start
-        ok = resp.status_code == 200
-        return ok, resp.status_code, elapsed, "READY" if ok else f"Unexpected status {resp.status_code}"
-    except Exception as e:  # soft failure
-        elapsed = time.perf_counter() - start
-        return False, 0, elapsed, f"Error: {e}"[:300]
+def write_readiness_artifact(result: Tuple[bool, int, float, str], tts_url: str) -> None:
+    write_readiness_artifacts([(result, tts_url)])
 
 
-def write_readiness_artifact(result: Tuple[bool, int, float, str], tts_url: str) -> None:
-    ok, status, elapsed, message = result
+def write_readiness_artifacts(results: list[Tuple[Tuple[bool, int, float, str], str]]) -> None:
+    """Write one readiness block per probed host (blank-line separated)."""
     ensure_dirs()
     ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    lines = [
-        f"timestamp={ts}",
-        f"url={tts_url}",
-        f"status_code={status}",
-        f"elapsed_ms={int(elapsed*1000)}",
-        f"result={'PASS' if ok else 'FAIL'}",
-        f"message={message}",
-    ]
-    READINESS_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")  # Write readiness artifact
+    blocks = []
+    for (ok, status, elapsed, message), tts_url in results:
+        lines = [
+            f"timestamp={ts}",
+            f"url={tts_url}",
+            f"status_code={status}",
+            f"elapsed_ms={int(elapsed*1000)}",
+            f"result={'PASS' if ok else 'FAIL'}",
+            f"message={message}",
+        ]
+        blocks.append("\n".join(lines) + "\n")
+    READINESS_FILE.write_text("\n".join(blocks), encoding="utf-8")  # Write readiness artifact
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="NearRealTimeText2Speech minimal CLI")
     p.add_argument("--ping", action="store_true", help="Perform readiness probe and exit")
-    p.add_argument("--host", default=os.getenv("TTS_HOST_URL", "http://localhost:5001"), help="Base URL for TTS container (default env TTS_HOST_URL or http://localhost:5001)")
+    p.add_argument("--host", default=os.getenv("TTS_HOST_URL", "http://localhost:5001"), help="Base URL for TTS container; comma-separated for several replicas (default env TTS_HOST_URL or http://localhost:5001)")
+    p.add_argument("--lb-strategy", choices=["round_robin", "least_outstanding"], default=os.getenv("TTS_LB_STRATEGY", "round_robin"), help="Replica selection when --host lists several containers. Default round_robin.")
     p.add_argument("--say", metavar="TEXT", help="Speak a short text (smoke synthesis) and report latency")
     p.add_argument("--play", action="store_true", help="Attempt local audio playback of synthesized result (T04)")
+    p.add_argument("--stream", action="store_true", help="With --play: start playback on the first synthesized audio chunk instead of after the full WAV")
+    p.add_argument("--in-memory", action="store_true", help="Keep synthesized audio in memory (no WAV written); --play uses the buffer directly")
+    p.add_argument("--segment", action="store_true", help="With --say: split long text into sentences and synthesize them pipelined (next segment renders while the current one plays) into one gapless stream/WAV")
+    p.add_argument("--lookahead", type=int, default=2, help="With --segment: segments synthesized ahead of the one playing. Default 2.")
     p.add_argument("--multi", nargs="+", metavar="TEXT", help="Submit multiple texts rapidly to exercise queue manager (T05)")
     p.add_argument("--max-queue", type=int, default=int(os.getenv("TTS_MAX_QUEUE", "3")), help="Maximum queued items (excluding active). Default 3.")
+    p.add_argument("--max-concurrency", type=int, default=int(os.getenv("TTS_MAX_CONCURRENCY", "1")), help="Syntheses allowed to run at once in --multi; results still complete in submission order. Default 1.")
+    p.add_argument("--priority", choices=["interactive", "normal", "bulk"], default="normal", help="Priority class for --multi submissions; interactive requests start before queued bulk ones. Default normal.")
+    p.add_argument("--deadline-ms", type=int, default=None, help="With --multi: drop requests still queued this many ms after submission (DROPPED_DEADLINE) instead of synthesizing them")
+    p.add_argument("--hint", nargs="+", metavar="TEXT", help="With --multi: likely upcoming prompts to pre-synthesize into the audio cache while the queue is idle")
+    p.add_argument("--daemon", metavar="URL", default=os.getenv("TTS_DAEMON_URL"), help="Send --say/--multi to a running `python -m cli.tts_daemon` (http://HOST:PORT or unix:///PATH) instead of synthesizing in this process (default env TTS_DAEMON_URL)")
+    p.add_argument("--format", dest="output_format", default=os.getenv("TTS_OUTPUT_FORMAT"), help="Output format for --say/--multi: a wire name such as riff-24khz-16bit-mono-pcm, ogg-16khz-16bit-mono-opus, audio-24khz-48kbitrate-mono-mp3, or alias wav|pcm|opus|mp3 (default env TTS_OUTPUT_FORMAT or 16 kHz PCM WAV)")
     p.add_argument("--voice", default=os.getenv("VOICE_NAME", "en-US-JennyNeural"), help="Voice name override (default env VOICE_NAME or en-US-JennyNeural)")
+    p.add_argument("--event-log", default=os.getenv("TTS_EVENT_LOG", str(OUTPUT_DIR / "events.jsonl")), help="Append-only event log (.jsonl or .csv), rotated at 10 MB; 'off' disables. Default env TTS_EVENT_LOG or assets/output/events.jsonl")
+    p.add_argument("--trace-export", action="append", metavar="FORMAT[=PATH]", help="Trace per-stage latency and write it at exit: prometheus (default assets/output/trace_metrics.prom) or otlp-json (default assets/output/trace_spans.json). Repeatable.")
     return p.parse_args(argv)
 
 
+TRACE_DEFAULT_FILES = {"prometheus": "trace_metrics.prom", "otlp-json": "trace_spans.json"}
+
+
+def parse_trace_exports(specs: list[str]):
+    """Map FORMAT[=PATH] specs to (format, exporter, path); enables the shared tracer."""
+    if not specs:
+        return []
+    tracing = import_cli_module("tracing")
+    exports = []
+    for spec in specs:
+        name, _, path = spec.partition("=")
+        exporter = tracing.get_exporter(name)  # ValueError for unknown formats
+        exports.append((name, exporter, Path(path) if path else OUTPUT_DIR / TRACE_DEFAULT_FILES.get(name, f"trace_{name}.txt")))
+    tracer = tracing.enable_default_tracer()
+    return [(name, exporter, path, tracer) for name, exporter, path in exports]
+
+
+def open_event_log(path: str):
+    """EventLog appending to `path`, or None when disabled/unwritable (FR-013)."""
+    if not path or path.lower() in ("off", "0", "none"):
+        return None
+    evidence = import_cli_module("evidence")
+    try:
+        return evidence.EventLog(path, fmt=evidence.format_for_path(path))
+    except OSError as e:
+        print(f"EVENT LOG disabled | path={path} | {e}")
+        return None
+
+
+def queue_line(e) -> str:  # noqa: ANN001
+    """queue.txt layout (decision|... / result|...) of a decision or result event."""
+    if e["event"] == "decision":
+        return f"decision|{e['request_id']}|{e['decision']}|{e['timestamp_ms']}|{e['text']}|max_queue={e['max_queue']}|priority={e['priority']}"
+    return f"result|{e['request_id']}|{e['success']}|{e['reason']}|{e['latency_ms']}|{e['started_ms']}|{e['completed_ms']}|{e['text']}|max_queue={e['max_queue']}|cached={e['cached']}"
+
+
+def resolve_output_format(args: argparse.Namespace):
+    """AudioFormat for --format, or None (after printing why) when it cannot be used here."""
+    try:
+        fmt = import_cli_module("audio_formats").get_format(args.output_format)
+    except ValueError as e:
+        print(f"FORMAT FAIL | {e}")
+        return None
+    if args.segment and fmt.container != "riff":
+        print(f"FORMAT FAIL | --segment stitches PCM WAV segments; {fmt.name} is not supported")
+        return None
+    if args.play and args.stream and not fmt.is_pcm:
+        print(f"FORMAT FAIL | --stream plays PCM as it arrives; {fmt.name} is compressed")
+        return None
+    return fmt
+
+
+def run_daemon(args: argparse.Namespace, events=None) -> int:  # noqa: ANN001
+    """--say / --multi through a resident tts_daemon: no SDK import or connection setup here."""
+    tts_daemon = import_cli_module("tts_daemon")
+    try:
+        client = tts_daemon.DaemonClient(args.daemon)
+    except ValueError as e:
+        print(f"DAEMON FAIL | {e}")
+        return 0
+    if not client.ready():
+        print(f"DAEMON FAIL | url={args.daemon} | not reachable (start it with: python -m cli.tts_daemon)")
+        return 0
+    ensure_dirs()
+    if args.multi:
+        from concurrent.futures import ThreadPoolExecutor
+        evidence = import_cli_module("evidence")
+        queue_log = evidence.EventLog(OUTPUT_DIR / "queue.txt", formatter=queue_line, max_bytes=0, truncate=True)
+        max_queue = client.status().get("max_queue", args.max_queue)
+
+        def record(event: dict) -> None:
+            queue_log.write(event)
+            if events is not None:
+                events.write({"ts": evidence.utc_timestamp(), "daemon": args.daemon, **event})
+
+        def submit(text: str) -> dict:
+            submitted_ms = int(time.perf_counter() * 1000)
+            meta, _ = client.synthesize(text, priority=args.priority, deadline_ms=args.deadline_ms, output_format=args.output_format)
+            rid = meta.get("request_id", "")
+            record({"event": "decision", "request_id": rid, "decision": meta.get("decision"), "timestamp_ms": submitted_ms, "text": text, "max_queue": max_queue, "priority": meta.get("priority", args.priority)})
+            if meta.get("decision") in ("ACTIVE_STARTED", "QUEUED") and "synth_ms" in meta:
+                started_ms = submitted_ms + int(meta["queue_ms"])
+                record({
+                    "event": "result", "request_id": rid, "success": meta["success"], "reason": meta["reason"], "latency_ms": meta["latency_ms"],
+                    "started_ms": started_ms, "completed_ms": started_ms + int(meta["synth_ms"]), "text": text,
+                    "max_queue": max_queue, "cached": meta["cached"], "error": meta.get("error"),
+                })
+            return meta
+
+        if args.hint:
+            client.hint(args.hint)
+        with ThreadPoolExecutor(max_workers=len(args.multi)) as pool:
+            futures = []
+            for txt in args.multi:
+                futures.append(pool.submit(submit, txt))
+                time.sleep(0.05)  # rapid submissions, as in the in-process path
+            metas = [f.result() for f in futures]
+        queue_log.close()
+        count = lambda *names: sum(1 for m in metas if m.get("decision") in names)  # noqa: E731
+        print(
+            f"MULTI complete | daemon={args.daemon} | active_started={count('ACTIVE_STARTED')} queued={count('QUEUED')} "
+            f"rejected={count('REJECTED_QUEUE_FULL', 'REJECTED_STOPPED')} dropped={count('DROPPED_DEADLINE', 'DROPPED_PREEMPTED')} "
+            f"results={sum(1 for m in metas if 'synth_ms' in m)} max_queue={max_queue}"
+        )
+        return 0
+    playback_meta = None
+    if args.play and args.stream:
+        fmt = import_cli_module("audio_formats").get_format(args.output_format)
+        player = import_cli_module("playback").StreamingPlayer(framerate=fmt.sample_rate, t0_monotonic=time.perf_counter())
+        meta = client.stream(args.say, player.feed, priority="interactive", output_format=args.output_format)
+        player.finish()
+        playback_meta = player.wait(timeout=60)
+    else:
+        meta, audio = client.synthesize(args.say, priority="interactive", audio=args.play, output_format=args.output_format)
+        if args.play and audio:
+            playback_meta = import_cli_module("playback").play_wav(audio, t0_monotonic=None, output_format=meta.get("output_format"))
+    line_parts = [
+        f"text={args.say}",
+        f"voice={args.voice}",
+        f"latency_ms={meta.get('latency_ms')}",
+        f"success={meta.get('success', False)}",
+        f"reason={meta.get('reason', '')}",
+        f"cached={meta.get('cached', False)}",
+        f"error={meta.get('error') or ''}",
+        f"daemon={args.daemon}",
+        f"audio_path={meta.get('audio_path') or ''}",
+        f"output_format={meta.get('output_format', '')}",
+        f"total_ms={meta.get('total_ms')}",
+    ]
+    if playback_meta is not None:
+        line_parts.extend([
+            f"playback_success={playback_meta.success}",
+            f"playback_reason={playback_meta.reason}",
+            f"playback_start_offset_ms={playback_meta.start_offset_ms}",
+            f"playback_streamed={playback_meta.streamed}",
+        ])
+    (OUTPUT_DIR / "synthesis-smoke.txt").write_text("\n".join(line_parts) + "\n", encoding="utf-8")
+    if events is not None:
+        events.log("say", **dict(part.split("=", 1) for part in line_parts))
+    print(
+        "SAY "
+        f"{'PASS' if meta.get('success') else 'FAIL'} | latency_ms={meta.get('latency_ms')} | total_ms={meta.get('total_ms')} | "
+        f"reason={meta.get('reason')} | daemon={args.daemon}"
+        + (" | cached" if meta.get("cached") else "")
+        + (f" | playback={playback_meta.reason}" if playback_meta else "")
+    )
+    return 0
+
+
+def write_trace_exports(exports) -> None:  # noqa: ANN001
+    for name, exporter, path, tracer in exports:
+        try:
+            exporter.write(tracer, path)
+            print(f"TRACE {name} written | path={path}")
+        except OSError as e:  # fail soft per FR-013
+            print(f"TRACE {name} FAIL | path={path} | {e}")
+
+
 def main(argv: list[str]) -> int:  # return code ignored (always 0 externally)
     args = parse_args(argv)
+    try:
+        exports = parse_trace_exports(args.trace_export)
+    except ValueError as e:
+        print(f"TRACE FAIL | {e}")
+        return 0
+    events = open_event_log(args.event_log)
+    try:
+        return run(args, events)
+    finally:
+        write_trace_exports(exports)
+        if events is not None:
+            events.close()
+
+
+def run(args: argparse.Namespace, events=None) -> int:  # noqa: ANN001
+    readiness = import_cli_module("readiness")
+    build_endpoint_pool = import_cli_module("endpoint_pool").build_endpoint_pool
+    hosts = readiness.split_hosts(args.host)
     if args.ping:
-        result = ping(args.host)
-        write_readiness_artifact(result, args.host)
-        ok, status, elapsed, message = result
-        # Print concise console output
-        print(f"Ping {'PASS' if ok else 'FAIL'} | status={status} | elapsed_ms={int(elapsed*1000)} | {message}")
+        results = [(readiness.ping(h), h) for h in hosts]
+        write_readiness_artifacts(results)
+        if events is not None:
+            for (ok, status, elapsed, message), h in results:
+                events.log("readiness", url=h, ok=ok, status=status, elapsed_ms=int(elapsed * 1000), message=message)
+        for (ok, status, elapsed, message), h in results:
+            # Print concise console output
+            suffix = f" | url={h}" if len(hosts) > 1 else ""
+            print(f"Ping {'PASS' if ok else 'FAIL'} | status={status} | elapsed_ms={int(elapsed*1000)} | {message}{suffix}")
         # Per FR-013 always exit 0
         return 0
+    if args.multi or args.say:
+        fmt = resolve_output_format(args)
+        if fmt is None:
+            return 0
+        args.output_format = fmt.name
+    if args.daemon and (args.multi or args.say):
+        if args.segment:
+            print("DAEMON FAIL | --segment runs in-process; drop --daemon to use it")
+            return 0
+        return run_daemon(args, events)
     if args.multi:
-        import importlib, pathlib
-        repo_root = pathlib.Path(__file__).resolve().parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-        qm_mod = importlib.import_module("cli.queue_manager")
-        synth_mod = importlib.import_module("cli.tts_synth")
-        manager = qm_mod.QueueManager(host=args.host, voice=args.voice, max_queue=args.max_queue)
+        qm_mod = import_cli_module("queue_manager")
+        synth_mod = import_cli_module("tts_synth")
+        ensure_dirs()
+        # queue.txt is streamed: each decision/result line is appended as it happens
+        evidence = import_cli_module("evidence")
+        queue_log = evidence.EventLog(OUTPUT_DIR / "queue.txt", formatter=queue_line, max_bytes=0, truncate=True)
+
+        def record(event: dict) -> None:
+            queue_log.write(event)
+            if events is not None:
+                events.write({"ts": evidence.utc_timestamp(), **event})
+
+        manager = qm_mod.QueueManager(
+            host=hosts[0], voice=args.voice, max_queue=args.max_queue, pool=build_endpoint_pool(hosts, args.lb_strategy),
+            max_concurrency=args.max_concurrency, output_format=args.output_format,
+            on_decision=lambda d: record(qm_mod.decision_event(d, args.max_queue)),
+            on_result=lambda r: record(qm_mod.result_event(r, args.max_queue)),
+        )
         decisions = []
+        if args.hint:
+            manager.hint(args.hint)
+        priority = qm_mod.PRIORITIES[args.priority]
+        deadline = args.deadline_ms / 1000.0 if args.deadline_ms is not None else None
         for txt in args.multi:
-            decisions.append(manager.submit(txt))
+            decisions.append(manager.submit(txt, priority=priority, deadline=deadline))
             # minimal delay to simulate rapid submissions (<2s apart)
             time.sleep(0.05)
         # Wait for all to finish (bounded)
         manager.wait_all(timeout=30)
-        ensure_dirs()
-        queue_artifact = OUTPUT_DIR / "queue.txt"
-        lines = []
-        for d in decisions:
-            lines.append(f"decision|{d.request_id}|{d.decision}|{int(d.timestamp*1000)}|{d.text}|max_queue={manager.max_queue}")
-        for r in manager.results:
-            lines.append(
-                "result|" +
-                f"{r.request_id}|{r.success}|{r.reason}|{r.latency_ms}|{int(r.started_monotonic*1000)}|{int(r.completed_monotonic*1000)}|{r.text}|max_queue={manager.max_queue}"
-            )
-        queue_artifact.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        queue_log.close()
         # Console summary
         active_started = sum(1 for d in decisions if d.decision == "ACTIVE_STARTED")
         queued = sum(1 for d in decisions if d.decision == "QUEUED")
         rejected = sum(1 for d in decisions if d.decision == "REJECTED_QUEUE_FULL")
-        print(f"MULTI complete | active_started={active_started} queued={queued} rejected={rejected} results={len(manager.results)} max_queue={manager.max_queue}")
+        dropped = len(manager.dropped)
+        cache = import_cli_module("tts_cache").get_default_cache()
+        cache_part = f" cache_hits={cache.hits} cache_misses={cache.misses}" if cache is not None else ""
+        print(f"MULTI complete | active_started={active_started} queued={queued} rejected={rejected} dropped={dropped} results={len(manager.results)} max_queue={manager.max_queue} max_concurrency={manager.max_concurrency} hints_completed={manager.hints_completed} hints_cancelled={manager.hints_cancelled}{cache_part}")
         return 0
     if args.say:
         # Lazy import to keep readiness fast
-        import importlib, pathlib
-        # Ensure repository root (parent of this file's directory) is on sys.path for package import
-        repo_root = pathlib.Path(__file__).resolve().parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-        tts_synth = importlib.import_module("cli.tts_synth")
-        synth_result = tts_synth.synthesize(args.say, host=args.host, voice=args.voice)
+        tts_synth = import_cli_module("tts_synth")
         playback_meta = None
-        if args.play and synth_result.audio_path:
-            playback = importlib.import_module("cli.playback")
-            playback_meta = playback.play_wav(synth_result.audio_path, t0_monotonic=None)
+        segment_count = None
+        if args.segment:
+            # Pipelined: sentence segments synthesized ahead while earlier ones play, one gapless stream/WAV
+            tts_segment = import_cli_module("tts_segment")
+            player = None
+            if args.play:
+                player = import_cli_module("playback").StreamingPlayer(framerate=fmt.sample_rate, t0_monotonic=time.perf_counter())
+            synth_result = tts_segment.synthesize_pipelined(
+                args.say, host=hosts[0], voice=args.voice, pool=build_endpoint_pool(hosts, args.lb_strategy),
+                lookahead=args.lookahead, on_audio_chunk=player.feed if player else None, in_memory=args.in_memory,
+                output_format=fmt.name,
+            )
+            if player is not None:
+                player.finish()
+                playback_meta = player.wait(timeout=300)
+            segment_count = len(synth_result.segments)
+        elif args.play and args.stream:
+            # Streaming: chunks go to the playback ring buffer as they are synthesized
+            playback = import_cli_module("playback")
+            player = playback.StreamingPlayer(framerate=fmt.sample_rate, t0_monotonic=time.perf_counter())
+            synth_result = tts_synth.synthesize(args.say, host=hosts[0], voice=args.voice, pool=build_endpoint_pool(hosts, args.lb_strategy), in_memory=args.in_memory, on_audio_chunk=player.feed, output_format=fmt.name)
+            player.finish()
+            playback_meta = player.wait(timeout=60)
+        else:
+            synth_result = tts_synth.synthesize(args.say, host=hosts[0], voice=args.voice, pool=build_endpoint_pool(hosts, args.lb_strategy), in_memory=args.in_memory, output_format=fmt.name)
+            audio_source = synth_result.audio_data if synth_result.audio_data is not None else synth_result.audio_path
+            if args.play and audio_source:
+                playback = import_cli_module("playback")
+                playback_meta = playback.play_wav(audio_source, t0_monotonic=None, output_format=synth_result.output_format)
         # Write evidence log alongside audio output under assets/output
         ensure_dirs()
         evidence_path = OUTPUT_DIR / "synthesis-smoke.txt"
@@ -153,10 +390,14 @@ def main(argv: list[str]) -> int:  # return code ignored (always 0 externally)
             f"latency_ms={synth_result.latency_ms}",
             f"success={synth_result.success}",
             f"reason={synth_result.reason}",
+            f"cached={synth_result.cached}",
             f"error={synth_result.error or ''}",
             f"host={synth_result.host}",
             f"audio_path={synth_result.audio_path or ''}",
+            f"output_format={getattr(synth_result, 'output_format', fmt.name)}",
         ]
+        if segment_count is not None:
+            line_parts.append(f"segments={segment_count}")
         if playback_meta is not None:
             line_parts.extend([
                 f"playback_played={playback_meta.played}",
@@ -166,13 +407,17 @@ def main(argv: list[str]) -> int:  # return code ignored (always 0 externally)
                 f"playback_start_offset_ms={playback_meta.start_offset_ms}",
                 f"playback_duration_seconds={playback_meta.duration_seconds}",
                 f"playback_error={playback_meta.error or ''}",
+                f"playback_streamed={playback_meta.streamed}",
             ])
         line = "\n".join(line_parts) + "\n"
         evidence_path.write_text(line, encoding="utf-8")
+        if events is not None:
+            events.log("say", **dict(part.split("=", 1) for part in line_parts))
         print(
             "SAY "
             f"{'PASS' if synth_result.success else 'FAIL'} | latency_ms={synth_result.latency_ms} | voice={synth_result.voice} | "
             f"reason={synth_result.reason}"
+            + (" | cached" if synth_result.cached else "")
             + (f" | playback={playback_meta.reason}" if playback_meta else "")
         )
         return 0
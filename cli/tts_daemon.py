@@ -0,0 +1,519 @@
+"""Resident TTS server (`python -m cli.tts_daemon`) and its client.
+
+Each `tts_cli --say` process pays interpreter start-up, the Speech SDK import,
+synthesizer creation and connection setup before any audio is rendered. The
+daemon pays those once: it keeps one `QueueManager` (pre-warmed synthesizer
+pool, audio cache, priority queue) alive and serves requests over localhost
+HTTP and/or a Unix socket, so a request costs synthesis time only.
+
+API (JSON in, JSON out unless noted):
+  GET  /ready        200 once the queue manager is up
+  GET  /status       queue, cache, synthesizer pool and request counters
+  GET  /metrics      per-stage histograms, Prometheus text (`--trace`)
+  POST /synthesize   {"text", "priority": "interactive|normal|bulk", "deadline_ms",
+                      "format", "save": true, "response": "json|wav|stream"}
+                      json   -> result metadata
+                      wav    -> audio body (Content-Type per `format`, default
+                                TTS_OUTPUT_FORMAT or PCM WAV), metadata JSON in
+                                `X-TTS-Result`
+                      stream -> frames as audio is synthesized (see below)
+  POST /hint         {"texts": [...]} pre-synthesize likely prompts while idle
+  POST /shutdown     finish active requests and exit
+
+Stream responses (`application/vnd.tts-stream`) are a sequence of frames:
+one kind byte (b"A" audio chunk, b"R" result JSON), a 4-byte big-endian length
+and the payload; the body ends with the R frame. A frames carry the chunks exactly
+as `synthesize(on_audio_chunk=...)` sees them (the first may start with a RIFF
+header), so they can go straight to `playback.StreamingPlayer.feed`.
+
+Rejected submissions answer 429 (queue full / stopping) or 400 (empty or
+malformed text, priority, format or deadline_ms);
+requests dropped before synthesis (deadline, preemption) answer 503. All
+carry the same metadata document. Decisions and results are appended to an
+`evidence.EventLog` (default assets/output/daemon_events.jsonl).
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from queue import Queue
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .audio_formats import get_format
+
+DEFAULT_LISTEN = os.getenv("TTS_DAEMON_LISTEN", "127.0.0.1:5080")
+DEFAULT_URL = os.getenv("TTS_DAEMON_URL", "http://127.0.0.1:5080")
+STREAM_CONTENT_TYPE = "application/vnd.tts-stream"
+FRAME_AUDIO = b"A"
+FRAME_RESULT = b"R"
+_FRAME_HEADER = struct.Struct(">cI")
+
+# HTTP status per queue decision that never produced audio
+_DECISION_STATUS = {
+    "REJECTED_EMPTY": 400,
+    "REJECTED_QUEUE_FULL": 429,
+    "REJECTED_STOPPED": 429,
+    "DROPPED_DEADLINE": 503,
+    "DROPPED_PREEMPTED": 503,
+}
+
+
+class TTSDaemon:
+    """Owns the long-lived QueueManager and the request bookkeeping behind the HTTP API."""
+
+    def __init__(
+        self,
+        host: str,
+        voice: str,
+        max_queue: int = 16,
+        max_concurrency: int = 2,
+        lb_strategy: str = "round_robin",
+        event_log: Optional[str] = None,
+    ):
+        # Heavy imports (Speech SDK) happen here, once, not in the client path
+        from . import evidence, readiness, tracing, tts_cache, tts_pool, tts_synth
+        from .endpoint_pool import build_endpoint_pool
+        from .queue_manager import PRIORITIES, QueueManager, decision_event, result_event
+
+        self._tts_synth = tts_synth
+        self._tts_cache = tts_cache
+        self._tts_pool = tts_pool
+        self._decision_event = decision_event
+        self._result_event = result_event
+        self._evidence = evidence
+        self._tracing = tracing
+        self._priorities = PRIORITIES
+        self.host = host
+        self.voice = voice
+        self._events = evidence.EventLog(event_log, fmt=evidence.format_for_path(event_log)) if event_log else None
+        hosts = readiness.split_hosts(host)
+        self.manager = QueueManager(
+            host=hosts[0], voice=voice, max_queue=max_queue, pool=build_endpoint_pool(hosts, lb_strategy),
+            in_memory=True, max_concurrency=max_concurrency, max_results=0,
+            on_decision=self._log_decision, on_result=self._log_result,
+        )
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.stopping = threading.Event()
+
+    def _log_decision(self, decision) -> None:  # noqa: ANN001
+        if self._events is not None:
+            self._events.write({"ts": self._evidence.utc_timestamp(), **self._decision_event(decision, self.manager.max_queue)})
+
+    def _log_result(self, result) -> None:  # noqa: ANN001
+        if self._events is not None:
+            self._events.write({"ts": self._evidence.utc_timestamp(), **self._result_event(result, self.manager.max_queue)})
+
+    def submit(self, request: dict, on_audio_chunk: Optional[Callable[[bytes], None]] = None) -> Tuple[int, dict, Optional[bytes]]:
+        """Run one /synthesize request to completion: (HTTP status, metadata, audio bytes)."""
+        text = request.get("text") or ""
+        if not isinstance(text, str):
+            return 400, {"error": "text must be a string"}, None
+        priority_name = str(request.get("priority") or "normal")
+        if priority_name not in self._priorities:
+            return 400, {"error": f"priority must be one of {', '.join(self._priorities)}"}, None
+        try:
+            fmt = get_format(request.get("format"))
+        except ValueError as e:
+            return 400, {"error": str(e)}, None
+        deadline_ms = request.get("deadline_ms")
+        if deadline_ms is not None and (isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) or not 0 <= deadline_ms < float("inf")):
+            return 400, {"error": "deadline_ms must be a non-negative number"}, None
+        submitted = time.perf_counter()
+        decision = self.manager.submit(
+            text, priority=self._priorities[priority_name],
+            deadline=None if deadline_ms is None else float(deadline_ms) / 1000.0,
+            on_audio_chunk=on_audio_chunk, output_format=fmt.name,
+        )
+        meta: Dict[str, object] = {
+            "request_id": decision.request_id, "decision": decision.decision, "priority": priority_name,
+            "text": decision.text, "output_format": fmt.name,
+        }
+        with self._lock:
+            self.requests += 1
+        if decision.future is None:
+            with self._lock:
+                self.failed += 1
+            return _DECISION_STATUS.get(decision.decision, 500), {**meta, "success": False, "reason": decision.decision}, None
+        try:
+            result = decision.future.result()
+        except CancelledError:
+            with self._lock:
+                self.failed += 1
+            return 429, {**meta, "success": False, "reason": "REJECTED_STOPPED", "error": "Daemon stopping"}, None
+        audio_path = None
+        if result.success and result.audio_data and request.get("save", True) and not result.cached:
+            audio_path = self._save(result.audio_data, fmt.extension)
+        meta.update(
+            success=result.success, reason=result.reason, error=result.error, latency_ms=result.latency_ms, cached=result.cached,
+            audio_path=audio_path or (result.audio_path if result.cached else None),
+            audio_bytes=len(result.audio_data or b""),
+            queue_ms=round((result.started_monotonic - submitted) * 1000, 1),
+            synth_ms=round((result.completed_monotonic - result.started_monotonic) * 1000, 1),
+            total_ms=round((time.perf_counter() - submitted) * 1000, 1),
+        )
+        with self._lock:
+            if result.success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+        status = 200 if result.success else _DECISION_STATUS.get(result.reason, 502)
+        return status, meta, result.audio_data
+
+    def _save(self, audio: bytes, extension: str = ".wav") -> Optional[str]:
+        try:
+            self._tts_synth.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+            path = self._tts_synth.reserve_output_path(extension=extension)
+            Path(path).write_bytes(audio)
+            return path
+        except OSError:
+            return None
+
+    def status(self) -> dict:
+        cache = self._tts_cache.get_default_cache()
+        synth_pool = self._tts_pool.get_default_pool()
+        with self._lock:
+            counters = {"requests": self.requests, "succeeded": self.succeeded, "failed": self.failed}
+        return {
+            "host": self.host,
+            "voice": self.voice,
+            "uptime_s": round(time.time() - self.started, 1),
+            **counters,
+            "active": self.manager.active_count,
+            "queued": self.manager.pending_queue_length,
+            "max_queue": self.manager.max_queue,
+            "max_concurrency": self.manager.max_concurrency,
+            "hints_completed": self.manager.hints_completed,
+            "hints_cancelled": self.manager.hints_cancelled,
+            "cache": None if cache is None else cache.stats(),
+            "synthesizer_pool": None if synth_pool is None else {"created": synth_pool.created, "reused": synth_pool.reused, "evicted": synth_pool.evicted, "idle": synth_pool.idle_count()},
+        }
+
+    def metrics(self) -> str:
+        return self._tracing.PrometheusExporter().render(self._tracing.get_default_tracer())
+
+    def hint(self, texts: List[str]) -> int:
+        return self.manager.hint(texts)
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Stop accepting work, let active requests finish, flush evidence."""
+        self.manager.stop()
+        self.manager.wait_all(timeout=timeout)
+        if self._events is not None:
+            self._events.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "tts-daemon"
+    daemon: TTSDaemon  # set on the server-specific subclass
+
+    def address_string(self) -> str:
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        if os.getenv("TTS_DAEMON_VERBOSE"):
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status: int, payload: dict) -> None:
+        self._send(status, (json.dumps(payload) + "\n").encode("utf-8"), "application/json")
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        payload = json.loads(self.rfile.read(length))
+        if not isinstance(payload, dict):
+            raise ValueError("request body must be a JSON object")
+        return payload
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/ready":
+            ready = not self.daemon.stopping.is_set()
+            self._json(200 if ready else 503, {"ready": ready})
+        elif path == "/status":
+            self._json(200, self.daemon.status())
+        elif path == "/metrics":
+            self._send(200, self.daemon.metrics().encode("utf-8"), "text/plain; version=0.0.4")
+        else:
+            self._json(404, {"error": f"no route for GET {path or '/'}"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+        try:
+            request = self._body()
+        except ValueError as e:
+            self._json(400, {"error": f"invalid JSON body: {e}"})
+            return
+        if path == "/synthesize":
+            mode = request.get("response", "json")
+            if mode == "stream":
+                self._stream(request)
+                return
+            if mode not in ("json", "wav"):
+                self._json(400, {"error": "response must be json, wav or stream"})
+                return
+            status, meta, audio = self.daemon.submit(request)
+            if mode == "wav" and status == 200 and audio:
+                self._send(200, audio, get_format(meta["output_format"]).mime_type, {"X-TTS-Result": json.dumps(meta)})
+            else:
+                self._json(status, meta)
+        elif path == "/hint":
+            texts = request.get("texts") or []
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                self._json(400, {"error": "texts must be a list of strings"})
+                return
+            self._json(200, {"accepted": self.daemon.hint(texts)})
+        elif path == "/shutdown":
+            self._json(202, {"stopping": True})
+            self.daemon.stopping.set()
+        else:
+            self._json(404, {"error": f"no route for POST {path or '/'}"})
+
+    def _stream(self, request: dict) -> None:
+        """Write audio frames while the request synthesizes, then the result frame."""
+        self.send_response(200)
+        self.send_header("Content-Type", STREAM_CONTENT_TYPE)
+        self.send_header("Connection", "close")  # body ends when the connection closes
+        self.end_headers()
+        self.close_connection = True
+        chunks: "Queue[Optional[bytes]]" = Queue()
+        outcome: List[Tuple[int, dict, Optional[bytes]]] = []
+
+        def run() -> None:
+            try:
+                outcome.append(self.daemon.submit(request, on_audio_chunk=lambda chunk: chunks.put(bytes(chunk))))
+            finally:
+                chunks.put(None)
+
+        worker = threading.Thread(target=run, name="tts-daemon-stream", daemon=True)
+        worker.start()
+        try:
+            while (chunk := chunks.get()) is not None:
+                self.wfile.write(_FRAME_HEADER.pack(FRAME_AUDIO, len(chunk)) + chunk)
+                self.wfile.flush()
+            worker.join()
+            status, meta, _audio = outcome[0] if outcome else (500, {"success": False, "reason": "EXCEPTION"}, None)
+            body = json.dumps({**meta, "status": status}).encode("utf-8")
+            self.wfile.write(_FRAME_HEADER.pack(FRAME_RESULT, len(body)) + body)
+            self.wfile.flush()
+        except OSError:  # client went away; the request still completes in the queue
+            pass
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _bind_handler(daemon: TTSDaemon) -> type:
+    return type("DaemonHandler", (_Handler,), {"daemon": daemon})
+
+
+def _remove_socket(path: str) -> None:
+    """Unlink `path` if it is a socket; refuse (FileExistsError) to remove anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket; refusing to replace it")
+    os.unlink(path)
+
+
+def serve(daemon: TTSDaemon, listen: Optional[str], unix_path: Optional[str]) -> None:
+    """Serve until SIGINT/SIGTERM or POST /shutdown, then drain and close."""
+    handler = _bind_handler(daemon)
+    servers = []
+    if unix_path:
+        _remove_socket(unix_path)  # stale socket from an earlier run
+    try:
+        if listen:
+            bind_host, _, port = listen.rpartition(":")
+            servers.append(_TCPServer((bind_host or "127.0.0.1", int(port)), handler))
+        if unix_path:
+            servers.append(_UnixServer(unix_path, handler))
+    except BaseException:
+        for s in servers:  # e.g. the TCP port bound but the Unix socket did not
+            s.server_close()
+        raise
+    threads = [threading.Thread(target=s.serve_forever, name="tts-daemon-http", daemon=True) for s in servers]
+    for t in threads:
+        t.start()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: daemon.stopping.set())
+    try:
+        daemon.stopping.wait()
+    finally:
+        for s in servers:
+            s.shutdown()
+            s.server_close()
+        daemon.close()
+        if unix_path:
+            try:
+                _remove_socket(unix_path)
+            except OSError:
+                pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class DaemonClient:
+    """Standard-library client (no SDK import) for `http://host:port` or `unix:///path.sock`."""
+
+    def __init__(self, url: str = DEFAULT_URL, timeout: float = 120.0):
+        self.url = url
+        self.timeout = timeout
+        parsed = urlparse(url)
+        if parsed.scheme == "unix":
+            self._connect = lambda: _UnixHTTPConnection(parsed.path, timeout)
+        elif parsed.scheme == "http":
+            self._connect = lambda: http.client.HTTPConnection(parsed.hostname or "127.0.0.1", parsed.port or 80, timeout=timeout)
+        else:
+            raise ValueError(f"daemon URL must be http://host:port or unix:///path (got {url})")
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        conn = self._connect()
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        conn.request(method, path, body=body, headers={"Content-Type": "application/json"} if body else {})
+        return conn, conn.getresponse()
+
+    def _json(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        conn, resp = self._request(method, path, payload)
+        try:
+            return json.loads(resp.read() or b"{}")
+        finally:
+            conn.close()
+
+    def ready(self) -> bool:
+        try:
+            return bool(self._json("GET", "/ready").get("ready"))
+        except (OSError, ValueError, http.client.HTTPException):
+            return False
+
+    def status(self) -> dict:
+        return self._json("GET", "/status")
+
+    def hint(self, texts: List[str]) -> int:
+        return int(self._json("POST", "/hint", {"texts": list(texts)}).get("accepted", 0))
+
+    def shutdown(self) -> dict:
+        return self._json("POST", "/shutdown", {})
+
+    def synthesize(
+        self, text: str, priority: str = "normal", deadline_ms: Optional[int] = None, save: bool = True, audio: bool = False,
+        output_format: Optional[str] = None,
+    ) -> Tuple[dict, Optional[bytes]]:
+        """(metadata, audio bytes when `audio` and successful); `output_format` None uses the daemon's default."""
+        request = {"text": text, "priority": priority, "deadline_ms": deadline_ms, "format": output_format, "save": save, "response": "wav" if audio else "json"}
+        conn, resp = self._request("POST", "/synthesize", request)
+        try:
+            body = resp.read()
+            if resp.getheader("Content-Type", "").startswith("audio/"):
+                return json.loads(resp.getheader("X-TTS-Result") or "{}"), body
+            return json.loads(body or b"{}"), None
+        finally:
+            conn.close()
+
+    def stream(
+        self, text: str, on_audio_chunk: Callable[[bytes], None], priority: str = "normal", deadline_ms: Optional[int] = None,
+        save: bool = True, output_format: Optional[str] = None,
+    ) -> dict:
+        """Feed audio chunks to `on_audio_chunk` as the daemon synthesizes; returns the metadata."""
+        request = {"text": text, "priority": priority, "deadline_ms": deadline_ms, "format": output_format, "save": save, "response": "stream"}
+        conn, resp = self._request("POST", "/synthesize", request)
+        try:
+            while True:
+                header = resp.read(_FRAME_HEADER.size)
+                if len(header) < _FRAME_HEADER.size:
+                    return {"success": False, "reason": "STREAM_TRUNCATED", "error": "Daemon closed the stream early"}
+                kind, length = _FRAME_HEADER.unpack(header)
+                payload = resp.read(length)
+                if kind == FRAME_AUDIO:
+                    on_audio_chunk(payload)
+                else:
+                    return json.loads(payload)
+        finally:
+            conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m cli.tts_daemon", description="Resident TTS server keeping the queue, synthesizer pool and cache warm")
+    p.add_argument("--listen", default=DEFAULT_LISTEN, help="HOST:PORT for HTTP ('' disables). Default env TTS_DAEMON_LISTEN or 127.0.0.1:5080")
+    p.add_argument("--unix", default=os.getenv("TTS_DAEMON_SOCKET"), help="Also serve on this Unix socket path (default env TTS_DAEMON_SOCKET)")
+    p.add_argument("--host", default=os.getenv("TTS_HOST_URL", "http://localhost:5001"), help="TTS container(s), comma-separated (default env TTS_HOST_URL)")
+    p.add_argument("--voice", default=os.getenv("VOICE_NAME", "en-US-JennyNeural"))
+    p.add_argument("--lb-strategy", choices=["round_robin", "least_outstanding"], default=os.getenv("TTS_LB_STRATEGY", "round_robin"))
+    p.add_argument("--max-queue", type=int, default=16, help="Queued requests beyond the active ones. Default 16.")
+    p.add_argument("--max-concurrency", type=int, default=int(os.getenv("TTS_MAX_CONCURRENCY", "2")), help="Syntheses run at once. Default env TTS_MAX_CONCURRENCY or 2.")
+    p.add_argument("--event-log", default=os.getenv("TTS_DAEMON_EVENT_LOG", "assets/output/daemon_events.jsonl"), help="Append-only decision/result log ('off' disables)")
+    p.add_argument("--trace", action="store_true", help="Record per-stage spans; served as Prometheus text on GET /metrics")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.listen and not args.unix:
+        p.error("nothing to serve: give --listen and/or --unix")
+    event_log = None if args.event_log.lower() in ("", "off", "0", "none") else args.event_log
+    try:
+        daemon = TTSDaemon(args.host, args.voice, max_queue=args.max_queue, max_concurrency=args.max_concurrency, lb_strategy=args.lb_strategy, event_log=event_log)
+    except (ValueError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    if args.trace:
+        daemon._tracing.enable_default_tracer()
+    where = " and ".join(x for x in (f"http://{args.listen}" if args.listen else "", f"unix://{args.unix}" if args.unix else "") if x)
+    print(f"TTS daemon on {where} | host={args.host} voice={args.voice} max_concurrency={args.max_concurrency} max_queue={args.max_queue}", flush=True)
+    try:
+        serve(daemon, args.listen, args.unix)
+    except OSError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        daemon.close()
+        return 1
+    print(f"TTS daemon stopped | {json.dumps(daemon.status())}")
+    return 0
+
+
+__all__ = ["DaemonClient", "TTSDaemon", "serve"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
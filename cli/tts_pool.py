@@ -0,0 +1,213 @@
+"""Persistent SpeechSynthesizer pool (connection reuse) for NearRealTimeText2Speech.
+
+`tts_synth.synthesize` used to build a SpeechConfig and a SpeechSynthesizer per
+phrase, paying connection setup to the container every time. This pool keeps
+long-lived synthesizers keyed by (host, voice, output format), optionally pre-warmed with
+`Connection.open`, so a phrase only pays for synthesis itself.
+
+Policy:
+  - `size` idle synthesizers are kept per key; extra concurrent demand
+    creates overflow synthesizers that are closed on release.
+  - Synthesizers idle longer than `idle_timeout` seconds are evicted lazily on
+    the next acquire/release (no background thread).
+  - A synthesizer released as unhealthy (container connection failure) is
+    closed instead of being reused.
+
+Pooled synthesizers output to memory (`audio_config=None`); the caller owns
+writing `result.audio_data` wherever it needs it.
+
+Environment overrides for the shared default pool:
+  TTS_SYNTH_POOL_SIZE          idle synthesizers kept per (host, voice, format); 0 disables pooling (default 2)
+  TTS_SYNTH_POOL_IDLE_SECONDS  idle eviction timeout (default 300)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import tracing
+from .audio_formats import get_format
+from .tts_synth import build_speech_config, speechsdk
+
+PoolKey = Tuple[str, str, str]  # (host, voice, output format wire name)
+
+
+class PooledSynthesizer:
+    """One long-lived synthesizer plus per-call event dispatch.
+
+    SDK event handlers cannot be removed individually, so they are connected
+    once and forward to callbacks that the current caller sets per request.
+    """
+
+    def __init__(self, host: str, voice: str, output_format: Optional[str] = None):
+        if speechsdk is None:
+            raise RuntimeError("azure.cognitiveservices.speech not installed")
+        self.key: PoolKey = (host, voice, get_format(output_format).name)
+        with tracing.get_default_tracer().span("tts.synthesizer_create", host=host, voice=voice):
+            self.synthesizer = speechsdk.SpeechSynthesizer(speech_config=build_speech_config(host, voice, self.key[2]), audio_config=None)
+        self.connection = None
+        self.last_used = time.perf_counter()
+        self.first_audio_time: Optional[float] = None
+        self.on_synthesizing: Optional[Callable[[object], None]] = None
+        self.on_completed: Optional[Callable[[object], None]] = None
+        self.on_canceled: Optional[Callable[[object], None]] = None
+        self.synthesizer.synthesizing.connect(self._synthesizing)
+        self.synthesizer.synthesis_completed.connect(lambda evt: self._dispatch(self.on_completed, evt))
+        self.synthesizer.synthesis_canceled.connect(lambda evt: self._dispatch(self.on_canceled, evt))
+
+    def _synthesizing(self, evt) -> None:  # noqa: ANN001
+        if self.first_audio_time is None:
+            self.first_audio_time = time.perf_counter()
+        callback = self.on_synthesizing
+        if callback is not None:
+            callback(evt)
+
+    @staticmethod
+    def _dispatch(callback: Optional[Callable[[object], None]], evt) -> None:  # noqa: ANN001
+        if callback is not None:
+            callback(evt)
+
+    def begin_call(self) -> None:
+        """Reset per-call state before a new speak request."""
+        self.first_audio_time = None
+        self.on_synthesizing = None
+        self.on_completed = None
+        self.on_canceled = None
+
+    def prewarm(self) -> None:
+        """Open the container connection ahead of the first request."""
+        try:
+            with tracing.get_default_tracer().span("tts.connection_open", host=self.key[0]):
+                self.connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+                self.connection.open(True)
+        except Exception:  # warmup is best effort; first request will connect
+            self.connection = None
+
+    def close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+
+
+class SynthesizerPool:
+    def __init__(self, size: int = 2, idle_timeout: float = 300.0, prewarm: bool = True):
+        """Initialize synthesizer pool.
+
+        Args:
+            size: Idle synthesizers kept per (host, voice, format). Must be >= 1.
+            idle_timeout: Seconds after which an idle synthesizer is evicted.
+            prewarm: Open the container connection when a synthesizer is created.
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._prewarm = prewarm
+        self._lock = threading.Lock()
+        self._idle: Dict[PoolKey, List[PooledSynthesizer]] = {}
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def _create(self, host: str, voice: str, output_format: Optional[str] = None) -> PooledSynthesizer:
+        entry = PooledSynthesizer(host, voice, output_format)
+        if self._prewarm:
+            entry.prewarm()
+        with self._lock:
+            self.created += 1
+        return entry
+
+    def acquire(self, host: str, voice: str, output_format: Optional[str] = None) -> PooledSynthesizer:
+        """Take an idle synthesizer for (host, voice, format), creating one if none is idle."""
+        self.evict_idle()
+        with self._lock:
+            idle = self._idle.get((host, voice, get_format(output_format).name))
+            if idle:
+                self.reused += 1
+                entry = idle.pop()  # most recently used: connection most likely still open
+                entry.begin_call()
+                return entry
+        return self._create(host, voice, output_format)
+
+    def release(self, entry: PooledSynthesizer, healthy: bool = True) -> None:
+        """Return a synthesizer; unhealthy or surplus ones are closed."""
+        entry.begin_call()
+        entry.last_used = time.perf_counter()
+        with self._lock:
+            idle = self._idle.setdefault(entry.key, [])
+            keep = healthy and len(idle) < self._size
+            if keep:
+                idle.append(entry)
+        if not keep:
+            entry.close()
+        self.evict_idle()
+
+    @contextmanager
+    def lease(self, host: str, voice: str, output_format: Optional[str] = None) -> Iterator[PooledSynthesizer]:
+        entry = self.acquire(host, voice, output_format)
+        healthy = False
+        try:
+            yield entry
+            healthy = True
+        finally:
+            self.release(entry, healthy=healthy)
+
+    def warm(self, host: str, voice: str, count: int = 1, output_format: Optional[str] = None) -> None:
+        """Pre-create up to `count` idle, connected synthesizers for (host, voice, format)."""
+        with self._lock:
+            missing = min(count, self._size) - len(self._idle.get((host, voice, get_format(output_format).name), []))
+        for _ in range(max(0, missing)):
+            self.release(self._create(host, voice, output_format))
+
+    def evict_idle(self) -> int:
+        now = time.perf_counter()
+        expired: List[PooledSynthesizer] = []
+        with self._lock:
+            for key, idle in self._idle.items():
+                fresh = [e for e in idle if now - e.last_used <= self._idle_timeout]
+                expired.extend(e for e in idle if now - e.last_used > self._idle_timeout)
+                self._idle[key] = fresh
+            self.evicted += len(expired)
+        for entry in expired:
+            entry.close()
+        return len(expired)
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._idle.values())
+
+    def close(self) -> None:
+        with self._lock:
+            entries = [e for idle in self._idle.values() for e in idle]
+            self._idle.clear()
+        for entry in entries:
+            entry.close()
+
+
+_default_pool: Optional[SynthesizerPool] = None
+_default_lock = threading.Lock()
+
+
+def get_default_pool() -> Optional[SynthesizerPool]:
+    """Shared process-wide pool, or None when TTS_SYNTH_POOL_SIZE=0."""
+    global _default_pool
+    size = int(os.getenv("TTS_SYNTH_POOL_SIZE", "2"))
+    if size <= 0:
+        return None
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = SynthesizerPool(
+                size=size,
+                idle_timeout=float(os.getenv("TTS_SYNTH_POOL_IDLE_SECONDS", "300")),
+            )
+        return _default_pool
+
+
+__all__ = ["PooledSynthesizer", "SynthesizerPool", "get_default_pool"]
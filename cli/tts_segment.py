@@ -0,0 +1,226 @@
+"""Sentence-level text segmentation and pipelined synthesis for long inputs.
+
+A paragraph sent as one request only starts speaking once the container has
+rendered its first audio, which grows with input length. Here the text is split
+at sentence, then clause, boundaries (the first segment kept deliberately
+short) and the segments are synthesized in a pipeline: while segment N is being
+delivered/played, segments N+1..N+lookahead are already being synthesized on
+worker threads. Segment PCM is emitted back to back in order, so the result is
+one gapless stream (e.g. `StreamingPlayer.feed`) and optionally one WAV,
+assembled the same way `scripts/measure_latency.sh` concatenates frames.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import time
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from . import tts_synth, wav_utils
+from .audio_formats import DEFAULT_FORMAT_NAME, get_format
+from .tts_synth import SynthesisResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .endpoint_pool import EndpointPool
+
+MAX_SEGMENT_CHARS = 220  # longer sentences are split at clauses, then words
+FIRST_SEGMENT_CHARS = 80  # short head segment: time to first audio of a short phrase
+LOOKAHEAD = 2  # segments synthesized ahead of the one being delivered
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|(?<=[.!?…][\"')\]])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:—])\s+")
+_WORD_GAP = re.compile(r"\s+")
+
+
+def _wrap(text: str, limit: int, pattern: "re.Pattern[str]") -> List[str]:
+    """Greedily pack pieces split by `pattern` into segments of at most `limit` chars."""
+    out: List[str] = []
+    current = ""
+    for piece in (p for p in pattern.split(text) if p):
+        candidate = f"{current} {piece}" if current else piece
+        if len(candidate) <= limit:
+            current = candidate
+            continue
+        if current:
+            out.append(current)
+        current = piece
+    if current:
+        out.append(current)
+    return out
+
+
+def _split_long(sentence: str, limit: int) -> List[str]:
+    """Split at clause punctuation, then between words, into pieces of at most `limit` chars."""
+    out: List[str] = []
+    for clause in _wrap(sentence, limit, _CLAUSE_END):
+        out.extend(_wrap(clause, limit, _WORD_GAP) if len(clause) > limit else [clause])
+    return out
+
+
+def split_text(text: str, max_chars: int = MAX_SEGMENT_CHARS, first_max_chars: int = FIRST_SEGMENT_CHARS) -> List[str]:
+    """Split `text` into speakable segments at sentence and clause boundaries.
+
+    Sentences are kept whole when they fit `max_chars`; longer ones are split
+    at clause punctuation, then between words. The first segment is limited to
+    `first_max_chars` (at a clause or word boundary) so synthesis of the head
+    returns quickly.
+    """
+    if max_chars <= 0 or first_max_chars <= 0:
+        raise ValueError("segment limits must be > 0")
+    text = " ".join(text.split())
+    if not text:
+        return []
+    segments: List[str] = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if not segments and len(sentence) > first_max_chars:
+            head = _split_long(sentence, first_max_chars)[0]
+            segments.append(head)
+            sentence = sentence[len(head):].strip()
+            if not sentence:
+                continue
+        segments.extend(_split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence])
+    return segments
+
+
+@dataclass
+class PipelineResult:
+    text: str
+    success: bool
+    reason: str
+    latency_ms: Optional[int]  # pipeline start -> first audio of the first segment
+    segments: List[SynthesisResult] = field(default_factory=list)
+    audio_path: Optional[str] = None  # combined WAV (if written)
+    audio_data: Optional[bytes] = None  # combined WAV (in_memory)
+    error: Optional[str] = None
+    voice: str = tts_synth.DEFAULT_VOICE
+    host: str = tts_synth.DEFAULT_HOST
+    cached: bool = False  # every segment came from the audio cache
+    frames: int = 0
+    segment_index: List[dict] = field(default_factory=list)  # {text, start_frame, end_frame, cached}
+    output_format: str = DEFAULT_FORMAT_NAME
+
+
+def synthesize_pipelined(
+    text: str,
+    host: Optional[str] = None,
+    voice: Optional[str] = None,
+    pool: Optional["EndpointPool"] = None,
+    lookahead: int = LOOKAHEAD,
+    on_audio_chunk: Optional[Callable[[bytes], None]] = None,
+    in_memory: bool = False,
+    write_wav: bool = True,
+    max_chars: int = MAX_SEGMENT_CHARS,
+    first_max_chars: int = FIRST_SEGMENT_CHARS,
+    output_format: Optional[str] = None,
+) -> PipelineResult:
+    """Synthesize long `text` segment by segment with `lookahead` segments in flight.
+
+    `on_audio_chunk` receives one continuous stream: the head segment's chunks
+    as the container streams them (the first carrying the RIFF header), then
+    each following segment's PCM as soon as it and all earlier ones are ready.
+    With `write_wav` the combined audio is written to a new `tts_<ts>.wav`
+    (or returned in `audio_data` when `in_memory`).
+    `output_format` must be a RIFF PCM `audio_formats` entry (segments are
+    stitched as WAV frames); other formats raise ValueError.
+    """
+    fmt = get_format(output_format)
+    if fmt.container != "riff":
+        raise ValueError(f"pipelined synthesis stitches PCM WAV segments; {fmt.name} is not supported")
+    segments = split_text(text, max_chars, first_max_chars)
+    if not segments:
+        return PipelineResult(text=text, success=False, reason="EMPTY", latency_ms=None, error="Empty text", output_format=fmt.name)
+    if lookahead < 0:
+        raise ValueError("lookahead must be >= 0")
+
+    start = time.perf_counter()
+    results: List[SynthesisResult] = []
+    pcm_parts: List[memoryview] = []
+    info: Optional[wav_utils.WavInfo] = None
+    segment_index: List[dict] = []
+    frames = 0
+    failure: Optional[SynthesisResult] = None
+
+    def run(i: int) -> SynthesisResult:
+        # Only the head segment streams chunk by chunk; later ones are emitted whole, in order
+        chunk_sink = on_audio_chunk if i == 0 else None
+        return tts_synth.synthesize(segments[i], host=host, voice=voice, pool=pool, in_memory=True, on_audio_chunk=chunk_sink, output_format=fmt.name)
+
+    with ThreadPoolExecutor(max_workers=lookahead + 1, thread_name_prefix="tts-segment") as executor:
+        pending: Dict[int, Future] = {}
+        for i in range(len(segments)):
+            for j in range(i, min(len(segments), i + lookahead + 1)):
+                if j not in pending:
+                    pending[j] = executor.submit(run, j)
+            result = pending.pop(i).result()
+            results.append(result)
+            if not result.success or not result.audio_data:
+                failure = result
+                break
+            try:
+                seg_info = wav_utils.parse_wav_header(result.audio_data)
+            except ValueError as e:
+                failure = SynthesisResult(text=result.text, success=False, reason="INVALID_WAV", latency_ms=result.latency_ms, error=str(e), voice=result.voice, host=result.host)
+                break
+            if info is None:
+                info = seg_info
+            elif (seg_info.channels, seg_info.sampwidth, seg_info.framerate) != (info.channels, info.sampwidth, info.framerate):
+                failure = SynthesisResult(text=result.text, success=False, reason="FORMAT_MISMATCH", latency_ms=result.latency_ms, error="Segment audio format differs", voice=result.voice, host=result.host)
+                break
+            pcm = wav_utils.pcm_view(result.audio_data, seg_info)
+            if i > 0 and on_audio_chunk is not None:
+                on_audio_chunk(pcm)
+            pcm_parts.append(pcm)
+            segment_index.append({"text": result.text, "start_frame": frames, "end_frame": frames + seg_info.nframes, "cached": result.cached})
+            frames += seg_info.nframes
+        for fut in pending.values():
+            fut.cancel()
+
+    head = results[0]
+    latency_ms = None
+    if head.first_audio_monotonic is not None:
+        latency_ms = int((head.first_audio_monotonic - start) * 1000)
+
+    audio_path = None
+    audio_data = None
+    if write_wav and info is not None and failure is None:
+        if in_memory:
+            audio_data = _build_wav(info, pcm_parts)
+        else:
+            tts_synth.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+            audio_path = tts_synth.reserve_output_path()
+            with closing(wave.open(audio_path, "wb")) as wf:
+                _write_frames(wf, info, pcm_parts)
+
+    common = dict(
+        text=text, latency_ms=latency_ms, segments=results, voice=head.voice, host=head.host,
+        cached=all(r.cached for r in results), frames=frames, segment_index=segment_index, output_format=fmt.name,
+    )
+    if failure is not None:
+        return PipelineResult(success=False, reason=failure.reason, error=f"segment {len(results)}/{len(segments)}: {failure.error}", **common)
+    return PipelineResult(success=True, reason="OK", audio_path=audio_path, audio_data=audio_data, **common)
+
+
+def _write_frames(wf, info: wav_utils.WavInfo, pcm_parts: List[memoryview]) -> None:  # noqa: ANN001
+    wf.setnchannels(info.channels)
+    wf.setsampwidth(info.sampwidth)
+    wf.setframerate(info.framerate)
+    for pcm in pcm_parts:
+        wf.writeframes(pcm)
+
+
+def _build_wav(info: wav_utils.WavInfo, pcm_parts: List[memoryview]) -> bytes:
+    buf = io.BytesIO()
+    with closing(wave.open(buf, "wb")) as wf:
+        _write_frames(wf, info, pcm_parts)
+    return buf.getvalue()
+
+
+__all__ = ["PipelineResult", "split_text", "synthesize_pipelined"]
@@ -6,10 +6,16 @@ Centralized artifacts: all synthesized audio files and evidence reside under
 Provides a thin wrapper around Azure Speech SDK for neural text-to-speech
 targeting a locally running container. Supports host override and voice
 configuration. Returns latency to first audio chunk (approx) using event hooks.
+Synthesizers come from a reusable pool (`tts_pool`) so each phrase skips
+connection setup. Stages (config build, first/last byte, file write) are
+recorded as spans on the shared `tracing` tracer when tracing is enabled.
+`output_format` selects any `audio_formats` entry per request (compressed
+Opus/MP3 or raw PCM at other rates); it is part of the synthesizer pool key,
+the cache key and the output file extension.
 
 Functional mapping:
   FR-010 Default neural English voice selection
-  FR-011 Output must be PCM 16-bit 16 kHz (container voice streams this; we assert expected format metadata where available)
+  FR-011 Output must be PCM 16-bit 16 kHz by default (container voice streams this; we assert expected format metadata where available)
 
 NOTE: This is an initial skeleton. Playback and streaming chunk timestamp capture (FR-014) will be layered later.
 """
@@ -17,16 +23,26 @@ NOTE: This is an initial skeleton. Playback and streaming chunk timestamp captur
 from __future__ import annotations
 
 import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
 try:
     import azure.cognitiveservices.speech as speechsdk  # type: ignore
 except ImportError:  # defer hard dependency failure; higher layer will warn
     speechsdk = None  # type: ignore
 
+from . import tracing
+from .audio_formats import DEFAULT_FORMAT_NAME, AudioFormat, get_format
+from .endpoint_pool import is_connection_failure
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .endpoint_pool import EndpointPool
+    from .tts_cache import AudioCache
+    from .tts_pool import PooledSynthesizer, SynthesizerPool
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 OUTPUT_DIR = REPO_ROOT / "assets" / "output"  # Single centralized output directory
@@ -44,69 +60,270 @@ class SynthesisResult:
     error: Optional[str] = None
     voice: str = DEFAULT_VOICE
     host: str = DEFAULT_HOST
-    audio_path: Optional[str] = None  # path to synthesized wav (if produced)
+    audio_path: Optional[str] = None  # path to synthesized audio (if produced)
     start_monotonic: Optional[float] = None  # perf_counter() at synthesis start
     first_audio_monotonic: Optional[float] = None  # perf_counter() at first audio chunk
+    cached: bool = False  # served from tts_cache without contacting the container
+    audio_data: Optional[bytes] = None  # whole WAV in memory (in_memory=True mode)
+    output_format: str = DEFAULT_FORMAT_NAME  # audio_formats wire name of audio_path / audio_data
+
+
+class SynthesisHandle:
+    """Lets another thread stop an in-flight `synthesize` call (result reason CANCELED)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry: Optional["PooledSynthesizer"] = None
+        self.cancelled = False
+
+    def _attach(self, entry: "PooledSynthesizer") -> bool:
+        with self._lock:
+            self._entry = None if self.cancelled else entry
+            return not self.cancelled
 
+    def _detach(self) -> None:
+        with self._lock:
+            self._entry = None
 
-def build_speech_config(host: str, voice: str):
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            entry = self._entry
+        if entry is not None:
+            try:
+                entry.synthesizer.stop_speaking_async()
+            except Exception:  # already finished or connection gone
+                pass
+
+
+def build_speech_config(host: str, voice: str, output_format: Optional[str] = None):
     if speechsdk is None:
         raise RuntimeError("azure.cognitiveservices.speech not installed")
-    config = speechsdk.SpeechConfig(host=host)
-    config.speech_synthesis_voice_name = voice
+    fmt = get_format(output_format)
+    with tracing.get_default_tracer().span("tts.config_build", host=host, output_format=fmt.name):
+        config = speechsdk.SpeechConfig(host=host)
+        config.speech_synthesis_voice_name = voice
+        config.set_speech_synthesis_output_format(getattr(speechsdk.SpeechSynthesisOutputFormat, fmt.sdk_name))  # FR-011 default
     return config
 
 
-def synthesize(text: str, host: Optional[str] = None, voice: Optional[str] = None, timeout: float = 10.0) -> SynthesisResult:
+def is_endpoint_failure(result: SynthesisResult) -> bool:
+    """True when a failed result points at the container (not the input) being unhealthy.
+
+    `IO_ERROR` (the output file or cache could not be written) is local and
+    never blames the replica.
+    """
+    if result.reason in ("RUNTIME_ERROR", "EXCEPTION"):
+        return True
+    return result.reason == "CANCELED" and "connection" in (result.error or "").lower()
+
+
+def _release_synthesizer(synth_pool: Optional["SynthesizerPool"], entry: "PooledSynthesizer", healthy: bool) -> None:
+    if synth_pool is not None:
+        synth_pool.release(entry, healthy=healthy)
+    else:
+        entry.close()
+
+
+def reserve_output_path(prefix: str = "tts", extension: str = ".wav") -> str:
+    """Claim a unique `<prefix>_<UTC_TIMESTAMP><extension>` in OUTPUT_DIR.
+
+    Concurrent syntheses finish within the same second; the file is created
+    exclusively so a second caller gets a `_1`, `_2`, ... suffix instead of
+    overwriting the first file.
+    """
+    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    n = 0
+    while True:
+        path = OUTPUT_DIR / (f"{prefix}_{ts}{extension}" if n == 0 else f"{prefix}_{ts}_{n}{extension}")
+        try:
+            with open(path, "xb"):
+                return str(path)
+        except FileExistsError:
+            n += 1
+        except OSError:  # directory missing/unwritable: report the error at write time
+            return str(path)
+
+
+def _discard_if_empty(path: Optional[str]) -> None:
+    """Remove a reserved output file that never received audio."""
+    if path:
+        try:
+            if os.path.getsize(path) == 0:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
+def synthesize(text: str, host: Optional[str] = None, voice: Optional[str] = None, timeout: float = 10.0, pool: Optional["EndpointPool"] = None, synthesizers: Optional["SynthesizerPool"] = None, cache: Optional["AudioCache"] = None, in_memory: bool = False, on_audio_chunk: Optional[Callable[[bytes], None]] = None, handle: Optional[SynthesisHandle] = None, output_format: Optional[str] = None, cache_identity: Optional[str] = None) -> SynthesisResult:
+    """Synthesize `text` into a WAV (or `output_format` file) under OUTPUT_DIR.
+
+    Uses `synthesizers` (default: the shared `tts_pool` pool) so repeated calls
+    reuse an open container connection; `pool` spreads calls over replicas.
+    Phrases found in `cache` (default: the shared `tts_cache` cache) return the
+    cached WAV with `cached=True` and never reach the container.
+    With `in_memory=True` no WAV is written: the audio is returned in
+    `audio_data` (and `audio_path` is only set for cache hits).
+    `on_audio_chunk` receives each audio chunk as the container streams it
+    (the first may carry the RIFF header), e.g. `StreamingPlayer.feed`.
+    `handle.cancel()` from another thread stops the synthesis early.
+    `output_format` is an `audio_formats` name or alias (default
+    TTS_OUTPUT_FORMAT / FR-011 PCM WAV); unknown names raise ValueError.
+    `cache_identity` replaces the host in cache keys; with `pool` it defaults
+    to `tts_cache.pool_identity(pool.hosts)`.
+    """
+    if pool is not None:
+        # Pick a replica per request; connection-level failures eject it until /ready passes again.
+        chosen = pool.acquire()
+        try:
+            result = synthesize(
+                text, host=chosen, voice=voice, timeout=timeout, synthesizers=synthesizers, cache=cache, in_memory=in_memory,
+                on_audio_chunk=on_audio_chunk, handle=handle, output_format=output_format,
+                cache_identity=cache_identity or _pool_identity(pool),
+            )
+        except BaseException as e:  # caller errors (e.g. unknown output_format) keep the replica in rotation
+            pool.release(chosen, success=not is_connection_failure(e))
+            raise
+        pool.release(chosen, success=not is_endpoint_failure(result))
+        return result
     host = host or DEFAULT_HOST
     voice = voice or DEFAULT_VOICE
+    fmt = get_format(output_format)
+    with tracing.get_default_tracer().span("tts.synthesize", host=host, voice=voice, chars=len(text), output_format=fmt.name) as span:
+        outcome = _synthesize_on_host(text, host, voice, synthesizers, cache, in_memory, on_audio_chunk, handle, fmt, cache_identity)
+        if span is not None:
+            span.set(reason=outcome.reason, cached=outcome.cached)
+            if not outcome.success:
+                span.error = outcome.error or outcome.reason
+    return outcome
+
+
+def _synthesize_on_host(text: str, host: str, voice: str, synthesizers: Optional["SynthesizerPool"], cache: Optional["AudioCache"], in_memory: bool, on_audio_chunk: Optional[Callable[[bytes], None]], handle: Optional[SynthesisHandle], fmt: AudioFormat, cache_identity: Optional[str] = None) -> SynthesisResult:
     if speechsdk is None:
-        return SynthesisResult(text=text, success=False, reason="SDK_MISSING", latency_ms=None, error="Speech SDK not installed", voice=voice, host=host)
+        return SynthesisResult(text=text, success=False, reason="SDK_MISSING", latency_ms=None, error="Speech SDK not installed", voice=voice, host=host, output_format=fmt.name)
     if not text.strip():
-        return SynthesisResult(text=text, success=False, reason="EMPTY", latency_ms=None, error="Empty text", voice=voice, host=host)
+        return SynthesisResult(text=text, success=False, reason="EMPTY", latency_ms=None, error="Empty text", voice=voice, host=host, output_format=fmt.name)
+
+    from . import tts_pool
+    audio_cache, key, hit = _cache_lookup(text, voice, host, cache, in_memory, on_audio_chunk, fmt, cache_identity)
+    if hit is not None:
+        return hit
+    output_path = _prepare_output(in_memory, fmt)
 
-    speech_config = build_speech_config(host, voice)
+    # Reuse a long-lived synthesizer (connection already open) unless pooling is disabled
+    synth_pool = synthesizers or tts_pool.get_default_pool()
+    try:
+        entry = synth_pool.acquire(host, voice, fmt.name) if synth_pool is not None else tts_pool.PooledSynthesizer(host, voice, fmt.name)
+    except Exception as e:  # SDK could not build a synthesizer for this host
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=voice, host=host, output_format=fmt.name)
+    if on_audio_chunk is not None:
+        entry.on_synthesizing = lambda evt: on_audio_chunk(evt.result.audio_data)
+    if handle is not None and not handle._attach(entry):
+        _release_synthesizer(synth_pool, entry, healthy=True)
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="CANCELED", latency_ms=None, error="Cancelled before start", voice=voice, host=host, output_format=fmt.name)
 
+    start = time.perf_counter()
+    try:
+        try:
+            result = entry.synthesizer.speak_text_async(text).get()
+        finally:
+            if handle is not None:
+                handle._detach()
+        first_audio_time = entry.first_audio_time
+        _trace_stream(start, first_audio_time, result)
+    except RuntimeError as e:  # container connection / audio system issues
+        _release_synthesizer(synth_pool, entry, healthy=False)
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="RUNTIME_ERROR", latency_ms=None, error=str(e), voice=voice, host=host, output_format=fmt.name, audio_path=output_path)
+    except Exception as e:  # generic failure
+        _release_synthesizer(synth_pool, entry, healthy=False)
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=voice, host=host, output_format=fmt.name, audio_path=output_path)
+    try:
+        _store_audio(result, output_path, audio_cache, key, fmt)
+    except OSError as e:  # local disk (output file / cache): the container and synthesizer are fine
+        _release_synthesizer(synth_pool, entry, healthy=True)
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="IO_ERROR", latency_ms=None, error=str(e), voice=voice, host=host, output_format=fmt.name, audio_path=output_path)
+
+    outcome, healthy = _build_result(text, voice, host, result, start, first_audio_time, output_path, in_memory, fmt)
+    _release_synthesizer(synth_pool, entry, healthy=healthy)
+    return outcome
+
+
+def _trace_stream(start: float, first_audio_time: Optional[float], result) -> None:  # noqa: ANN001
+    """Record the first-byte / last-byte stages of one speak request."""
+    tracer = tracing.get_default_tracer()
+    if not tracer.enabled:
+        return
+    end = time.perf_counter()
+    tracer.record("tts.first_byte", start, first_audio_time)
+    completed = result is not None and getattr(result, "reason", None) == speechsdk.ResultReason.SynthesizingAudioCompleted
+    tracer.record("tts.last_byte", start, end, error=None if completed else str(getattr(result, "reason", "NO_RESULT")))
+
+
+def _pool_identity(pool: "EndpointPool") -> str:
+    from . import tts_cache
+    return tts_cache.pool_identity(pool.hosts)
+
+
+def _cache_lookup(text: str, voice: str, host: str, cache: Optional["AudioCache"], in_memory: bool, on_audio_chunk: Optional[Callable[[bytes], None]], fmt: AudioFormat, cache_identity: Optional[str] = None) -> Tuple[Optional["AudioCache"], Optional[str], Optional[SynthesisResult]]:
+    """Return (cache, key, result for a cache hit or None); keys use `cache_identity` or `host`."""
+    from . import tts_cache
+    audio_cache = cache or tts_cache.get_default_cache()
+    if audio_cache is None:
+        return None, None, None
+    key = tts_cache.cache_key(text, voice, cache_identity or host, fmt.name)
+    hit = audio_cache.get(key)
+    if hit is None:
+        return audio_cache, key, None
+    now = time.perf_counter()
+    data = hit.read_bytes() if (in_memory or on_audio_chunk is not None) else None
+    if on_audio_chunk is not None:
+        on_audio_chunk(data)
+    return audio_cache, key, SynthesisResult(text=text, success=True, reason="OK", latency_ms=0, voice=voice, host=host, audio_path=str(hit), start_monotonic=now, first_audio_monotonic=now, cached=True, audio_data=data if in_memory else None, output_format=fmt.name)
+
+
+def _prepare_output(in_memory: bool, fmt: AudioFormat) -> Optional[str]:
+    if in_memory:
+        return None
     # Ensure output directory exists
     try:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     except Exception:
         pass
-
     # Construct safe filename based on timestamp; allow override
-    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
-    base_name = f"tts_{ts}.wav"
-    output_path = os.getenv("TTS_SYNTH_OUTPUT_FILE", str(OUTPUT_DIR / base_name))
-    audio_config = speechsdk.audio.AudioOutputConfig(filename=output_path)
-    synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
+    return os.getenv("TTS_SYNTH_OUTPUT_FILE") or reserve_output_path(extension=fmt.extension)
 
-    first_audio_time: Optional[float] = None
-    start = time.perf_counter()
 
-    def synthesis_started(_evt):  # noqa: ANN001
-        nonlocal first_audio_time
-        if first_audio_time is None:
-            first_audio_time = time.perf_counter()
+def _store_audio(result, output_path: Optional[str], audio_cache: Optional["AudioCache"], key: Optional[str], fmt: AudioFormat) -> None:  # noqa: ANN001
+    """Persist a completed SDK result to the output file and the cache."""
+    if result is None or getattr(result, "reason", None) != speechsdk.ResultReason.SynthesizingAudioCompleted:
+        return
+    if output_path:
+        with tracing.get_default_tracer().span("tts.file_write", bytes=len(result.audio_data), output_format=fmt.name):
+            Path(output_path).write_bytes(result.audio_data)  # RIFF 16 kHz 16-bit mono unless another format was asked for
+    if audio_cache is not None:
+        audio_cache.put(key, result.audio_data, extension=fmt.extension)
 
-    synthesizer.synthesizing.connect(lambda evt: synthesis_started(evt))  # type: ignore[arg-type]
-
-    try:
-        result = synthesizer.speak_text_async(text).get()
-    except RuntimeError as e:  # container connection / audio system issues
-        return SynthesisResult(text=text, success=False, reason="RUNTIME_ERROR", latency_ms=None, error=str(e), voice=voice, host=host, audio_path=output_path)
-    except Exception as e:  # generic failure
-        return SynthesisResult(text=text, success=False, reason="EXCEPTION", latency_ms=None, error=str(e), voice=voice, host=host, audio_path=output_path)
 
+def _build_result(text: str, voice: str, host: str, result, start: float, first_audio_time: Optional[float], output_path: Optional[str], in_memory: bool, fmt: Optional[AudioFormat] = None) -> Tuple[SynthesisResult, bool]:  # noqa: ANN001
+    """Map an SDK result to (SynthesisResult, synthesizer still healthy)."""
     end = time.perf_counter()
     latency_ms = int(((first_audio_time or end) - start) * 1000)
-
-    if result is not None:
-        rr = getattr(result, "reason", None)
-        if rr == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            return SynthesisResult(text=text, success=True, reason="OK", latency_ms=latency_ms, voice=voice, host=host, audio_path=output_path, start_monotonic=start, first_audio_monotonic=first_audio_time or end)
-        if rr == speechsdk.ResultReason.Canceled:
-            cancellation = getattr(result, "cancellation_details", None)
-            err = getattr(cancellation, "error_details", "Canceled") if cancellation else "Canceled"
-            return SynthesisResult(text=text, success=False, reason="CANCELED", latency_ms=latency_ms, error=err, voice=voice, host=host, audio_path=output_path, start_monotonic=start, first_audio_monotonic=first_audio_time or end)
-        return SynthesisResult(text=text, success=False, reason=str(rr), latency_ms=latency_ms, error="Unknown synthesis state", voice=voice, host=host, audio_path=output_path, start_monotonic=start, first_audio_monotonic=first_audio_time or end)
-    return SynthesisResult(text=text, success=False, reason="NO_RESULT", latency_ms=latency_ms, error="Result object missing", voice=voice, host=host, audio_path=output_path, start_monotonic=start, first_audio_monotonic=first_audio_time or end)
+    timing = dict(latency_ms=latency_ms, voice=voice, host=host, audio_path=output_path, start_monotonic=start, first_audio_monotonic=first_audio_time or end, output_format=(fmt or get_format()).name)
+    if result is None:
+        _discard_if_empty(output_path)
+        return SynthesisResult(text=text, success=False, reason="NO_RESULT", error="Result object missing", **timing), False
+    rr = getattr(result, "reason", None)
+    if rr == speechsdk.ResultReason.SynthesizingAudioCompleted:
+        return SynthesisResult(text=text, success=True, reason="OK", audio_data=result.audio_data if in_memory else None, **timing), True
+    _discard_if_empty(output_path)
+    if rr == speechsdk.ResultReason.Canceled:
+        cancellation = getattr(result, "cancellation_details", None)
+        err = getattr(cancellation, "error_details", "Canceled") if cancellation else "Canceled"
+        connection_lost = "connection" in str(err).lower()
+        return SynthesisResult(text=text, success=False, reason="CANCELED", error=err, **timing), not connection_lost
+    return SynthesisResult(text=text, success=False, reason=str(rr), error="Unknown synthesis state", **timing), True
@@ -0,0 +1,212 @@
+"""Combined-WAV assembly without loading segments into memory.
+
+Concatenating segments through `wave.open(...).readframes()` materializes each
+segment as Python bytes and copies it again on write, so peak RSS grows with
+the longest segment (and with every segment the caller keeps around). Here:
+
+  - `read_wav_info(path)` parses only the RIFF chunk headers of a file
+    (seeking past chunk bodies), never the PCM payload.
+  - `WavAssembler` writes one output WAV: file segments are copied kernel-side
+    with `os.sendfile`, falling back to `mmap` + `memoryview` slices where
+    file-to-file sendfile is unavailable; in-memory WAVs are written straight
+    from a `wav_utils.pcm_view` slice. The header sizes are patched on close.
+  - Every added segment yields an `AssembledSegment` with its frame-accurate
+    position in the output, i.e. the combined WAV's segment index.
+
+Headerless PCM segments (`raw-*` output formats) are accepted when their
+`audio_formats` name is given; compressed formats (Opus, MP3) cannot be
+concatenated sample-accurately without decoding and raise ValueError.
+
+Outputs beyond the 4 GiB RIFF limit keep growing; their size fields are set to
+0xFFFFFFFF, the streaming convention `wav_utils.parse_wav_header` and most
+players accept.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+
+from .audio_formats import AudioFormat, format_for_extension, get_format
+from .wav_utils import WAVE_FORMAT_PCM, Buffer, WavInfo, parse_wav_chunks, parse_wav_header, pcm_view
+
+COPY_BLOCK_BYTES = 8 * 1024 * 1024  # per sendfile / mmap slice write
+_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")  # canonical 44-byte PCM header
+_RIFF_MAX = 0xFFFFFFFF
+
+
+class WavLayoutError(ValueError):
+    """A segment's channels/sample width/rate differ from the output's."""
+
+
+def read_wav_info(path: Union[str, Path]) -> WavInfo:
+    """Parse a WAV file's fmt/data chunk headers without reading the samples.
+
+    Raises:
+        ValueError: Not a RIFF/WAVE file, no fmt/data chunk, or a truncated header.
+        OSError: The file cannot be read.
+    """
+    with open(path, "rb") as fh:
+
+        def read(offset: int, count: int) -> bytes:
+            fh.seek(offset)
+            return fh.read(count)
+
+        return parse_wav_chunks(read, os.fstat(fh.fileno()).st_size, f"file: {path}")
+
+
+def wav_duration_seconds(path: Union[str, Path]) -> Optional[float]:
+    """Duration from the header alone; None when the file is missing or not a WAV."""
+    try:
+        info = read_wav_info(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    return info.duration_seconds if info.framerate else None
+
+
+@dataclass
+class AssembledSegment:
+    start_frame: int
+    end_frame: int
+    frames: int
+    source: str = ""  # file path, or "" for an in-memory buffer
+    meta: Dict[str, object] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {**self.meta, "start_frame": self.start_frame, "end_frame": self.end_frame, "frames": self.frames}
+
+
+def _copy_file_range(out: BinaryIO, src: BinaryIO, offset: int, count: int) -> None:
+    """Copy `count` bytes at `offset` of `src` to the end of `out` without Python buffers."""
+    out_fd, in_fd = out.fileno(), src.fileno()
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        try:
+            while count > 0:
+                sent = sendfile(out_fd, in_fd, offset, min(count, COPY_BLOCK_BYTES))
+                if sent == 0:
+                    raise ValueError("WAV file shorter than its header claims")
+                offset += sent
+                count -= sent
+            return
+        except OSError:  # e.g. file-to-file sendfile unsupported on this platform
+            pass
+    with mmap.mmap(in_fd, 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            end = offset + count
+            while offset < end:
+                step = min(end - offset, COPY_BLOCK_BYTES)
+                out.write(view[offset:offset + step])
+                offset += step
+        finally:
+            view.release()
+
+
+def _source_format(output_format: Optional[str], path: Optional[Union[str, Path]] = None) -> Optional[AudioFormat]:
+    """The non-WAV format a segment is declared (or, for files, named) as; None for RIFF WAV."""
+    fmt = get_format(output_format) if output_format else (format_for_extension(Path(path).suffix) if path is not None else None)
+    if fmt is None or fmt.container == "riff":
+        return None
+    if not fmt.is_pcm:
+        raise ValueError(f"{fmt.name} segments are compressed; only PCM can be concatenated")
+    return fmt
+
+
+class WavAssembler:
+    """Streams PCM segments into one WAV; use as a context manager or call `close()`."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: BinaryIO = open(self.path, "wb", buffering=0)  # unbuffered: writes and sendfile interleave safely
+        self._fh.write(bytes(_HEADER.size))  # patched in close()
+        self._format: Optional[tuple] = None
+        self.frames = 0
+        self.data_bytes = 0
+        self.segments: List[AssembledSegment] = []
+
+    @property
+    def info(self) -> Optional[WavInfo]:
+        """Layout of the output so far (None before the first segment)."""
+        if self._format is None:
+            return None
+        channels, sampwidth, framerate = self._format
+        return WavInfo(channels, sampwidth, framerate, _HEADER.size, self.data_bytes)
+
+    def _check(self, info: WavInfo, source: str) -> None:
+        if info.codec != WAVE_FORMAT_PCM:  # WAVE_FORMAT_EXTENSIBLE counts by its SubFormat
+            raise ValueError(f"Only PCM segments can be concatenated ({source or 'buffer'} has format {info.codec:#06x})")
+        layout = (info.channels, info.sampwidth, info.framerate)
+        if self._format is None:
+            self._format = layout
+        elif layout != self._format:
+            raise WavLayoutError(f"Segment layout {layout} differs from {self._format} ({source or 'buffer'})")
+
+    def _record(self, info: WavInfo, nbytes: int, source: str, meta: Dict[str, object]) -> AssembledSegment:
+        frames = nbytes // info.frame_size if info.frame_size else 0
+        segment = AssembledSegment(self.frames, self.frames + frames, frames, source, dict(meta))
+        self.frames += frames
+        self.data_bytes += nbytes
+        self.segments.append(segment)
+        return segment
+
+    def add_file(self, path: Union[str, Path], output_format: Optional[str] = None, **meta: object) -> AssembledSegment:
+        """Append the PCM payload of a WAV (or raw `output_format`) file, copied kernel-side."""
+        raw = _source_format(output_format, path)
+        info = raw.pcm_info(os.path.getsize(path)) if raw is not None else read_wav_info(path)
+        self._check(info, str(path))
+        nbytes = info.nframes * info.frame_size  # whole frames only
+        with open(path, "rb") as src:
+            _copy_file_range(self._fh, src, info.data_offset, nbytes)
+        return self._record(info, nbytes, str(path), meta)
+
+    def add_buffer(self, buf: Buffer, output_format: Optional[str] = None, **meta: object) -> AssembledSegment:
+        """Append the PCM payload of an in-memory WAV (or raw `output_format`) via a zero-copy slice."""
+        raw = _source_format(output_format)
+        info = raw.pcm_info(len(buf)) if raw is not None and bytes(buf[:4]) != b"RIFF" else parse_wav_header(buf)
+        self._check(info, "")
+        nbytes = info.nframes * info.frame_size
+        self._fh.write(pcm_view(buf, info)[:nbytes])
+        return self._record(info, nbytes, "", meta)
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        try:
+            if self.data_bytes & 1:
+                self._fh.write(b"\0")  # RIFF chunks are word aligned
+            channels, sampwidth, framerate = self._format or (1, 2, 16000)
+            data_size = self.data_bytes if self.data_bytes <= _RIFF_MAX - 36 else _RIFF_MAX
+            riff_size = data_size + 36 if data_size != _RIFF_MAX else _RIFF_MAX
+            self._fh.seek(0)
+            self._fh.write(_HEADER.pack(
+                b"RIFF", riff_size, b"WAVE", b"fmt ", 16, WAVE_FORMAT_PCM, channels, framerate,
+                framerate * channels * sampwidth, channels * sampwidth, sampwidth * 8, b"data", data_size,
+            ))
+        finally:
+            self._fh.close()
+
+    def __enter__(self) -> "WavAssembler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def assemble(sources: Iterable[Union[str, Path, Buffer]], path: Union[str, Path]) -> List[AssembledSegment]:
+    """Concatenate WAV files and/or in-memory WAVs into `path`; returns the segment index."""
+    with WavAssembler(path) as out:
+        for source in sources:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                out.add_buffer(source)
+            else:
+                out.add_file(source)
+    return out.segments
+
+
+__all__ = ["AssembledSegment", "WavAssembler", "WavLayoutError", "assemble", "read_wav_info", "wav_duration_seconds"]
@@ -0,0 +1,130 @@
+"""Minimal RIFF/WAVE header parsing over in-memory buffers.
+
+Lets synthesized audio stay in a `bytes`/`memoryview` buffer end to end:
+callers learn the PCM layout from the header and take a zero-copy
+`memoryview` slice of the sample data instead of round-tripping through
+`wave.open` on a file.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# WAVE_FORMAT_EXTENSIBLE SubFormat GUIDs are the format tag followed by this fixed tail
+_SUBFORMAT_GUID_TAIL = bytes.fromhex("000000001000800000aa00389b71")
+
+
+@dataclass
+class WavInfo:
+    channels: int
+    sampwidth: int  # bytes per sample
+    framerate: int
+    data_offset: int  # byte offset of the first PCM sample
+    data_size: int  # PCM payload bytes (clipped to what is present)
+    audio_format: int = WAVE_FORMAT_PCM
+    sub_format: Optional[int] = None  # WAVE_FORMAT_EXTENSIBLE only; 0 when the SubFormat is not a tag GUID
+
+    @property
+    def codec(self) -> int:
+        """The effective format tag: the SubFormat's for WAVE_FORMAT_EXTENSIBLE."""
+        if self.audio_format == WAVE_FORMAT_EXTENSIBLE:
+            return self.sub_format or 0
+        return self.audio_format
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sampwidth
+
+    @property
+    def nframes(self) -> int:
+        return self.data_size // self.frame_size if self.frame_size else 0
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.nframes / float(self.framerate) if self.framerate else 0.0
+
+
+def _parse_fmt(raw: bytes) -> Tuple[int, int, int, int, Optional[int]]:
+    """(format tag, channels, rate, bits per sample, SubFormat tag) from a fmt chunk body."""
+    audio_format, channels, rate, _byte_rate, _align, bits = struct.unpack_from("<HHIIHH", raw)
+    sub_format = None
+    if audio_format == WAVE_FORMAT_EXTENSIBLE:
+        # cbSize, valid bits and channel mask precede the 16-byte SubFormat GUID at offset 24
+        guid = raw[24:40]
+        sub_format = struct.unpack_from("<H", guid)[0] if len(guid) == 16 and guid[2:] == _SUBFORMAT_GUID_TAIL else 0
+    return audio_format, channels, rate, bits, sub_format
+
+
+def parse_wav_chunks(read: Callable[[int, int], bytes], size: int, source: str = "buffer") -> WavInfo:
+    """Walk the RIFF chunk headers of a `size`-byte WAV, reading through `read(offset, count)`.
+
+    Only the RIFF header, chunk headers and the fmt body are read, so files
+    (`wav_assembly.read_wav_info`) and buffers (`parse_wav_header`) share one
+    parser without touching the samples. `source` names the input in errors.
+
+    Raises:
+        ValueError: Not RIFF/WAVE, a truncated header, a short fmt chunk, or no fmt/data chunk.
+    """
+    head = read(0, 12)
+    if len(head) < 12 or head[0:4] != b"RIFF" or head[8:12] != b"WAVE":
+        raise ValueError(f"Not a RIFF/WAVE {source}")
+    pos = 12
+    fmt = None
+    while pos + 8 <= size:
+        header = read(pos, 8)
+        if len(header) < 8:
+            raise ValueError(f"Truncated WAV header ({source})")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            if chunk_size < 16:
+                raise ValueError(f"WAV fmt chunk is {chunk_size} bytes, expected at least 16 ({source})")
+            raw = read(body, min(chunk_size, 40))
+            if len(raw) < 16:
+                raise ValueError(f"Truncated WAV header ({source})")
+            fmt = _parse_fmt(raw)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError(f"WAV data chunk precedes fmt chunk ({source})")
+            audio_format, channels, rate, bits, sub_format = fmt
+            # Streaming writers may leave the size as 0 or 0xFFFFFFFF; use what is present
+            available = size - body
+            return WavInfo(
+                channels=channels,
+                sampwidth=bits // 8,
+                framerate=rate,
+                data_offset=body,
+                data_size=available if chunk_size in (0, 0xFFFFFFFF) else min(chunk_size, available),
+                audio_format=audio_format,
+                sub_format=sub_format,
+            )
+        pos = body + chunk_size + (chunk_size & 1)  # chunks are word aligned
+    if pos < size or fmt is not None:
+        raise ValueError(f"Truncated WAV header ({source})")
+    raise ValueError(f"WAV has no data chunk ({source})")
+
+
+def parse_wav_header(buf: Buffer) -> WavInfo:
+    """Parse the RIFF header of an in-memory WAV.
+
+    Raises:
+        ValueError: Not a RIFF/WAVE buffer, truncated header, or no fmt/data chunk.
+    """
+    view = memoryview(buf).cast("B")
+    return parse_wav_chunks(lambda offset, count: bytes(view[offset:offset + count]), len(view))
+
+
+def pcm_view(buf: Buffer, info: WavInfo | None = None) -> memoryview:
+    """Zero-copy view of the PCM payload of an in-memory WAV."""
+    info = info or parse_wav_header(buf)
+    return memoryview(buf).cast("B")[info.data_offset: info.data_offset + info.data_size]
+
+
+__all__ = ["WavInfo", "parse_wav_chunks", "parse_wav_header", "pcm_view"]
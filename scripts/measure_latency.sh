@@ -15,16 +15,18 @@ truncate -s 0 "$ARTIFACT"
 
 PHRASES=("This is a test of multi phrase latency" "Here is another quick test following on" "Phrase number 3" "And here is the fourth phrase" "And a fifth, as in fifth column" "Sixth" "Finally 7th")
 MAX_QUEUE=${TTS_MAX_QUEUE:-6}
+MAX_CONCURRENCY=${TTS_MAX_CONCURRENCY:-1}
 HOST=${TTS_HOST_URL:-http://localhost:5001}
 VOICE=${VOICE_NAME:-en-US-JennyNeural}
 
-python3 - <<'PY' "$ARTIFACT" "$HOST" "$VOICE" "$MAX_QUEUE" "${PHRASES[@]}"
+python3 - <<'PY' "$ARTIFACT" "$HOST" "$VOICE" "$MAX_QUEUE" "$MAX_CONCURRENCY" "${PHRASES[@]}"
 import sys, time, pathlib, importlib
 artifact = pathlib.Path(sys.argv[1])
 host = sys.argv[2]
 voice = sys.argv[3]
 max_queue = int(sys.argv[4])
-phrases = sys.argv[5:]
+max_concurrency = int(sys.argv[5])
+phrases = sys.argv[6:]
 
 repo_root = pathlib.Path(__file__).resolve().parent.parent
 if str(repo_root) not in sys.path:
@@ -32,7 +34,7 @@ if str(repo_root) not in sys.path:
 qm = importlib.import_module("cli.queue_manager")
 tts = importlib.import_module("cli.tts_synth")
 
-manager = qm.QueueManager(host=host, voice=voice, max_queue=max_queue)
+manager = qm.QueueManager(host=host, voice=voice, max_queue=max_queue, in_memory=True, max_concurrency=max_concurrency)
 submission_records = []
 for p in phrases:
     mono_before_submit = time.perf_counter()
@@ -43,7 +45,7 @@ for p in phrases:
 manager.wait_all(timeout=60)
 results_map = {r.request_id: r for r in manager.results}
 
-lines = ["# latency measurement", f"# host={host}", f"# voice={voice}", f"# max_queue={max_queue}"]
+lines = ["# latency measurement", f"# host={host}", f"# voice={voice}", f"# max_queue={max_queue}", f"# max_concurrency={max_concurrency}"]
 lines.append("# columns: request_id|decision|submit_ms|start_ms|first_audio_ms|queue_delay_ms|synth_latency_ms|text")
 
 for text, submit_mono, decision in submission_records:
@@ -63,65 +65,38 @@ for text, submit_mono, decision in submission_records:
         synth_latency_ms = -1
     lines.append(f"{rid}|{dec}|{submit_ms}|{start_ms}|{first_audio_ms}|{queue_delay_ms}|{synth_latency_ms}|{text}")
 
-import wave, json
-from contextlib import closing
+import json
+wav_assembly = importlib.import_module("cli.wav_assembly")
 
-# Build combined WAV (concatenate raw frames) if there are successful audio paths
+# Build combined WAV from the in-memory results: headers are parsed in place and
+# each PCM payload is written straight from a memoryview slice into the output
+# (file-backed results are copied kernel-side); no segment is re-buffered
 ordered_results = [results_map.get(rec.request_id) for _,_,rec in submission_records if results_map.get(rec.request_id)]
-audio_paths = [r.audio_path for r in ordered_results if r and r.success and r.audio_path]
-# Sort audio_paths by the order of submission completion (ordered_results already reflects submission order promotion)
 combined_path = None
 segment_index = []  # list of {request_id, text, start_frame, end_frame, frames, audio_path}
-if audio_paths:
-    first = audio_paths[0]
+audio_results = [r for r in ordered_results if r and r.success and (r.audio_data or r.audio_path)]
+if audio_results:
+    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    combined_path = str(artifact.parent / f"latency_combined_{ts}.wav")
     try:
-        with closing(wave.open(first, 'rb')) as wf_first:
-            params = wf_first.getparams()  # (nchannels, sampwidth, framerate, nframes, comptype, compname)
-        # Verify all share identical core parameters (channels, width, rate)
-        compatible = True
-        for pth in audio_paths[1:]:
-            try:
-                with closing(wave.open(pth, 'rb')) as wf_chk:
-                    ch, sw, fr, nf, ct, cn = wf_chk.getparams()
-                if (ch, sw, fr) != (params.nchannels, params.sampwidth, params.framerate):
-                    compatible = False
-                    break
-            except Exception:
-                compatible = False
-                break
-        if compatible:
-            ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
-            combined_path = str(artifact.parent / f"latency_combined_{ts}.wav")
-            with closing(wave.open(combined_path, 'wb')) as wf_out:
-                wf_out.setnchannels(params.nchannels)
-                wf_out.setsampwidth(params.sampwidth)
-                wf_out.setframerate(params.framerate)
-                wf_out.setcomptype(params.comptype, params.compname)
-                current_frame = 0
-                for r in ordered_results:
-                    if not (r and r.success and r.audio_path):
-                        continue
-                    pth = r.audio_path
-                    try:
-                        with closing(wave.open(pth, 'rb')) as wf_in:
-                            frame_count = wf_in.getnframes()
-                            frames = wf_in.readframes(frame_count)
-                        wf_out.writeframes(frames)
-                        segment_index.append({
-                            "request_id": r.request_id,
-                            "text": r.text,
-                            "start_frame": current_frame,
-                            "end_frame": current_frame + frame_count,
-                            "frames": frame_count,
-                            "audio_path": pth,
-                        })
-                        current_frame += frame_count
-                    except Exception:
-                        continue
-        else:
-            combined_path = None
-    except Exception:
+        with wav_assembly.WavAssembler(combined_path) as out:
+            for r in audio_results:
+                # audio_path empty: synthesized in memory only
+                meta = {"request_id": r.request_id, "text": r.text, "audio_path": r.audio_path or ""}
+                try:
+                    if r.audio_data:
+                        out.add_buffer(r.audio_data, output_format=r.output_format, **meta)
+                    else:
+                        out.add_file(r.audio_path, output_format=r.output_format, **meta)
+                except wav_assembly.WavLayoutError:
+                    raise  # all segments must share channels/width/rate
+                except ValueError:
+                    continue  # compressed (TTS_OUTPUT_FORMAT) or not a WAV: leave it out of the combined file
+        segment_index = [seg.as_dict() for seg in out.segments]
+    except (OSError, ValueError):
+        pathlib.Path(combined_path).unlink(missing_ok=True)
         combined_path = None
+        segment_index = []
 
 if combined_path and segment_index:
     # Append per-file mapping lines to artifact for human inspection
@@ -140,6 +115,7 @@ index_payload = {
     "host": host,
     "voice": voice,
     "max_queue": max_queue,
+    "max_concurrency": max_concurrency,
     "combined_wav": combined_path,
     "segments": segment_index,
 }
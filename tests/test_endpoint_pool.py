@@ -0,0 +1,86 @@
+"""EndpointPool selection, ejection and re-admission (probe stubbed)."""
+
+import pytest
+
+from cli.endpoint_pool import EndpointPool
+
+HOSTS = ["http://a:5001", "http://b:5001"]
+
+
+def make_pool(strategy="round_robin", ready=True):
+    return EndpointPool(HOSTS, strategy=strategy, probe=lambda host: ready, probe_interval=60)
+
+
+def test_round_robin_cycles_hosts():
+    pool = make_pool()
+    picks = [pool.acquire() for _ in range(4)]
+    assert picks == HOSTS * 2
+    pool.close()
+
+
+def test_least_outstanding_prefers_idle_host():
+    pool = make_pool("least_outstanding")
+    first = pool.acquire()
+    assert pool.acquire() != first
+    pool.release(first)
+    assert pool.acquire() == first
+    pool.close()
+
+
+def test_failed_release_ejects_until_probe_passes():
+    pool = make_pool()
+    pool.release(pool.acquire(), success=False)
+    assert pool.healthy_hosts == HOSTS[1:]
+    assert all(pool.acquire() == HOSTS[1] for _ in range(3))
+    pool.probe_all()
+    assert pool.healthy_hosts == HOSTS
+    pool.close()
+
+
+def test_lease_ejects_only_on_connection_failures():
+    pool = make_pool()
+    with pytest.raises(ValueError):
+        with pool.lease():
+            raise ValueError("bad input")
+    assert pool.healthy_hosts == HOSTS
+    with pytest.raises(ConnectionRefusedError):
+        with pool.lease() as host:
+            raise ConnectionRefusedError()
+    assert host not in pool.healthy_hosts
+    assert pool.outstanding() == {h: 0 for h in HOSTS}
+    pool.close()
+
+
+def test_synthesize_keeps_replica_on_caller_and_local_errors(monkeypatch):
+    from cli import tts_synth
+
+    pool = make_pool()
+    with pytest.raises(ValueError):
+        tts_synth.synthesize("hi", pool=pool, output_format="bogus")
+    assert pool.healthy_hosts == HOSTS
+
+    def on_host(text, host, voice, *args, **kwargs):
+        return tts_synth.SynthesisResult(text=text, success=False, reason=reason, latency_ms=None, host=host)
+
+    monkeypatch.setattr(tts_synth, "_synthesize_on_host", on_host)
+    reason = "IO_ERROR"
+    assert tts_synth.synthesize("hi", pool=pool).reason == "IO_ERROR"
+    assert pool.healthy_hosts == HOSTS
+    reason = "RUNTIME_ERROR"
+    failed = tts_synth.synthesize("hi", pool=pool).host
+    assert failed not in pool.healthy_hosts
+    assert pool.outstanding() == {h: 0 for h in HOSTS}
+    pool.close()
+
+
+def test_async_synthesize_keeps_replica_on_caller_errors():
+    import asyncio
+
+    from cli import tts_async
+
+    pool = make_pool()
+    with pytest.raises(ValueError):
+        asyncio.run(tts_async.synthesize("hi", pool=pool, output_format="bogus"))
+    assert pool.healthy_hosts == HOSTS
+    assert pool.outstanding() == {h: 0 for h in HOSTS}
+    pool.close()
@@ -0,0 +1,65 @@
+"""EventLog layouts, size rotation and recovery from a failed rotation."""
+
+import json
+
+from cli import evidence
+from cli.evidence import EventLog
+
+
+def lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_jsonl_layout(tmp_path):
+    path = tmp_path / "events.jsonl"
+    with EventLog(path, flush_interval=0.01) as log:
+        log.write({"id": 1, "text": "héllo"})
+        log.log("done", count=2)
+    first, second = (json.loads(line) for line in lines(path))
+    assert first == {"id": 1, "text": "héllo"}
+    assert second["event"] == "done" and second["count"] == 2 and second["ts"].endswith("Z")
+
+
+def test_csv_header_on_every_rotated_file(tmp_path):
+    path = tmp_path / "events.csv"
+    with EventLog(path, fmt=evidence.format_for_path(path), max_bytes=30, backups=3, batch_size=1, flush_interval=0.01) as log:
+        for i in range(3):
+            log.write({"id": i, "text": "x" * 20, "extra": "ignored"} if i else {"id": i, "text": "x" * 20})
+            log.flush(timeout=5)
+    assert log.rotations == 3
+    assert lines(tmp_path / "events.csv.3") == ["id,text", "0," + "x" * 20]
+    assert lines(tmp_path / "events.csv.1") == ["id,text", "2," + "x" * 20]
+    assert path.read_text(encoding="utf-8") == ""
+
+
+def test_size_rotation_keeps_backups(tmp_path):
+    path = tmp_path / "events.jsonl"
+    with EventLog(path, max_bytes=1, backups=2, batch_size=1, flush_interval=0.01) as log:
+        for i in range(4):
+            log.write({"id": i})
+            log.flush(timeout=5)
+    assert log.rotations == 4 and log.errors == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["events.jsonl", "events.jsonl.1", "events.jsonl.2"]
+    assert [json.loads(lines(tmp_path / f"events.jsonl.{n}")[0])["id"] for n in (1, 2)] == [3, 2]
+
+
+def test_failed_rotation_keeps_writing(tmp_path, monkeypatch):
+    path = tmp_path / "events.jsonl"
+    real_replace = evidence.os.replace
+    calls = []
+
+    def flaky_replace(src, dst):
+        calls.append(src)
+        if len(calls) == 1:
+            raise PermissionError("file locked")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(evidence.os, "replace", flaky_replace)
+    with EventLog(path, max_bytes=1, backups=2, batch_size=1, flush_interval=0.01) as log:
+        for i in range(3):
+            log.write({"id": i})
+            log.flush(timeout=5)
+    assert (log.errors, log.rotations) == (1, 2)
+    # the first rotation failed, so event 0 stayed in the live file and rotated out with event 1
+    assert [json.loads(line)["id"] for line in lines(tmp_path / "events.jsonl.2")] == [0, 1]
+    assert [json.loads(line)["id"] for line in lines(tmp_path / "events.jsonl.1")] == [2]
@@ -0,0 +1,105 @@
+"""Mock container sessions over a raw WebSocket client (no Speech SDK)."""
+
+import base64
+import json
+import os
+import socket
+import struct
+import time
+
+import pytest
+
+from cli.mock_container import MockConfig, MockContainer, parse_message
+from cli.s2t_validate import _mpeg_frame
+from cli.wav_utils import parse_wav_header
+
+
+class Client:
+    def __init__(self, mock):
+        self.sock = socket.create_connection(("127.0.0.1", mock.port), timeout=10)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self.sock.sendall(
+            f"GET /speech HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n\r\n".encode("ascii")
+        )
+        self.rfile = self.sock.makefile("rb")
+        assert b"101" in self.rfile.readline()
+        while self.rfile.readline() not in (b"\r\n", b""):
+            pass
+
+    def send(self, opcode, payload):
+        mask = os.urandom(4)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        n = len(payload)
+        header = struct.pack(">BB", 0x80 | opcode, 0x80 | n) if n < 126 else struct.pack(">BBH", 0x80 | opcode, 0x80 | 126, n)
+        self.sock.sendall(header + mask + masked)
+
+    def text(self, path, body):
+        self.send(0x1, f"Path:{path}\r\nX-RequestId:req1\r\n\r\n{body}".encode("utf-8"))
+
+    def audio(self, data):
+        head = b"Path:audio\r\nX-RequestId:req1\r\n"
+        self.send(0x2, struct.pack(">H", len(head)) + head + data)
+
+    def messages(self, until="turn.end"):
+        while True:
+            b0, b1 = self.rfile.read(2)
+            length = b1 & 0x7F
+            if length == 126:
+                (length,) = struct.unpack(">H", self.rfile.read(2))
+            elif length == 127:
+                (length,) = struct.unpack(">Q", self.rfile.read(8))
+            headers, body = parse_message(b0 & 0x0F, self.rfile.read(length))
+            yield headers["path"], body
+            if headers["path"] == until:
+                return
+
+    def synthesize(self, output_format):
+        self.text("synthesis.context", json.dumps({"synthesis": {"audio": {"outputFormat": output_format}}}))
+        self.text("ssml", "<speak>hello mock</speak>")
+        return b"".join(body for path, body in self.messages() if path == "audio")
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+@pytest.fixture
+def mock():
+    with MockContainer(MockConfig(latency_ms=0, jitter_ms=0, tts_rtf=0, stt_rtf=0, segment_seconds=1.0)) as m:
+        yield m
+
+
+def test_tts_frames_follow_requested_format(mock):
+    client = Client(mock)
+    wav = client.synthesize("riff-22050hz-16bit-mono-pcm")
+    info = parse_wav_header(wav)
+    assert (info.framerate, info.channels, info.data_size) == (22050, 1, len(wav) - 44)
+    mp3 = client.synthesize("audio-24khz-48kbitrate-mono-mp3")
+    frame = _mpeg_frame(mp3, 0)
+    assert (frame.sample_rate, frame.bitrate_kbps) == (24000, 48)
+    assert len(mp3) % frame.length == 0
+    ogg = client.synthesize("ogg-16khz-16bit-mono-opus")
+    assert ogg.startswith(b"OggS") and b"OpusHead" in ogg[:64]
+    client.close()
+    assert mock.stats()["tts_turns"] == 3
+
+
+def test_stt_answers_one_phrase_per_segment(mock):
+    client = Client(mock)
+    pcm = bytes(2 * 16000 * 2 + 16000)  # 2.5 s at 16 kHz
+    header = struct.pack("<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + len(pcm), b"WAVE", b"fmt ", 16, 1, 1, 16000, 32000, 2, 16, b"data", len(pcm))
+    client.audio(header + pcm[:32000])
+    for offset in range(32000, len(pcm), 32000):
+        client.audio(pcm[offset:offset + 32000])
+    client.audio(b"")
+    paths = [path for path, _ in client.messages()]
+    client.close()
+    assert paths.count("speech.phrase") == 3
+    assert paths[-2:] == ["speech.endDetected", "turn.end"]
+
+
+def test_stop_without_start_returns():
+    mock = MockContainer()
+    start = time.monotonic()
+    mock.stop()
+    assert time.monotonic() - start < 1.0
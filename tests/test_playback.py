@@ -0,0 +1,26 @@
+"""StreamingPlayer buffering (no audio device: the consumer only drains)."""
+
+import threading
+
+from cli.playback import StreamingPlayer
+
+
+def test_feed_does_not_block_when_playback_falls_behind(monkeypatch):
+    resume = threading.Event()
+    take = StreamingPlayer._take
+
+    def stalled_take(self, max_bytes):
+        resume.wait()
+        return take(self, max_bytes)
+
+    monkeypatch.setattr(StreamingPlayer, "_take", stalled_take)
+    player = StreamingPlayer(capacity_seconds=0.1)
+    pcm = bytes(range(256)) * 125  # 1 s of 16 kHz 16-bit mono
+    feeder = threading.Thread(target=lambda: [player.feed(pcm) for _ in range(3)], daemon=True)
+    feeder.start()
+    feeder.join(timeout=2)
+    assert not feeder.is_alive()
+    player.finish()
+    resume.set()
+    result = player.wait(timeout=5)
+    assert result is not None and result.duration_seconds == 3.0
@@ -0,0 +1,114 @@
+"""QueueManager scheduling with a stubbed synthesizer (no SDK, no container)."""
+
+import threading
+import time
+
+import pytest
+
+from cli import tts_synth
+from cli.queue_manager import PRIORITY_BULK, PRIORITY_INTERACTIVE, QueueManager
+
+
+def fake_synthesize(text, host=None, voice=None, in_memory=False, **_ignored):
+    """Stand-in for tts_synth.synthesize: 5 ms per character, at least 50 ms."""
+    time.sleep(max(0.05, 0.005 * len(text)))
+    return tts_synth.SynthesisResult(text=text, success=True, reason="OK", latency_ms=10, voice=voice or "stub", host=host or "stub")
+
+
+@pytest.fixture(autouse=True)
+def _stub_synthesis(monkeypatch):
+    monkeypatch.setenv("TTS_CACHE_MAX_MB", "0")
+    monkeypatch.setattr(tts_synth, "synthesize", fake_synthesize)
+
+
+def make_manager(**kwargs):
+    return QueueManager("stub", "stub", prewarm=False, **kwargs)
+
+
+def test_interactive_request_starts_before_earlier_bulk():
+    manager = make_manager(max_queue=3)
+    manager.submit("running")
+    bulk = manager.submit("bulk job", priority=PRIORITY_BULK)
+    prompt = manager.submit("prompt", priority=PRIORITY_INTERACTIVE)
+    assert (bulk.decision, prompt.decision) == ("QUEUED", "QUEUED")
+    assert manager.wait_all(timeout=3)
+    assert prompt.future.result().started_monotonic < bulk.future.result().started_monotonic
+    manager.stop()
+
+
+def test_full_queue_displaces_lowest_priority():
+    manager = make_manager(max_queue=1)
+    manager.submit("running")
+    bulk = manager.submit("bulk job", priority=PRIORITY_BULK)
+    prompt = manager.submit("prompt", priority=PRIORITY_INTERACTIVE)
+    assert prompt.decision == "QUEUED"
+    assert bulk.future.result(timeout=3).reason == "DROPPED_PREEMPTED"
+    assert prompt.future.result(timeout=3).success
+    manager.stop()
+
+
+def test_on_result_can_resubmit_and_preempt():
+    resubmitted = []
+
+    def on_result(result):
+        if result.text == "first":  # fill the queue, then displace a bulk job from inside the callback
+            resubmitted.extend(manager.submit(t, priority=PRIORITY_BULK) for t in ("bulk one", "bulk two", "bulk three"))
+            resubmitted.append(manager.submit("prompt", priority=PRIORITY_INTERACTIVE))
+            done.set()
+
+    done = threading.Event()
+    manager = make_manager(max_queue=1, on_result=on_result)
+    manager.submit("first")
+    assert done.wait(timeout=3) and manager.wait_all(timeout=3)
+    assert resubmitted[-1].decision == "QUEUED"
+    assert [d.decision for d in manager.dropped] == ["DROPPED_PREEMPTED"]
+    assert [r.text for r in manager.results][-1] == "prompt"
+    manager.stop()
+
+
+def test_request_past_its_deadline_is_dropped_before_synthesis():
+    manager = make_manager(max_queue=3)
+    manager.submit("running")
+    late = manager.submit("late", deadline=0.001)
+    assert late.decision == "QUEUED"
+    assert late.future.result(timeout=3).reason == "DROPPED_DEADLINE"
+    assert [d.request_id for d in manager.dropped] == [late.request_id]
+    manager.stop()
+
+
+def test_results_are_delivered_in_submission_order():
+    manager = make_manager(max_concurrency=2)
+    slow = manager.submit("a much longer sentence than the next one")
+    fast = manager.submit("short")
+    manager.wait_all(timeout=5)
+    results = manager.results
+    assert [r.request_id for r in results] == [slow.request_id, fast.request_id]
+    assert results[1].completed_monotonic < results[0].completed_monotonic
+    manager.stop()
+
+
+def test_cancelled_queued_future_does_not_kill_workers():
+    manager = make_manager(max_queue=3)
+    d1 = manager.submit("first")
+    d2 = manager.submit("second")
+    assert d2.decision == "QUEUED"
+    assert d2.future.cancel()
+    assert manager.wait_all(timeout=3)
+    assert all(w.is_alive() for w in manager._workers)
+    d3 = manager.submit("third")
+    assert d3.future.result(timeout=3).success
+    assert [r.reason for r in manager.results] == ["OK", "CANCELLED", "OK"]
+    assert d1.future.result().success
+    manager.stop()
+
+
+def test_hint_skips_text_cached_in_output_format(monkeypatch, tmp_path):
+    from cli import tts_cache
+    from cli.audio_formats import get_format
+    cache = tts_cache.AudioCache(tmp_path, 1 << 20)
+    monkeypatch.setattr(tts_cache, "get_default_cache", lambda: cache)
+    manager = make_manager(output_format="mp3")
+    fmt = get_format("mp3")
+    cache.put(tts_cache.cache_key("cached", "stub", "stub", fmt.name), b"\x00" * 16, fmt.extension)
+    assert manager.hint(["cached", "fresh"]) == 1
+    manager.stop()
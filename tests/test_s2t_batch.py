@@ -0,0 +1,70 @@
+"""Batch input resolution and run_batch bookkeeping (recognition stubbed)."""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("numpy")  # s2t_preprocess
+pytest.importorskip("azure.cognitiveservices.speech")  # imported by s2t_cli_sdk
+
+from cli import s2t_batch  # noqa: E402
+from cli.audio_formats import get_format, wav_header  # noqa: E402
+from cli.endpoint_pool import EndpointPool  # noqa: E402
+from cli.s2t_cli_sdk import TranscriptSegment  # noqa: E402
+
+TICKS = 10_000_000
+
+
+def make_wav(path, seconds=0.5):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    size = int(seconds * 32000)
+    path.write_bytes(wav_header(get_format("riff-16khz-16bit-mono-pcm"), size) + bytes(size))
+    return path
+
+
+def test_collect_inputs_directory_glob_and_manifest(tmp_path):
+    audio = tmp_path / "audio"
+    for name in ("b.wav", "a.MP3", "c.flac", "notes.txt", "nested/d.wav"):
+        make_wav(audio / name)
+    assert [p.name for p in s2t_batch.collect_inputs(str(audio))] == ["a.MP3", "b.wav", "c.flac"]
+    assert [p.name for p in s2t_batch.collect_inputs(str(audio / "**" / "*.wav"))] == ["b.wav", "d.wav"]
+
+    manifest = tmp_path / "lists" / "batch.txt"
+    manifest.parent.mkdir()
+    manifest.write_text(f"# comment\n\n../audio/b.wav\n  {audio / 'c.flac'}  \n", encoding="utf-8")
+    assert s2t_batch.collect_inputs(str(manifest)) == [manifest.parent / "../audio/b.wav", audio / "c.flac"]
+    with pytest.raises(FileNotFoundError):
+        s2t_batch.collect_inputs(str(tmp_path / "missing"))
+
+
+def test_run_batch_keeps_input_order_and_records_failures(tmp_path, monkeypatch):
+    inputs = [make_wav(tmp_path / "in" / f"{name}.wav") for name in ("slow", "fast", "boom")]
+    inputs.append(make_wav(tmp_path / "other" / "fast.wav"))
+    inputs.append(tmp_path / "in" / "missing.wav")
+
+    def fake_transcribe(audio_path, host, *args, **kwargs):
+        if audio_path.stem == "boom":
+            raise ValueError("recognizer rejected the audio")
+        time.sleep(0.2 if audio_path.stem == "slow" else 0.01)
+        return [TranscriptSegment(f"{audio_path.stem} one", 0, TICKS), TranscriptSegment("two", TICKS, 2 * TICKS)]
+
+    monkeypatch.setattr(s2t_batch.s2t, "transcribe_continuous", fake_transcribe)
+    pool = EndpointPool(["http://a:5000", "http://b:5000"], probe=lambda host: True, probe_interval=60)
+    seen = []
+    summary = s2t_batch.run_batch(inputs, pool, tmp_path / "out", concurrency=3, on_item=seen.append, preprocess=False)
+
+    assert [i.audio_path for i in summary.items] == [str(p) for p in inputs]
+    assert sorted(i.audio_path for i in seen) == sorted(str(p) for p in inputs)
+    assert (summary.total_files, summary.succeeded, summary.failed) == (5, 3, 2)
+    assert summary.audio_seconds == pytest.approx(9.0)
+    assert [i.success for i in summary.items] == [True, True, False, True, False]
+    assert "rejected" in summary.items[2].error and "not found" in summary.items[4].error
+    assert [i.transcript_path.rsplit("/", 1)[-1] for i in summary.items if i.success] == ["slow.txt", "fast.txt", "fast_1.txt"]
+    assert (tmp_path / "out" / "slow.txt").read_text(encoding="utf-8") == "[00:00:00.000] slow one\n[00:00:01.000] two\n"
+    assert pool.healthy_hosts == pool.hosts  # a ValueError is the input's fault, not the replica's
+
+    written = json.loads((tmp_path / "out" / "summary.json").read_text(encoding="utf-8"))
+    assert written["succeeded"] == 3 and written["endpoints"] == pool.hosts
+    assert [f["audio_path"] for f in written["failures"]] == [str(inputs[2]), str(inputs[4])]
+    pool.close()
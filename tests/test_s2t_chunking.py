@@ -0,0 +1,41 @@
+"""VAD chunk planning for long recordings."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("azure.cognitiveservices.speech")  # imported by s2t_cli_sdk
+
+from cli.s2t_chunking import plan_chunks  # noqa: E402
+
+RATE = 16000
+
+
+def noise(seconds, amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * RATE)) * amplitude).astype(np.int16)
+
+
+def test_cuts_land_in_silence_and_cover_the_recording():
+    # 1.7 s phrases separated by 0.5 s pauses, 50 s in all
+    phrase = np.concatenate([noise(1.7, 8000), np.zeros(int(0.5 * RATE), dtype=np.int16)])
+    samples = np.tile(phrase, 23)[: 50 * RATE]
+    chunks = plan_chunks(samples, RATE, max_chunk_seconds=20.0, overlap_seconds=0.5)
+    assert len(chunks) == 3
+    for chunk in chunks[:-1]:
+        cut = chunk.keep_end_frame
+        assert 15 * RATE <= cut - chunk.keep_start_frame <= 20 * RATE
+        assert not samples[cut - 800:cut + 800].any()  # inside a pause
+    assert chunks[0].keep_start_frame == 0 and chunks[-1].keep_end_frame == len(samples)
+    assert all(a.keep_end_frame == b.keep_start_frame for a, b in zip(chunks, chunks[1:]))
+    assert chunks[1].start_frame == chunks[1].keep_start_frame - RATE // 2
+
+
+def test_cut_falls_back_to_quietest_run_without_silence():
+    # 10 s of silence sets the noise floor; the search window (15-20 s) is loud
+    # throughout except for a quieter, but not silent, dip at 17 s.
+    samples = np.concatenate([
+        np.zeros(10 * RATE, dtype=np.int16), noise(7, 8000), noise(0.5, 2000, seed=1), noise(12.5, 8000, seed=2),
+    ])
+    chunks = plan_chunks(samples, RATE, max_chunk_seconds=20.0)
+    cut = chunks[0].keep_end_frame / RATE
+    assert 17.0 <= cut <= 17.5
@@ -0,0 +1,93 @@
+"""Band-limited resampling to the 16 kHz recognizer rate, and prepare_audio's cache handling."""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli import s2t_preprocess  # noqa: E402
+from cli.s2t_preprocess import downmix, prepare_audio, resample  # noqa: E402
+from cli.tts_cache import AudioCache  # noqa: E402
+from cli.wav_assembly import read_wav_info  # noqa: E402
+from cli.wav_utils import WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_IEEE_FLOAT, parse_wav_header  # noqa: E402
+
+
+def tone(freq, rate, seconds=1.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * freq * t) * 10000).astype(np.float32)
+
+
+def peak_hz(samples, rate):
+    spectrum = np.abs(np.fft.rfft(samples))
+    return np.argmax(spectrum) * rate / len(samples)
+
+
+@pytest.mark.parametrize("rate", [44100, 48000, 8000])
+def test_resample_keeps_length_and_pitch(rate):
+    out = resample(tone(1000, rate), rate, 16000)
+    assert len(out) == 16000
+    assert peak_hz(out, 16000) == pytest.approx(1000, abs=2)
+
+
+def test_resample_filters_content_above_target_nyquist():
+    out = resample(tone(12000, 48000), 48000, 16000)
+    assert np.abs(out[200:-200]).max() < 200  # 12 kHz would alias to 4 kHz at full level
+
+
+def test_downmix_averages_channels():
+    stereo = np.array([1.0, 3.0, 5.0, 7.0], dtype=np.float32)
+    assert downmix(stereo, 2).tolist() == [2.0, 6.0]
+
+
+def write_wav(path, samples, rate, tag=1, sub_format=None):
+    """Mono WAV: 16-bit PCM, or 32-bit float when `tag` or the extensible `sub_format` says so."""
+    is_float = WAVE_FORMAT_IEEE_FLOAT in (tag, sub_format)
+    data = samples.astype("<f4").tobytes() if is_float else samples.astype("<i2").tobytes()
+    width = 4 if is_float else 2
+    fmt = struct.pack("<HHIIHH", tag, 1, rate, rate * width, width, width * 8)
+    if sub_format is not None:
+        guid = struct.pack("<H", sub_format) + bytes.fromhex("000000001000800000aa00389b71")
+        fmt += struct.pack("<HHI", 22, width * 8, 4) + guid
+    path.write_bytes(
+        b"RIFF" + struct.pack("<I", 12 + len(fmt) + 8 + len(data)) + b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(data)) + data
+    )
+    return path
+
+
+def test_extensible_float_subformat_is_decoded_as_float(tmp_path):
+    path = write_wav(tmp_path / "float.wav", tone(440, 48000) / 32768.0, 48000, WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_IEEE_FLOAT)
+    info = read_wav_info(path)
+    assert (info.audio_format, info.codec) == (WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_IEEE_FLOAT)
+    wav, _ = s2t_preprocess.convert(path)
+    out = np.frombuffer(wav, dtype="<i2", offset=parse_wav_header(wav).data_offset)
+    assert np.abs(out[200:-200]).max() == pytest.approx(10000, rel=0.02)
+
+
+def test_prepared_copy_outlives_cache_eviction(tmp_path):
+    cache = AudioCache(tmp_path / "cache", max_bytes=40000)  # room for one decoded second
+    first = write_wav(tmp_path / "a.wav", tone(440, 48000), 48000)
+    with prepare_audio(first, cache=cache) as prepared:
+        assert prepared.converted and not prepared.cached
+        cache.put("other", bytes(39000))  # another worker's decode evicts ours
+        assert cache.evictions == 1
+        assert read_wav_info(prepared.path).framerate == 16000
+    assert not prepared.path.exists()
+
+    with prepare_audio(first, cache=cache) as again:
+        assert not again.cached  # evicted above, so decoded afresh
+    with prepare_audio(first, cache=cache) as hit:
+        assert hit.cached and hit.path != cache.get(s2t_preprocess.source_digest(first))
+        cache.put("other", bytes(39000))
+        assert hit.path.exists()
+    assert not hit.path.exists()
+    assert not list((tmp_path / "cache").rglob(".*"))  # no private links left behind
+
+
+def test_missing_ffmpeg_is_reported_before_hashing(tmp_path, monkeypatch):
+    monkeypatch.setattr(s2t_preprocess.shutil, "which", lambda name: None)
+    monkeypatch.setattr(s2t_preprocess, "source_digest", lambda path: pytest.fail("hashed an undecodable input"))
+    mp3 = tmp_path / "talk.mp3"
+    mp3.write_bytes(b"ID3" + bytes(64))
+    assert prepare_audio(mp3, cache=AudioCache(tmp_path / "cache", 1 << 20)).reason == "FFMPEG_MISSING"
@@ -0,0 +1,104 @@
+"""Incremental transcript writers (JSONL, SRT, WebVTT, speaker turns)."""
+
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from cli.s2t_sinks import JsonlSink, SpeakerTranscriptSink, SrtSink, WebVttSink, fan_out, open_sinks
+
+TICKS = 10_000_000
+
+
+@dataclass
+class Segment:
+    """Stand-in for s2t_cli_sdk.TranscriptSegment (which needs the SDK to import)."""
+
+    text: str
+    offset_ticks: int
+    duration_ticks: int
+    speaker_id: Optional[str] = None
+
+    @property
+    def start_seconds(self):
+        return self.offset_ticks / TICKS
+
+    @property
+    def end_seconds(self):
+        return (self.offset_ticks + self.duration_ticks) / TICKS
+
+
+SEGMENTS = [
+    Segment("Hello there.", 0, int(1.5 * TICKS), "Guest-1"),
+    Segment("How are you?", int(1.5 * TICKS), TICKS, "Guest-1"),
+    Segment("Fine, thanks.", int(3661.25 * TICKS), 2 * TICKS, "Guest-2"),
+]
+
+
+def write_all(sink, segments=SEGMENTS):
+    with sink:
+        for segment in segments:
+            sink(segment)
+    return sink.path.read_text(encoding="utf-8")
+
+
+def test_jsonl_sink(tmp_path):
+    lines = write_all(JsonlSink(tmp_path / "t.jsonl")).splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["index"] for r in records] == [1, 2, 3]
+    assert records[2] == {
+        "index": 3, "start": 3661.25, "end": 3663.25, "speaker": "Guest-2", "text": "Fine, thanks.",
+        "offset_ticks": int(3661.25 * TICKS), "duration_ticks": 2 * TICKS,
+    }
+
+
+def test_jsonl_sink_flushes_each_segment(tmp_path):
+    sink = JsonlSink(tmp_path / "t.jsonl")
+    sink(SEGMENTS[0])
+    assert json.loads(sink.path.read_text(encoding="utf-8"))["text"] == "Hello there."
+    sink.close()
+
+
+def test_srt_sink(tmp_path):
+    text = write_all(SrtSink(tmp_path / "t.srt"), [SEGMENTS[0], Segment("No speaker.", int(3661.25 * TICKS), TICKS)])
+    assert text == (
+        "1\n00:00:00,000 --> 00:00:01,500\nGuest-1: Hello there.\n\n"
+        "2\n01:01:01,250 --> 01:01:02,250\nNo speaker.\n\n"
+    )
+
+
+def test_vtt_sink(tmp_path):
+    text = write_all(WebVttSink(tmp_path / "t.vtt"), SEGMENTS[:1])
+    assert text == "WEBVTT\n\n00:00:00.000 --> 00:00:01.500\n<v Guest-1>Hello there.\n\n"
+
+
+def test_speaker_sink_merges_turns_and_flushes_on_close(tmp_path):
+    sink = SpeakerTranscriptSink(tmp_path / "t.speakers.txt")
+    for segment in SEGMENTS:
+        sink(segment)
+    # The Guest-2 turn is still open; only the finished Guest-1 turn is on disk
+    assert sink.path.read_text(encoding="utf-8") == "[00:00:00.000 - 00:00:02.500] Guest-1: Hello there. How are you?\n"
+    sink.close()
+    assert sink.path.read_text(encoding="utf-8").splitlines()[1] == "[01:01:01.250 - 01:01:03.250] Guest-2: Fine, thanks."
+    sink.close()  # idempotent
+
+
+def test_open_sinks_parses_specs(tmp_path):
+    sinks = open_sinks(["srt", f"jsonl={tmp_path / 'custom.jsonl'}", "speakers"], tmp_path / "meeting")
+    assert [type(s) for s in sinks] == [SrtSink, JsonlSink, SpeakerTranscriptSink]
+    assert [s.path.name for s in sinks] == ["meeting.srt", "custom.jsonl", "meeting.speakers.txt"]
+    for sink in sinks:
+        sink.close()
+    with pytest.raises(ValueError, match="Unknown transcript format"):
+        open_sinks(["vtt", "docx"], tmp_path / "other")
+    assert (tmp_path / "other.vtt").read_text(encoding="utf-8") == "WEBVTT\n\n"  # opened sinks are closed on error
+
+
+def test_fan_out():
+    seen_a, seen_b = [], []
+    assert fan_out(None, None) is None
+    assert fan_out(None, seen_a.append) == seen_a.append
+    on_segment = fan_out(seen_a.append, None, seen_b.append)
+    on_segment(SEGMENTS[0])
+    assert seen_a == seen_b == [SEGMENTS[0]]
@@ -0,0 +1,99 @@
+"""Push-stream feeding: WAV header sniffing, follow/idle termination, feeder errors."""
+
+import io
+import struct
+
+import pytest
+
+pytest.importorskip("azure.cognitiveservices.speech")  # imported by s2t_cli_sdk
+
+from cli import s2t_stream  # noqa: E402
+from cli.s2t_stream import StreamFormat, feed_push_stream, parse_stream_format, read_wav_header  # noqa: E402
+
+
+class FakePushStream:
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    def close(self):
+        self.closed = True
+
+
+class GrowingReader:
+    """Returns each queued part once, then b"" (like a file nobody writes to any more)."""
+
+    def __init__(self, parts, error=None):
+        self.parts = list(parts)
+        self.error = error
+
+    def read(self, n):
+        if self.parts:
+            return self.parts.pop(0)
+        if self.error is not None:
+            raise self.error
+        return b""
+
+    def close(self):
+        pass
+
+
+def wav_bytes(pcm, rate=8000, channels=2, extra_chunk=b""):
+    fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * 2 * channels, 2 * channels, 16)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", 16) + fmt + extra_chunk + b"data" + struct.pack("<I", len(pcm)) + pcm
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def test_read_wav_header_strips_header_and_odd_chunks():
+    pcm = bytes(range(10))
+    reader = io.BytesIO(wav_bytes(pcm, extra_chunk=b"LIST" + struct.pack("<I", 3) + b"abc\x00"))
+    fmt, leftover = read_wav_header(reader)
+    assert (fmt.rate, fmt.bits, fmt.channels, leftover) == (8000, 16, 2, b"")
+    assert reader.read() == pcm
+
+
+def test_read_wav_header_returns_sniffed_bytes_for_raw_pcm():
+    reader = io.BytesIO(b"\x01\x02" * 10)
+    fmt, leftover = read_wav_header(reader)
+    assert fmt is None
+    assert leftover + reader.read() == b"\x01\x02" * 10
+
+
+def test_parse_stream_format():
+    assert parse_stream_format("8000:8:2") == StreamFormat(rate=8000, bits=8, channels=2)
+    assert StreamFormat().bytes_per_second == 32000
+    with pytest.raises(ValueError):
+        parse_stream_format("16000:16")
+
+
+def test_feed_push_stream_pushes_leftover_then_closes_at_eof():
+    stream = FakePushStream()
+    assert feed_push_stream(io.BytesIO(b"abcdefg"), stream, 3, leftover=b"XY") == 9
+    assert stream.writes == [b"XY", b"abc", b"def", b"g"]
+    assert stream.closed
+
+
+def test_feed_push_stream_follow_waits_for_idle(monkeypatch):
+    monkeypatch.setattr(s2t_stream, "FOLLOW_POLL_SECONDS", 0.01)
+    stream = FakePushStream()
+    reader = GrowingReader([b"a", b"", b"b"])  # a gap shorter than idle_seconds does not end the stream
+    assert feed_push_stream(reader, stream, 4, follow=True, idle_seconds=0.1) == 2
+    assert stream.writes == [b"a", b"b"] and stream.closed
+
+
+def test_feed_push_stream_closes_on_read_error():
+    stream = FakePushStream()
+    with pytest.raises(OSError):
+        feed_push_stream(GrowingReader([b"abc"], error=OSError("device gone")), stream, 4)
+    assert stream.closed
+
+
+def test_transcribe_stream_reraises_feeder_errors(monkeypatch):
+    reader = GrowingReader([b"\x00" * 12, b"\x00" * 64], error=OSError("device gone"))
+    monkeypatch.setattr(s2t_stream, "open_source", lambda source: reader)
+    monkeypatch.setattr(s2t_stream.s2t, "transcribe_continuous", lambda *a, **k: [])
+    with pytest.raises(OSError, match="device gone"):
+        s2t_stream.transcribe_stream("fake", "ws://mock", on_segment=None, on_partial=None)
@@ -0,0 +1,56 @@
+"""Header sniffing of STT inputs (WAV, FLAC, MP3)."""
+
+import struct
+
+import pytest
+
+from cli.audio_formats import get_format, wav_header
+from cli.s2t_validate import AudioValidationError, probe_audio
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def test_probe_wav(tmp_path):
+    path = write(tmp_path, "a.wav", wav_header(get_format("riff-16khz-16bit-mono-pcm"), 32000) + b"\x00" * 32000)
+    probe = probe_audio(path)
+    assert (probe.container, probe.codec, probe.sample_rate, probe.channels, probe.bits_per_sample) == ("wav", "pcm", 16000, 1, 16)
+    assert probe.duration_seconds == pytest.approx(1.0)
+
+
+def test_probe_wav_accepts_other_codecs(tmp_path):
+    mulaw = struct.pack("<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + 8000, b"WAVE", b"fmt ", 16, 7, 1, 8000, 8000, 1, 8, b"data", 8000)
+    probe = probe_audio(write(tmp_path, "a.wav", mulaw + bytes(8000)))
+    assert (probe.codec, probe.sample_rate, probe.channels, probe.bits_per_sample) == ("0x0007", 8000, 1, 8)
+    bad = struct.pack("<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + 8000, b"WAVE", b"fmt ", 16, 7, 0, 8000, 8000, 1, 8, b"data", 8000)
+    with pytest.raises(AudioValidationError, match="Invalid WAV format"):
+        probe_audio(write(tmp_path, "b.wav", bad + bytes(8000)))
+
+
+def test_probe_flac_streaminfo(tmp_path):
+    packed = (44100 << 44) | (1 << 41) | (15 << 36) | 88200  # stereo, 16-bit, 2 s
+    streaminfo = struct.pack(">HH", 4096, 4096) + bytes(6) + packed.to_bytes(8, "big") + bytes(16)
+    path = write(tmp_path, "a.flac", b"fLaC" + bytes([0x80]) + (34).to_bytes(3, "big") + streaminfo)
+    probe = probe_audio(path)
+    assert (probe.container, probe.sample_rate, probe.channels, probe.bits_per_sample) == ("flac", 44100, 2, 16)
+    assert probe.duration_seconds == pytest.approx(2.0)
+
+
+def test_probe_mp3_frames(tmp_path):
+    frame = b"\xff\xfb\x90\x00" + bytes(413)  # MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417 bytes
+    path = write(tmp_path, "a.mp3", frame * 10)
+    probe = probe_audio(path)
+    assert (probe.container, probe.codec, probe.sample_rate, probe.bitrate_kbps) == ("mp3", "mp3", 44100, 128)
+
+
+def test_probe_rejects_mislabeled_and_truncated_files(tmp_path):
+    wav = wav_header(get_format("riff-16khz-16bit-mono-pcm"), 32000) + b"\x00" * 32000
+    with pytest.raises(AudioValidationError, match="named"):
+        probe_audio(write(tmp_path, "a.mp3", wav))
+    with pytest.raises(AudioValidationError, match="Truncated"):
+        probe_audio(write(tmp_path, "b.wav", wav[:1000]))
+    with pytest.raises(AudioValidationError, match="Unrecognized"):
+        probe_audio(write(tmp_path, "c.wav", b"not audio at all"))
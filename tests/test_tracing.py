@@ -0,0 +1,69 @@
+"""Span timing, parenting, and the Prometheus / OTLP JSON renderings."""
+
+import json
+
+import pytest
+
+from cli.tracing import Exporter, OtlpJsonExporter, PrometheusExporter, Tracer, get_exporter
+
+
+def test_spans_time_stages_and_nest():
+    tracer = Tracer(buckets=(10, 100))
+    with tracer.span("outer", voice="jenny") as outer:
+        inner = tracer.record("inner", 1.0, 1.05, error="boom")
+    assert inner.parent_id == outer.span_id and inner.trace_id == outer.trace_id
+    assert inner.duration_ms == pytest.approx(50.0)
+    assert outer.end >= outer.start and outer.attributes == {"voice": "jenny"}
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("bad")
+    assert [s.name for s in tracer.spans()] == ["inner", "outer", "failing"]
+    assert tracer.spans()[2].error == "ValueError: bad"
+    assert tracer.histograms()["inner"].counts == [0, 1, 0]
+
+
+def test_disabled_tracer_is_a_no_op():
+    tracer = Tracer(enabled=False)
+    with tracer.span("x") as span:
+        assert span is None
+    assert tracer.record("y", 0.0, 1.0) is None and tracer.spans() == []
+
+
+def test_prometheus_render():
+    tracer = Tracer(buckets=(10, 100))
+    tracer.record("tts.first_byte", 0.0, 0.005)
+    tracer.record("tts.first_byte", 0.0, 0.050, error="late")
+    tracer.record("tts.first_byte", 0.0, 0.500)
+    text = PrometheusExporter().render(tracer)
+    assert "# TYPE speech_stage_duration_ms histogram" in text
+    for line in (
+        'speech_stage_duration_ms_bucket{stage="tts.first_byte",le="10"} 1',
+        'speech_stage_duration_ms_bucket{stage="tts.first_byte",le="100"} 2',
+        'speech_stage_duration_ms_bucket{stage="tts.first_byte",le="+Inf"} 3',
+        'speech_stage_duration_ms_sum{stage="tts.first_byte"} 555.000',
+        'speech_stage_duration_ms_count{stage="tts.first_byte"} 3',
+        'speech_stage_errors_total{stage="tts.first_byte"} 1',
+    ):
+        assert line in text.splitlines()
+
+
+def test_otlp_json_render(tmp_path):
+    tracer = Tracer()
+    with tracer.span("queue.request", chars=5, cached=False):
+        tracer.record("queue.wait", 2.0, 2.5, error="timeout")
+    path = get_exporter("otlp-json").write(tracer, tmp_path / "trace.json")
+    doc = json.loads(path.read_text(encoding="utf-8"))
+    scope = doc["resourceSpans"][0]["scopeSpans"][0]
+    wait, request = scope["spans"]
+    assert request["attributes"] == [{"key": "chars", "value": {"intValue": "5"}}, {"key": "cached", "value": {"boolValue": False}}]
+    assert request["status"] == {"code": 1} and "parentSpanId" not in request
+    assert wait["parentSpanId"] == request["spanId"] and wait["status"] == {"code": 2, "message": "timeout"}
+    assert int(wait["endTimeUnixNano"]) - int(wait["startTimeUnixNano"]) == pytest.approx(5e8, abs=1e3)
+
+
+def test_exporter_is_abstract():
+    with pytest.raises(TypeError):
+        Exporter()
+    with pytest.raises(ValueError):
+        get_exporter("zipkin")
+    assert isinstance(get_exporter("prometheus"), PrometheusExporter) and OtlpJsonExporter().content_type == "application/json"
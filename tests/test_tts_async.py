@@ -0,0 +1,135 @@
+"""AsyncQueueManager scheduling with a stubbed async synthesizer (no SDK, no container)."""
+
+import asyncio
+
+import pytest
+
+from cli import tracing, tts_async, tts_cache, tts_synth
+from cli.queue_manager import PRIORITY_BULK, PRIORITY_INTERACTIVE
+from cli.tts_async import AsyncQueueManager
+
+REAL_SYNTHESIZE = tts_async.synthesize
+in_flight = {"now": 0, "peak": 0}
+
+
+async def fake_synthesize(text, host=None, voice=None, in_memory=False, **_ignored):
+    """Stand-in for tts_async.synthesize: 5 ms per character, at least 50 ms."""
+    in_flight["now"] += 1
+    in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+    try:
+        await asyncio.sleep(max(0.05, 0.005 * len(text)))
+    finally:
+        in_flight["now"] -= 1
+    return tts_synth.SynthesisResult(text=text, success=True, reason="OK", latency_ms=10, voice=voice or "stub", host=host or "stub")
+
+
+@pytest.fixture(autouse=True)
+def _stub_synthesis(monkeypatch):
+    monkeypatch.setenv("TTS_CACHE_MAX_MB", "0")
+    monkeypatch.setattr(tts_async, "synthesize", fake_synthesize)
+    in_flight.update(now=0, peak=0)
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+def test_concurrent_requests_are_delivered_in_submission_order():
+    async def scenario():
+        delivered = []
+        async with AsyncQueueManager("stub", "stub", max_queue=3, max_concurrency=2, on_result=delivered.append) as manager:
+            decisions = [manager.submit(text) for text in ("a much longer first phrase here", "b", "c", "d")]
+            assert [d.decision for d in decisions] == ["ACTIVE_STARTED", "ACTIVE_STARTED", "QUEUED", "QUEUED"]
+            assert await manager.wait_all(timeout=3)
+        return decisions, delivered
+
+    decisions, delivered = run(scenario())
+    assert [r.text for r in delivered] == ["a much longer first phrase here", "b", "c", "d"]
+    assert all(r.success for r in delivered) and in_flight["peak"] == 2
+    assert decisions[1].future.result().completed_monotonic < decisions[0].future.result().completed_monotonic
+
+
+def test_queue_bound_rejects_submit_and_backpressures_put():
+    async def scenario():
+        async with AsyncQueueManager("stub", "stub", max_queue=1) as manager:
+            assert [manager.submit(t).decision for t in ("a", "b", "c")] == ["ACTIVE_STARTED", "QUEUED", "REJECTED_QUEUE_FULL"]
+            put = asyncio.ensure_future(manager.put("d"))
+            await asyncio.sleep(0.02)
+            assert not put.done()  # waits for room instead of rejecting
+            result = await (await put)
+            assert result.success and [r.text for r in manager.results] == ["a", "b", "d"]
+
+    run(scenario())
+
+
+def test_priority_deadline_and_preemption():
+    async def scenario():
+        async with AsyncQueueManager("stub", "stub", max_queue=2) as manager:
+            manager.submit("running")
+            late = manager.submit("late", deadline=0.01)
+            bulk = manager.submit("bulk job", priority=PRIORITY_BULK)
+            prompt = manager.submit("prompt", priority=PRIORITY_INTERACTIVE)  # queue full: displaces the bulk job
+            assert await manager.wait_all(timeout=3)
+            return late, bulk, prompt, manager.dropped
+
+    late, bulk, prompt, dropped = run(scenario())
+    assert prompt.decision == "QUEUED" and prompt.future.result().success
+    assert bulk.future.result().reason == "DROPPED_PREEMPTED"
+    assert late.future.result().reason == "DROPPED_DEADLINE"
+    assert [d.decision for d in dropped] == ["DROPPED_PREEMPTED", "DROPPED_DEADLINE"]
+
+
+def test_close_cancels_work_and_wait_all_returns():
+    async def scenario():
+        manager = AsyncQueueManager("stub", "stub", max_queue=3)
+        decisions = [manager.submit(t) for t in ("running", "queued one", "queued two")]
+        await asyncio.sleep(0.01)
+        await manager.close()
+        assert await manager.wait_all(timeout=0.5)
+        assert manager.submit("late").decision == "REJECTED_STOPPED"
+        with pytest.raises(RuntimeError):
+            await manager.put("late")
+        return decisions, manager.results
+
+    decisions, results = run(scenario())
+    assert all(d.future.cancelled() for d in decisions)
+    assert [(r.text, r.reason) for r in results] == [("running", "CANCELLED"), ("queued one", "CANCELLED"), ("queued two", "CANCELLED")]
+
+
+def test_hint_speculates_while_idle_and_yields_to_real_work(monkeypatch):
+    class NoCache:
+        def contains(self, key):
+            return False
+
+    monkeypatch.setattr(tts_cache, "get_default_cache", lambda: NoCache())
+
+    async def scenario():
+        async with AsyncQueueManager("stub", "stub") as manager:
+            assert manager.hint(["a speculative phrase that takes a while"]) == 1
+            await asyncio.sleep(0.01)
+            assert manager.submit("real").decision == "ACTIVE_STARTED"
+            assert await manager.wait_all(timeout=3)
+            await asyncio.sleep(0.4)  # speculation resumes once the queue is idle
+            return manager.hints_cancelled, manager.hints_completed
+
+    assert run(scenario()) == (1, 1)
+
+
+def test_requests_are_traced_through_synthesis(monkeypatch):
+    # The real synthesize: with no SDK it returns SDK_MISSING inside its span
+    monkeypatch.setattr(tts_async, "synthesize", REAL_SYNTHESIZE)
+    monkeypatch.setattr(tts_synth, "speechsdk", None)
+    tracer = tracing.Tracer()
+    monkeypatch.setattr(tracing, "_default_tracer", tracer)
+
+    async def scenario():
+        async with AsyncQueueManager("stub", "stub") as manager:
+            decision = manager.submit("hello")
+            return await decision.future
+
+    assert run(scenario()).reason == "SDK_MISSING"
+    spans = {s.name: s for s in tracer.spans()}
+    assert {"queue.request", "queue.wait", "queue.execute", "tts.synthesize"} <= set(spans)
+    assert spans["tts.synthesize"].parent_id == spans["queue.execute"].span_id
+    assert spans["queue.execute"].parent_id == spans["queue.request"].span_id
+    assert spans["tts.synthesize"].attributes["reason"] == "SDK_MISSING"
@@ -0,0 +1,30 @@
+"""AudioCache keys and eviction (no SDK needed)."""
+
+from cli import tts_cache
+
+
+def test_put_evicts_least_recently_used(tmp_path):
+    cache = tts_cache.AudioCache(tmp_path, max_bytes=250)
+    cache.put("aa01", b"a" * 100)
+    cache.put("bb02", b"b" * 100)
+    assert cache.get("aa01") is not None  # refresh: bb02 is now the oldest
+    cache.put("cc03", b"c" * 100)
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") is not None and cache.get("cc03") is not None
+    stats = cache.stats()
+    assert (stats["evictions"], stats["entries"], stats["bytes"]) == (1, 2, 200)
+
+
+def test_index_survives_reopen(tmp_path):
+    tts_cache.AudioCache(tmp_path, max_bytes=1000).put("dd04", b"d" * 10)
+    reopened = tts_cache.AudioCache(tmp_path, max_bytes=1000)
+    assert reopened.get("dd04").read_bytes() == b"d" * 10
+
+
+def test_pool_identity_ignores_replica_order(monkeypatch):
+    monkeypatch.delenv("TTS_MODEL_VERSION", raising=False)
+    a = tts_cache.pool_identity(["http://b:5000", "http://a:5000"])
+    b = tts_cache.pool_identity(["http://a:5000", "http://b:5000"])
+    assert a == b
+    assert tts_cache.cache_key("hi", "v", a) == tts_cache.cache_key("hi", "v", b)
+    assert tts_cache.cache_key("hi", "v", a) != tts_cache.cache_key("hi", "v", "http://a:5000")
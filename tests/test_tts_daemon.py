@@ -0,0 +1,50 @@
+"""TTSDaemon request validation (rejected before anything is queued)."""
+
+import pytest
+
+from cli.tts_daemon import TTSDaemon
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    monkeypatch.setenv("TTS_CACHE_MAX_MB", "0")
+    d = TTSDaemon("http://127.0.0.1:9", "en-US-JennyNeural")
+    yield d
+    d.close(timeout=1)
+
+
+@pytest.mark.parametrize("request_body", [
+    {"text": "hi", "deadline_ms": "soon"},
+    {"text": "hi", "deadline_ms": -5},
+    {"text": "hi", "deadline_ms": True},
+    {"text": ["hi"]},
+    {"text": "hi", "priority": "urgent"},
+])
+def test_submit_rejects_malformed_requests(daemon, request_body):
+    status, meta, audio = daemon.submit(request_body)
+    assert status == 400 and "error" in meta and audio is None
+    assert daemon.requests == 0
+
+
+def test_serve_refuses_to_replace_a_regular_file(daemon, tmp_path):
+    from cli.tts_daemon import serve
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        serve(daemon, None, str(path))
+    assert path.read_text() == "keep me"
+
+
+def test_serve_closes_bound_servers_when_a_later_bind_fails(daemon, tmp_path, monkeypatch):
+    from cli import tts_daemon
+    closed = []
+
+    class RecordingServer(tts_daemon._TCPServer):
+        def server_close(self):
+            closed.append(self.server_address)
+            super().server_close()
+
+    monkeypatch.setattr(tts_daemon, "_TCPServer", RecordingServer)
+    with pytest.raises(OSError):
+        tts_daemon.serve(daemon, "127.0.0.1:0", str(tmp_path / "missing-dir" / "tts.sock"))
+    assert len(closed) == 1
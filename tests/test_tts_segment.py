@@ -0,0 +1,55 @@
+"""Sentence/clause segmentation for pipelined synthesis."""
+
+import io
+import wave
+
+import pytest
+
+from cli import tts_segment, tts_synth
+from cli.tts_segment import split_text
+
+
+def make_wav(framerate, nframes):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(framerate)
+        wf.writeframes(bytes(2 * nframes))
+    return buf.getvalue()
+
+
+def test_split_text_keeps_sentences_whole():
+    assert split_text("Hello there.  How are you?\nFine!", max_chars=40, first_max_chars=40) == ["Hello there.", "How are you?", "Fine!"]
+
+
+def test_split_text_limits_first_segment_and_long_sentences():
+    text = "This opening sentence is long, so the head is cut early. " + "word " * 30
+    segments = split_text(text, max_chars=40, first_max_chars=20)
+    assert len(segments[0]) <= 20
+    assert all(len(s) <= 40 for s in segments)
+    assert " ".join(segments).split() == text.split()
+
+
+def test_split_text_rejects_bad_limits():
+    assert split_text("   ") == []
+    with pytest.raises(ValueError):
+        split_text("hi", max_chars=0)
+
+
+def test_synthesize_pipelined_uses_output_format(monkeypatch):
+    formats = []
+
+    def fake_synthesize(text, host=None, voice=None, output_format=None, **_ignored):
+        formats.append(output_format)
+        return tts_synth.SynthesisResult(text=text, success=True, reason="OK", latency_ms=1, audio_data=make_wav(24000, 100), output_format=output_format)
+
+    monkeypatch.setattr(tts_synth, "synthesize", fake_synthesize)
+    result = tts_segment.synthesize_pipelined("One. Two. Three.", in_memory=True, max_chars=10, first_max_chars=10, output_format="riff-24khz-16bit-mono-pcm")
+    assert result.success and result.frames == 300
+    assert formats == ["riff-24khz-16bit-mono-pcm"] * 3
+    assert result.output_format == "riff-24khz-16bit-mono-pcm"
+    with wave.open(io.BytesIO(result.audio_data)) as wf:
+        assert wf.getframerate() == 24000
+    with pytest.raises(ValueError):
+        tts_segment.synthesize_pipelined("Hi.", output_format="ogg-16khz-16bit-mono-opus")
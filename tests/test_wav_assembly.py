@@ -0,0 +1,73 @@
+"""Header-only WAV parsing and PCM segment assembly."""
+
+import struct
+
+import pytest
+
+from cli.wav_assembly import WavAssembler, WavLayoutError, assemble, read_wav_info, wav_duration_seconds
+from cli.wav_utils import pcm_view
+
+
+def make_wav(pcm: bytes, rate: int = 24000) -> bytes:
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + len(pcm), b"WAVE", b"fmt ", 16, 1, 1,
+        rate, rate * 2, 2, 16, b"data", len(pcm),
+    ) + pcm
+
+
+def test_read_wav_info_from_header(tmp_path):
+    path = tmp_path / "a.wav"
+    path.write_bytes(make_wav(b"\x00" * 4800))
+    info = read_wav_info(path)
+    assert (info.channels, info.sampwidth, info.framerate, info.data_offset, info.nframes) == (1, 2, 24000, 44, 2400)
+    assert wav_duration_seconds(path) == pytest.approx(0.1)
+    assert wav_duration_seconds(tmp_path / "missing.wav") is None
+
+
+def test_assembler_concatenates_files_and_buffers(tmp_path):
+    first = tmp_path / "first.wav"
+    first.write_bytes(make_wav(b"\x01\x00" * 100))
+    out = tmp_path / "out.wav"
+    with WavAssembler(out) as asm:
+        asm.add_file(first, text="one")
+        asm.add_buffer(make_wav(b"\x02\x00" * 50), text="two")
+    data = out.read_bytes()
+    assert bytes(pcm_view(data)) == b"\x01\x00" * 100 + b"\x02\x00" * 50
+    assert read_wav_info(out).framerate == 24000
+    assert [(s.start_frame, s.end_frame) for s in asm.segments] == [(0, 100), (100, 150)]
+    assert asm.segments[1].as_dict()["text"] == "two"
+
+
+def test_assemble_helper_and_mixed_layouts(tmp_path):
+    segments = assemble([make_wav(b"\x00" * 20), make_wav(b"\x00" * 40)], tmp_path / "joined.wav")
+    assert [s.frames for s in segments] == [10, 20]
+    with WavAssembler(tmp_path / "out.wav") as asm:
+        asm.add_buffer(make_wav(b"\x00" * 20))
+        with pytest.raises(WavLayoutError):
+            asm.add_buffer(make_wav(b"\x00" * 20, rate=16000))
+
+
+def test_read_wav_info_rejects_short_fmt_chunk(tmp_path):
+    path = tmp_path / "short-fmt.wav"
+    wav = bytearray(make_wav(b"\x00" * 8))
+    struct.pack_into("<I", wav, 16, 12)  # fmt declares 12 bytes
+    path.write_bytes(bytes(wav))
+    with pytest.raises(ValueError, match="at least 16"):
+        read_wav_info(path)
+
+
+def test_extensible_float_segment_is_not_concatenated_as_pcm(tmp_path):
+    guid = struct.pack("<H", 3) + bytes.fromhex("000000001000800000aa00389b71")
+    fmt = struct.pack("<HHIIHHHHI", 0xFFFE, 1, 24000, 96000, 4, 32, 22, 32, 4) + guid
+    wav = b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + 8) + b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    with WavAssembler(tmp_path / "out.wav") as asm:
+        with pytest.raises(ValueError, match="Only PCM"):
+            asm.add_buffer(wav + b"data" + struct.pack("<I", 8) + bytes(8))
+
+
+@pytest.mark.parametrize("cut", [20, 30, 40])
+def test_read_wav_info_rejects_truncated_headers(tmp_path, cut):
+    path = tmp_path / "short.wav"
+    path.write_bytes(make_wav(b"\x00" * 64)[:cut])
+    with pytest.raises(ValueError):
+        read_wav_info(path)
@@ -0,0 +1,57 @@
+"""In-memory WAV header parsing."""
+
+import struct
+
+import pytest
+
+from cli.wav_utils import parse_wav_header, pcm_view
+
+
+def make_wav(pcm: bytes, rate: int = 24000, channels: int = 1) -> bytes:
+    block = channels * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + len(pcm), b"WAVE", b"fmt ", 16, 1, channels,
+        rate, rate * block, block, 16, b"data", len(pcm),
+    ) + pcm
+
+
+def test_parse_wav_header_reads_layout():
+    info = parse_wav_header(make_wav(b"\x01\x00" * 480))
+    assert (info.channels, info.sampwidth, info.framerate, info.nframes) == (1, 2, 24000, 480)
+    assert info.duration_seconds == pytest.approx(0.02)
+
+
+def test_pcm_view_skips_header_and_list_chunks():
+    pcm = b"\x01\x00\x02\x00"
+    wav = make_wav(pcm)
+    with_list = wav[:12] + b"LIST" + struct.pack("<I", 4) + b"INFO" + wav[12:]
+    assert bytes(pcm_view(wav)) == pcm
+    assert bytes(pcm_view(with_list)) == pcm
+
+
+def test_parse_wav_header_rejects_non_wav():
+    with pytest.raises(ValueError):
+        parse_wav_header(b"ID3\x04" + bytes(40))
+
+
+@pytest.mark.parametrize("cut", [8, 20, 30, 40])
+def test_parse_wav_header_rejects_truncated_buffers(cut):
+    with pytest.raises(ValueError):
+        parse_wav_header(make_wav(b"\x00" * 64)[:cut])
+
+
+def test_parse_wav_header_rejects_short_fmt_chunk():
+    # A 14-byte fmt chunk (no bits-per-sample) followed by a data chunk
+    fmt = struct.pack("<HHIIH", 1, 1, 24000, 48000, 2)
+    wav = b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + 4) + b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    wav += b"data" + struct.pack("<I", 4) + bytes(4)
+    with pytest.raises(ValueError, match="at least 16"):
+        parse_wav_header(wav)
+
+
+def test_parse_wav_header_reads_extensible_subformat():
+    guid_tail = bytes.fromhex("000000001000800000aa00389b71")
+    fmt = struct.pack("<HHIIHHHHI", 0xFFFE, 1, 24000, 96000, 4, 32, 22, 32, 4) + struct.pack("<H", 3) + guid_tail
+    wav = b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + 8) + b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    info = parse_wav_header(wav + b"data" + struct.pack("<I", 8) + bytes(8))
+    assert (info.audio_format, info.sub_format, info.codec, info.nframes) == (0xFFFE, 3, 3, 2)